@@ -0,0 +1,83 @@
+"""
+Measures the cost of importing a generated module which declares many stricti,
+with the schema built at class creation and with Meta.defer_schema.
+
+Each import runs in a fresh interpreter so that nothing is cached between runs.
+
+    python -m benchmarks.bench_import
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+_PROBE = """
+import importlib, sys, time
+sys.path.insert(0, {path!r})
+import strictus.core
+started = time.perf_counter()
+module = importlib.import_module("models")
+imported = time.perf_counter()
+module.Model0({{"id": 1, "name": "first"}})
+print(imported - started, time.perf_counter() - imported)
+"""
+
+
+def generate_module(n_models: int, defer_schema: bool) -> str:
+    """
+    Returns source of a module with n_models stricti, each of which has a few primitive
+    fields and a list of, and a reference to, the previous model.
+    """
+    lines = [
+        "from typing import Dict, List",
+        "",
+        "from strictus.core import strictus, strictus_field",
+        "",
+        "",
+        "class Base(strictus):",
+        "    class Meta:",
+        f"        defer_schema = {defer_schema}",
+        "",
+    ]
+    for i in range(n_models):
+        lines.extend([
+            "",
+            f"class Model{i}(Base):",
+            "    id: int",
+            "    name: str = None",
+            "    price: float = 0.0",
+            "    active: bool = True",
+            "    tags: Dict[str, str] = strictus_field(default_factory=dict)",
+        ])
+        if i:
+            lines.extend([
+                f"    previous: Model{i - 1} = None",
+                f"    children: List[Model{i - 1}] = strictus_field(default_factory=list)",
+            ])
+        lines.append("")
+    return "\n".join(lines)
+
+
+def measure(n_models: int, defer_schema: bool, repeat: int):
+    with tempfile.TemporaryDirectory() as path:
+        with open(os.path.join(path, "models.py"), "w") as f:
+            f.write(generate_module(n_models, defer_schema))
+        env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.getcwd(), env.get("PYTHONPATH")]))
+        results = []
+        for _ in range(repeat):
+            output = subprocess.check_output([sys.executable, "-c", _PROBE.format(path=path)], env=env)
+            results.append(tuple(float(x) for x in output.split()))
+        return min(results)
+
+
+def main(n_models_options=(100, 800), repeat: int = 5):
+    for n_models in n_models_options:
+        for defer_schema in (False, True):
+            import_time, first_use_time = measure(n_models, defer_schema, repeat)
+            label = f"{n_models} models, defer_schema={defer_schema}"
+            print(f"{label:<35} import {import_time * 1e3:8.2f} ms, first instance {first_use_time * 1e3:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
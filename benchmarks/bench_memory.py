@@ -0,0 +1,151 @@
+"""
+Measures with tracemalloc the memory allocated when loading N records as stricti, one by one
+through strictus.__new__, in bulk through parse_list and into a StrictusFrame, with dataclasses
+and the raw dicts themselves as reference points, and when loading catalog records, which repeat
+enum-like strings, with and without interning. Also prints the memory_report of a single record.
+
+    python -m benchmarks.bench_memory
+"""
+import dataclasses
+import gc
+import json
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from strictus.core import get_schema, parse_list, strictus, strictus_field
+from strictus.frame import StrictusFrame
+from strictus.memory import memory_report
+
+
+class Item(strictus):
+    id: int
+    sku: str
+    price: float = 0.0
+    active: bool = True
+
+
+class SlottedItem(strictus):
+    __slots__ = ()
+
+    class Meta:
+        slots = True
+
+    id: int
+    sku: str
+    price: float = 0.0
+    active: bool = True
+
+
+class Order(strictus):
+    items: List[Item] = strictus_field(default_factory=list)
+
+
+class SlottedOrder(strictus):
+    items: List[SlottedItem] = strictus_field(default_factory=list)
+
+
+# Catalog records
+
+class CatalogItem(strictus):
+    class Meta:
+        additional_attributes = True
+
+    id: int
+    status: str
+    country: str
+    currency: str
+    prices: Dict[str, float] = None
+
+
+class InternedCatalogItem(strictus):
+    class Meta:
+        additional_attributes = True
+        intern = True
+
+    id: int
+    status: str
+    country: str
+    currency: str
+    prices: Dict[str, float] = None
+
+
+@dataclasses.dataclass
+class ItemDC:
+    id: int
+    sku: str
+    price: float = 0.0
+    active: bool = True
+
+
+def trace(func: Callable[[], Any]) -> Tuple[int, int]:
+    """
+    Returns the memory still allocated when func returns, while its result is alive,
+    and the peak memory allocated during the call, in bytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return current, peak
+
+
+def main(n_records: int = 100000):
+    # Each record has its own strings, as if they had been decoded from JSON
+    def load_raw():
+        return [{"id": i, "sku": f"SKU-{i}", "price": i / 100} for i in range(n_records)]
+
+    # Strings that repeat across records are separate objects, as they are when decoded from JSON
+    catalog_json = [
+        json.dumps({
+            "id": i,
+            "status": ("ACTIVE", "INACTIVE", "PENDING")[i % 3],
+            "country": ("EE", "FI", "LV", "LT", "SE")[i % 5],
+            "currency": "EUR",
+            "prices": {"retail": 1.5, "wholesale": 1.0},
+            "warehouse": ("north", "south")[i % 2],
+        })
+        for i in range(n_records)
+    ]
+
+    def load_catalog():
+        return [json.loads(line) for line in catalog_json]
+
+    items_field = get_schema(Order)["items"]
+    slotted_items_field = get_schema(SlottedOrder)["items"]
+
+    scenarios = {
+        "raw dicts": load_raw,
+        "Item(raw) for each record": lambda: [Item(raw) for raw in load_raw()],
+        "parse_list(Order.items, raw)": lambda: parse_list(items_field, load_raw()),
+        "SlottedItem(raw) for each record": lambda: [SlottedItem(raw) for raw in load_raw()],
+        "parse_list(SlottedOrder.items, raw)": lambda: parse_list(slotted_items_field, load_raw()),
+        "StrictusFrame[Item](raw)": lambda: StrictusFrame[Item](load_raw()),
+        "ItemDC(**raw) for each record": lambda: [ItemDC(**raw) for raw in load_raw()],
+        "catalog: raw dicts": load_catalog,
+        "catalog: CatalogItem.parse_many": lambda: CatalogItem.parse_many(load_catalog()),
+        "catalog: InternedCatalogItem.parse_many": lambda: InternedCatalogItem.parse_many(load_catalog()),
+    }
+
+    # Generate the initialisers outside of the traced calls
+    Item(id=0, sku="")
+    SlottedItem(id=0, sku="")
+    CatalogItem.parse_many(load_catalog()[:1])
+    InternedCatalogItem.parse_many(load_catalog()[:1])
+
+    print(f"{n_records} records")
+    print(f"{'scenario':<40} {'retained':>12} {'per record':>12} {'peak':>12}")
+    for name, func in scenarios.items():
+        current, peak = trace(func)
+        print(f"{name:<40} {current / 1e6:10.2f}MB {current / n_records:11.0f}B {peak / 1e6:10.2f}MB")
+
+    print()
+    for instance in (Item(id=12345, sku="SKU-12345", price=1.5), SlottedItem(id=12345, sku="SKU-12345", price=1.5)):
+        print(memory_report(instance).to_dict())
+
+
+if __name__ == "__main__":
+    main()
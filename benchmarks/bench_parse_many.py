@@ -0,0 +1,60 @@
+"""
+Compares creating stricti one by one with creating them in bulk with parse_many,
+both directly and through a List[Item] field, and in worker processes, one per CPU,
+for flat items and for orders of 10 nested items.
+
+    python -m benchmarks.bench_parse_many
+
+Whatever the number of CPUs, the calling process of parse_many(workers=...) unpickles and loads
+the states of all instances, so parallel parsing can't be faster than that. The "receive" lines
+measure this cost, which has to be below the one of serial parsing for workers to pay off.
+"""
+import os
+import pickle
+import timeit
+from typing import List
+
+from strictus import parallel
+from strictus.core import strictus, strictus_field
+
+
+class Item(strictus):
+    id: int
+    sku: str
+    price: float = 0.0
+    active: bool = True
+
+
+class Order(strictus):
+    items: List[Item] = strictus_field(default_factory=list)
+
+
+def main(n_items: int = 100000, repeat: int = 5):
+    raw_items = [{"id": i, "sku": f"SKU-{i}", "price": i / 100} for i in range(n_items)]
+    raw_orders = [{"items": raw_items[i:i + 10]} for i in range(0, n_items, 10)]
+    items = Item.parse_many(raw_items)
+    # What worker processes send back
+    item_states = pickle.dumps(parallel._parse_chunk(raw_items, Item, False), protocol=pickle.HIGHEST_PROTOCOL)
+    order_states = pickle.dumps(parallel._parse_chunk(raw_orders, Order, False), protocol=pickle.HIGHEST_PROTOCOL)
+    workers = os.cpu_count()
+
+    scenarios = {
+        "Item(raw) for each item": lambda: [Item(raw_item) for raw_item in raw_items],
+        "Item.parse_many(items)": lambda: Item.parse_many(raw_items),
+        f"Item.parse_many(items, workers={workers})": lambda: Item.parse_many(raw_items, workers=workers),
+        "receive items": lambda: Item._strictus_state_loader(pickle.loads(item_states)),
+        "Order(items=items)": lambda: Order(items=raw_items),
+        "Order.parse_many(orders)": lambda: Order.parse_many(raw_orders),
+        f"Order.parse_many(orders, workers={workers})": lambda: Order.parse_many(raw_orders, workers=workers),
+        "receive orders": lambda: Order._strictus_state_loader(pickle.loads(order_states)),
+        "strictus.to_dicts(items)": lambda: strictus.to_dicts(items),
+        f"strictus.to_dicts(items, workers={workers})": lambda: strictus.to_dicts(items, workers=workers),
+    }
+
+    for name, func in scenarios.items():
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{name:<45} {best * 1e6 / n_items:8.3f} us per item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+"""
+Measures throughput (operations per second) of the hot paths of stricti -- construction,
+attribute access, assignment and to_dict() -- in representative scenarios, next to the
+equivalent operation on plain dataclasses as a reference point.
+
+    python -m benchmarks.bench_throughput
+    python -m benchmarks.bench_throughput --save baseline.json
+    python -m benchmarks.bench_throughput --compare baseline.json
+    python -m benchmarks.bench_throughput --filter nested
+
+A saved baseline is a JSON file with the ops/sec of each scenario which a later run can
+be compared against. Only compare baselines recorded on the same machine and Python version.
+"""
+import argparse
+import dataclasses
+import json
+import platform
+import sys
+import timeit
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from strictus.core import strictus, strictus_field
+
+
+class Scenario(NamedTuple):
+    name: str
+    strictus: Callable[[], Any]
+    # The equivalent operation on dataclasses, if there is one
+    reference: Optional[Callable[[], Any]] = None
+
+
+# Flat records
+
+class FlatRecord(strictus):
+    id: int
+    name: str
+    price: float = 0.0
+    active: bool = True
+    notes: str = None
+
+
+@dataclasses.dataclass
+class FlatRecordDC:
+    id: int
+    name: str
+    price: float = 0.0
+    active: bool = True
+    notes: str = None
+
+
+# Nested default_factory trees
+
+class Leaf(strictus):
+    value: int = 0
+    label: str = "leaf"
+
+
+class Branch(strictus):
+    left: Leaf = strictus_field(default_factory=Leaf)
+    right: Leaf = strictus_field(default_factory=Leaf)
+
+
+class Trunk(strictus):
+    first: Branch = strictus_field(default_factory=Branch)
+    second: Branch = strictus_field(default_factory=Branch)
+
+
+class Tree(strictus):
+    trunk: Trunk = strictus_field(default_factory=Trunk)
+    name: str = "tree"
+
+
+class LazyTree(strictus):
+    trunk: Trunk = strictus_field(default_factory=Trunk, lazy_default=True)
+    name: str = "tree"
+
+
+@dataclasses.dataclass
+class LeafDC:
+    value: int = 0
+    label: str = "leaf"
+
+    @classmethod
+    def from_dict(cls, raw):
+        return cls(**raw)
+
+
+@dataclasses.dataclass
+class BranchDC:
+    left: LeafDC = dataclasses.field(default_factory=LeafDC)
+    right: LeafDC = dataclasses.field(default_factory=LeafDC)
+
+    @classmethod
+    def from_dict(cls, raw):
+        return cls(**{k: LeafDC.from_dict(v) for k, v in raw.items()})
+
+
+@dataclasses.dataclass
+class TrunkDC:
+    first: BranchDC = dataclasses.field(default_factory=BranchDC)
+    second: BranchDC = dataclasses.field(default_factory=BranchDC)
+
+    @classmethod
+    def from_dict(cls, raw):
+        return cls(**{k: BranchDC.from_dict(v) for k, v in raw.items()})
+
+
+@dataclasses.dataclass
+class TreeDC:
+    trunk: TrunkDC = dataclasses.field(default_factory=TrunkDC)
+    name: str = "tree"
+
+    @classmethod
+    def from_dict(cls, raw):
+        return cls(trunk=TrunkDC.from_dict(raw["trunk"]), name=raw["name"])
+
+
+# Containers
+
+class Item(strictus):
+    id: int
+    sku: str
+    quantity: int = 1
+
+
+class Order(strictus):
+    items: List[Item] = strictus_field(default_factory=list)
+    items_by_sku: Dict[str, Item] = strictus_field(default_factory=dict)
+
+
+@dataclasses.dataclass
+class ItemDC:
+    id: int
+    sku: str
+    quantity: int = 1
+
+
+@dataclasses.dataclass
+class OrderDC:
+    items: List[ItemDC] = dataclasses.field(default_factory=list)
+    items_by_sku: Dict[str, ItemDC] = dataclasses.field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, raw):
+        return cls(
+            items=[ItemDC(**item) for item in raw["items"]],
+            items_by_sku={k: ItemDC(**v) for k, v in raw["items_by_sku"].items()},
+        )
+
+
+# Getter fields
+
+class Rectangle(strictus):
+    width: float
+    height: float
+
+    @strictus_field
+    def area(self) -> float:
+        return self.width * self.height
+
+
+class Basket(strictus):
+    items: List[Item] = strictus_field(default_factory=list)
+
+    @strictus_field
+    def skus(self) -> List[str]:
+        return sorted(item.sku for item in self.items)
+
+
+class CachedBasket(strictus):
+    items: List[Item] = strictus_field(default_factory=list)
+
+    @strictus_field(cached=True, depends_on=["items"])
+    def skus(self) -> List[str]:
+        return sorted(item.sku for item in self.items)
+
+
+@dataclasses.dataclass
+class RectangleDC:
+    width: float
+    height: float
+
+    @property
+    def area(self) -> float:
+        return self.width * self.height
+
+    def to_dict(self):
+        return {**dataclasses.asdict(self), "area": self.area}
+
+
+# Additional attributes
+
+class Event(strictus):
+    class Meta:
+        additional_attributes = True
+
+    id: int
+    kind: str
+
+
+# create_from / _extract
+
+class Person(strictus):
+    id: int
+    name: str
+    email: str = None
+
+
+class PersonSummary(strictus):
+    id: int
+    name: str
+
+
+def build_scenarios() -> List[Scenario]:
+    flat_raw = {"id": 1, "name": "first", "price": 1.5, "active": False, "notes": "note"}
+    flat = FlatRecord(flat_raw)
+    flat_dc = FlatRecordDC(**flat_raw)
+
+    tree_raw = Tree().to_dict()
+    tree = Tree(tree_raw)
+    tree_dc = TreeDC.from_dict(tree_raw)
+
+    order_raw = {
+        "items": [{"id": i, "sku": f"SKU-{i}"} for i in range(20)],
+        "items_by_sku": {f"SKU-{i}": {"id": i, "sku": f"SKU-{i}"} for i in range(20)},
+    }
+    order = Order(order_raw)
+    order_dc = OrderDC.from_dict(order_raw)
+
+    rectangle = Rectangle(width=2.0, height=3.0)
+    rectangle_dc = RectangleDC(width=2.0, height=3.0)
+
+    basket = Basket(items=order_raw["items"])
+    cached_basket = CachedBasket(items=order_raw["items"])
+
+    event_raw = {"id": 1, "kind": "click", "x": 10, "y": 20, "target": "button"}
+    event = Event(event_raw)
+
+    person = Person(id=1, name="first", email="first@example.com")
+
+    def set_flat():
+        flat.price = 2.5
+
+    def set_flat_dc():
+        flat_dc.price = 2.5
+
+    return [
+        Scenario("flat: construct", lambda: FlatRecord(flat_raw), lambda: FlatRecordDC(**flat_raw)),
+        Scenario("flat: construct with kwargs", lambda: FlatRecord(id=1, name="x"),
+                 lambda: FlatRecordDC(id=1, name="x")),
+        Scenario("flat: construct trusted", lambda: FlatRecord.construct(flat_raw), lambda: FlatRecordDC(**flat_raw)),
+        Scenario("flat: get attribute", lambda: flat.price, lambda: flat_dc.price),
+        Scenario("flat: set attribute", set_flat, set_flat_dc),
+        Scenario("flat: to_dict", flat.to_dict, lambda: dataclasses.asdict(flat_dc)),
+        Scenario("nested: construct defaults", Tree, TreeDC),
+        Scenario("nested: construct lazy defaults", LazyTree, TreeDC),
+        Scenario("nested: lazy defaults to_dict", lambda: LazyTree().to_dict(), lambda: dataclasses.asdict(TreeDC())),
+        Scenario("nested: construct from dict", lambda: Tree(tree_raw), lambda: TreeDC.from_dict(tree_raw)),
+        Scenario("nested: construct trusted", lambda: Tree.construct(tree_raw), lambda: TreeDC.from_dict(tree_raw)),
+        Scenario("nested: get deep attribute", lambda: tree.trunk.first.left.value,
+                 lambda: tree_dc.trunk.first.left.value),
+        Scenario("nested: to_dict", tree.to_dict, lambda: dataclasses.asdict(tree_dc)),
+        Scenario("containers: construct", lambda: Order(order_raw), lambda: OrderDC.from_dict(order_raw)),
+        Scenario("containers: construct trusted", lambda: Order.construct(order_raw),
+                 lambda: OrderDC.from_dict(order_raw)),
+        Scenario("containers: to_dict", order.to_dict, lambda: dataclasses.asdict(order_dc)),
+        Scenario("containers: to_dict include", lambda: order.to_dict(include=["items.sku"]),
+                 lambda: {"items": [{"sku": item.sku} for item in order_dc.items]}),
+        Scenario("containers: to_dict exclude", lambda: order.to_dict(exclude=["items_by_sku"]),
+                 lambda: {"items": [dataclasses.asdict(item) for item in order_dc.items]}),
+        Scenario("getter: get attribute", lambda: rectangle.area, lambda: rectangle_dc.area),
+        Scenario("getter: to_dict", rectangle.to_dict, rectangle_dc.to_dict),
+        Scenario("getter: aggregate over items", lambda: basket.skus),
+        Scenario("getter: cached aggregate over items", lambda: cached_basket.skus),
+        Scenario("additional attributes: construct", lambda: Event(event_raw)),
+        Scenario("additional attributes: get attribute", lambda: event.target),
+        Scenario("additional attributes: to_dict", event.to_dict),
+        Scenario("create_from: strictus", lambda: PersonSummary.create_from(person)),
+        Scenario("create_from: _extract", lambda: person._extract(PersonSummary)),
+    ]
+
+
+def measure(func: Callable[[], Any], repeat: int = 5, min_time: float = 0.1) -> float:
+    """
+    Returns the best ops/sec of func over repeat runs, each of which lasts at least min_time seconds.
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    return number / min(timer.repeat(repeat=repeat, number=number))
+
+
+def format_ops(ops: float) -> str:
+    return f"{ops:,.0f}"
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--save", metavar="PATH", help="save results as a baseline to PATH")
+    parser.add_argument("--compare", metavar="PATH", help="compare results with the baseline saved in PATH")
+    parser.add_argument("--filter", metavar="TEXT", help="only run scenarios with TEXT in their name")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+
+    results = {}
+    print(f"{'scenario':<40} {'strictus ops/s':>16} {'dataclass ops/s':>16} {'ratio':>7} {'vs baseline':>12}")
+    for scenario in build_scenarios():
+        if args.filter and args.filter not in scenario.name:
+            continue
+
+        ops = results[scenario.name] = measure(scenario.strictus, repeat=args.repeat)
+        reference = ratio = ""
+        if scenario.reference is not None:
+            reference_ops = measure(scenario.reference, repeat=args.repeat)
+            reference = format_ops(reference_ops)
+            ratio = f"{ops / reference_ops:.2f}x"
+        change = ""
+        if scenario.name in baseline:
+            change = f"{(ops / baseline[scenario.name] - 1) * 100:+.1f}%"
+        print(f"{scenario.name:<40} {format_ops(ops):>16} {reference:>16} {ratio:>7} {change:>12}")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "results": results,
+            }, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Saved baseline to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Parsing of large payloads in coroutines without blocking the event loop.
+
+    order = await Order.aparse(payload)
+
+    async for event in Event.aiter_parse(stream_of_dicts):
+        ...
+
+Stricti are created with the same semantics as strictus.__new__ and parse_many, but
+nested stricti in containers are parsed in chunks of chunk_size items, and control
+is given back to the event loop after each chunk. If an executor is passed, chunks are
+parsed in it instead, which, for a ProcessPoolExecutor, requires the strictus classes
+to be importable by name (see strictus.parallel). Required, non-init and unexpected keys
+of a dictionary are checked before its nested stricti are parsed.
+"""
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Type, Union
+
+from strictus.containers import LazyStrictusList
+from strictus.core import get_schema, is_strictus, strictus
+from strictus.parallel import _parse_chunk
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class _ChunkedParser:
+    def __init__(self, chunk_size: int, executor: Optional[Executor]):
+        self.chunk_size = chunk_size
+        self.executor = executor
+        # Number of stricti parsed since control was last given back to the event loop
+        self.parsed = 0
+
+    async def parse_items(self, cls: Type[strictus], items: List) -> List[Optional[strictus]]:
+        instances = []
+        for i in range(0, len(items), self.chunk_size):
+            chunk = items[i:i + self.chunk_size]
+            if self.executor is None:
+                instances.extend(cls.parse_many(chunk))
+                self.parsed += len(chunk)
+                if self.parsed >= self.chunk_size:
+                    self.parsed = 0
+                    await asyncio.sleep(0)
+            else:
+                loop = asyncio.get_running_loop()
+                states = await loop.run_in_executor(self.executor, _parse_chunk, chunk, cls, False)
+                parsed = cls._strictus_state_loader(states)
+                # Instances passed in are kept as they are, not replaced with copies from the executor
+                instances.extend(
+                    item if is_strictus(item) and issubclass(type(item), cls) else instance
+                    for item, instance in zip(chunk, parsed)
+                )
+        return instances
+
+    async def parse(self, cls: Type[strictus], raw: Any) -> strictus:
+        """
+        Parses nested stricti, and stricti in strictus containers, of raw in chunks,
+        and then creates the instance of cls from raw with them.
+        """
+        if not isinstance(raw, dict):
+            return cls(raw)
+
+        # An invalid outer dictionary fails before any of its nested stricti are parsed
+        _check_keys(cls, raw)
+
+        parsed_values = {}
+        for name, field in get_schema(cls).items():
+            value = raw.get(name)
+            if value is None or field.getter or not field.init:
+                continue
+            if field.is_strictus:
+                if isinstance(value, dict):
+                    parsed_values[name] = await self.parse(field.type, value)
+            elif field.is_strictus_container:
+                if field.is_list and not issubclass(field.list_container_cls, LazyStrictusList):
+                    parsed_values[name] = await self.parse_items(field.item_type, list(value))
+                elif field.is_dict:
+                    items = await self.parse_items(field.item_type, list(value.values()))
+                    parsed_values[name] = dict(zip(value.keys(), items))
+
+        # The instance is created as usual, with nested stricti that are already parsed
+        # and which are therefore taken as they are.
+        return cls({**raw, **parsed_values} if parsed_values else raw)
+
+
+def _check_keys(cls: Type[strictus], raw: Dict):
+    """
+    Raises the error that cls(raw) raises if raw has a non-init field or an unexpected or forbidden key,
+    or lacks a required field.
+    """
+    schema = get_schema(cls)
+    for name, field in schema.items():
+        if name in raw:
+            if not field.init:
+                raise TypeError(f"{cls.__name__}.{name} is a non-init field")
+        elif field.required:
+            raise ValueError(f"{cls.__name__} field {name!r} is required")
+    keys = set(raw).difference(schema)
+    if keys and not schema.additional_attributes:
+        raise TypeError(f"Unexpected keyword arguments supplied to {cls.__name__}: {keys}")
+    for k in keys:
+        if k in schema.forbidden_attributes:
+            raise TypeError(f"{cls.__name__} forbids additional field {k!r}")
+
+
+async def aparse(
+    cls: Type[strictus],
+    data: Union[Dict, strictus],
+    chunk_size: int = None,
+    executor: Executor = None,
+) -> strictus:
+    """
+    Returns what cls(data) returns, giving control back to the event loop after parsing
+    every chunk_size nested stricti, or parsing them in executor.
+    """
+    return await _ChunkedParser(chunk_size or DEFAULT_CHUNK_SIZE, executor).parse(cls, data)
+
+
+async def aiter_parse(
+    cls: Type[strictus],
+    items: Union[AsyncIterable[Union[Dict, strictus, None]], Iterable[Union[Dict, strictus, None]]],
+    chunk_size: int = None,
+    executor: Executor = None,
+) -> AsyncIterator[Optional[strictus]]:
+    """
+    Yields what cls.parse_many(items) would return, one by one, parsing items of items,
+    which is an asynchronous or a regular iterable, in chunks of chunk_size.
+    """
+    parser = _ChunkedParser(chunk_size or DEFAULT_CHUNK_SIZE, executor)
+    chunk = []
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            chunk.append(item)
+            if len(chunk) >= parser.chunk_size:
+                for instance in await parser.parse_items(cls, chunk):
+                    yield instance
+                chunk = []
+    else:
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= parser.chunk_size:
+                for instance in await parser.parse_items(cls, chunk):
+                    yield instance
+                chunk = []
+    for instance in await parser.parse_items(cls, chunk):
+        yield instance
@@ -0,0 +1,226 @@
+from collections.abc import MutableSequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type
+
+
+class LazyStrictusList(MutableSequence):
+    """
+    A list of stricti which keeps the raw items it is created from and creates
+    each strictus only when the item is first accessed by index or iteration.
+
+    Use it as the list_container_cls of a strictus list field:
+
+        class Order(strictus):
+            items: List[Item] = strictus_field(default_factory=list, list_container_cls=LazyStrictusList)
+
+    Raw items that have not been accessed are included in to_dict() output without being
+    parsed, so their values appear as they are in the raw items, e.g. "4" for an int field.
+    They are copied, so changing the output doesn't change the items created later.
+    """
+
+    __slots__ = ("item_type", "_items")
+
+    def __init__(self, item_type: Type = None, raw_items: Iterable = ()):
+        self.item_type = item_type
+        if isinstance(raw_items, LazyStrictusList):
+            self._items = list(raw_items._items)
+        else:
+            self._items = list(raw_items)
+
+    def _get(self, index: int):
+        item = self._items[index]
+        if item is None or self.item_type is None or isinstance(item, self.item_type):
+            return item
+        item = self._items[index] = self.item_type(item)
+        return item
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.__class__(self.item_type, self._items[index])
+        return self._get(index)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self._items[index] = list(value)
+        else:
+            self._items[index] = value
+
+    def __delitem__(self, index):
+        del self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator:
+        for index in range(len(self._items)):
+            yield self._get(index)
+
+    def insert(self, index: int, value):
+        self._items.insert(index, value)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, LazyStrictusList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._items!r})"
+
+    @property
+    def num_parsed(self) -> int:
+        """
+        Number of items which have been accessed and hence parsed.
+        """
+        if self.item_type is None:
+            return 0
+        return sum(1 for item in self._items if isinstance(item, self.item_type))
+
+    def to_dicts(self) -> List[Optional[Dict[str, Any]]]:
+        """
+        Returns the to_dict() representation of the items, with copies of the raw items
+        that haven't been accessed, whose values are not parsed.
+        """
+        return [
+            None if item is None else _copy_serialised(item) if isinstance(item, dict) else item.to_dict()
+            for item in self._items
+        ]
+
+
+class TrackedList(list):
+    """
+    A list which notifies the strictus it belongs to whenever it is modified in place.
+    Used for strictus list fields of stricti which track changes (see Meta.track_changes).
+    """
+
+    __slots__ = ("owner",)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        # A weak reference to the strictus which has this list as a field value
+        self.owner = None
+
+    def _changed(self, new_items: Iterable = ()):
+        owner = self.owner() if self.owner is not None else None
+        if owner is not None:
+            owner._strictus_container_changed(new_items)
+
+    def __reduce_ex__(self, protocol):
+        return self.__class__, (list(self),)
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._changed(self if isinstance(index, slice) else (value,))
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, other):
+        result = super().__iadd__(other)
+        self._changed(self)
+        return result
+
+    def __imul__(self, n):
+        result = super().__imul__(n)
+        self._changed()
+        return result
+
+    def append(self, value):
+        super().append(value)
+        self._changed((value,))
+
+    def extend(self, values):
+        super().extend(values)
+        self._changed(self)
+
+    def insert(self, index, value):
+        super().insert(index, value)
+        self._changed((value,))
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def remove(self, value):
+        super().remove(value)
+        self._changed()
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self):
+        super().reverse()
+        self._changed()
+
+
+class TrackedDict(dict):
+    """
+    A dict which notifies the strictus it belongs to whenever it is modified in place.
+    Used for strictus dict fields of stricti which track changes (see Meta.track_changes).
+    """
+
+    __slots__ = ("owner",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # A weak reference to the strictus which has this dict as a field value
+        self.owner = None
+
+    def _changed(self, new_items: Iterable = ()):
+        owner = self.owner() if self.owner is not None else None
+        if owner is not None:
+            owner._strictus_container_changed(new_items)
+
+    def __reduce_ex__(self, protocol):
+        return self.__class__, (dict(self),)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed((value,))
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed(self.values())
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._changed((value,))
+        return value
+
+
+def _copy_serialised(value: Any) -> Any:
+    """
+    Returns a copy of a to_dict() representation, copying dicts and lists but not other values.
+    """
+    if isinstance(value, dict):
+        return {k: _copy_serialised(v) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [_copy_serialised(item) for item in value]
+    return value
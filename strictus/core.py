@@ -1,11 +1,26 @@
-from typing import Any, Callable, ClassVar, Dict, List, Optional, Type, Union, get_type_hints
+import weakref
+from typing import (
+    IO, Any, AsyncIterable, AsyncIterator, Callable, ClassVar, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple,
+    Type, Union, get_type_hints
+)
 
 from cached_property import cached_property
 
+from strictus.containers import LazyStrictusList, TrackedDict, TrackedList, _copy_serialised
+
 
 class _Empty:
-    def __init__(self, name="EMPTY"):
-        self._name = name
+    _instances: Dict[str, "_Empty"] = {}
+
+    def __new__(cls, name="EMPTY"):
+        # One instance per name, also when copied or unpickled, so that identity checks keep working
+        if name not in cls._instances:
+            instance = cls._instances[name] = super().__new__(cls)
+            instance._name = name
+        return cls._instances[name]
+
+    def __reduce__(self):
+        return self.__class__, (self._name,)
 
     def __bool__(self):
         return False
@@ -16,6 +31,18 @@ class _Empty:
 
 _NOT_SET = _Empty("NOT_SET")
 
+# Internal attributes of stricti which track changes or cache values of getters that are not part of their state
+_CHANGE_TRACKING_ATTRIBUTES = ("_strictus_dict_cache", "_strictus_parents", "__weakref__", "_strictus_cache")
+
+# Internal attributes of stricti which are set by the initialisers
+_FLAG_ATTRIBUTES = (
+    "_strictus_initialising",
+    "_strictus_base_post_init_reached",
+    "_strictus_additional_attributes",
+    "_strictus_raw",
+    "_strictus_hash",
+)
+
 
 class StrictusSchema(Dict[str, "strictus_field"]):
 
@@ -45,6 +72,58 @@ class StrictusSchema(Dict[str, "strictus_field"]):
     def init_all(self) -> bool:
         return self.meta.get("init_all", False)
 
+    @property
+    def lazy(self) -> bool:
+        """
+        True if instances are created as views of the raw mapping they are created from,
+        with fields parsed on first access. See strictus.view
+        """
+        return self.meta.get("lazy", False)
+
+    @property
+    def track_changes(self) -> bool:
+        """
+        True if instances cache their to_dict() output until they or any of their nested stricti change.
+        """
+        return self.meta.get("track_changes", False)
+
+    @property
+    def frozen(self) -> bool:
+        """
+        True if fields and additional attributes can't be set after initialisation,
+        and instances are hashable.
+        """
+        return self.meta.get("frozen", False)
+
+    @property
+    def intern(self) -> bool:
+        """
+        True if string values of fields, dict keys, and additional attribute names and string values
+        are interned (see intern_string).
+        """
+        return self.meta.get("intern", False)
+
+    @property
+    def slots(self) -> bool:
+        """
+        True if field values and internal flags are stored in __slots__ rather than in the instance __dict__.
+        """
+        return self.meta.get("slots", False)
+
+    @cached_property
+    def cached_fields(self) -> List["strictus_field"]:
+        """
+        Getter fields with cached set.
+        """
+        return [field for field in self.values() if field.cached]
+
+    @cached_property
+    def lazy_default_fields(self) -> List["strictus_field"]:
+        """
+        Fields with lazy_default set.
+        """
+        return [field for field in self.values() if field.lazy_default]
+
     def __getattr__(self, name):
         if name in self.meta:
             return self.meta[name]
@@ -75,32 +154,126 @@ class strictus:
     If additional attributes are enabled, all additional attributes will be included
     in the dict output.
 
+    To store field values in slots instead of the instance __dict__:
+
+        class Point(strictus):
+            __slots__ = ()
+
+            class Meta:
+                slots = True
+
+            x: int = 0
+            y: int = 0
+
+    Instances of a slotted class are instances of a subclass which strictus generates
+    with a slot for every field. The class itself, as well as all its bases, must declare
+    __slots__ so that instances don't get a __dict__. Slotted instances cannot have
+    arbitrary attributes set in _post_init_.
+
+    To cache the to_dict() output of instances until they change:
+
+        class Config(strictus):
+            class Meta:
+                track_changes = True
+
+    Setting fields or additional attributes, and modifying strictus list and dict fields
+    in place, marks the instance and all stricti it is nested in as changed. The next
+    to_dict() call re-serialises only the changed stricti and returns the cached dict
+    otherwise, so the returned dict must not be modified. Nested stricti must track
+    changes too. Getters included in to_dict() output must only depend on the fields
+    of the instance and of its nested stricti.
+
+    To defer building the schema until the class is first instantiated or its schema
+    is first requested:
+
+        class Point(strictus):
+            class Meta:
+                defer_schema = True
+
+    This cuts the cost of importing modules which declare many stricti, and lets
+    type hints refer to classes declared later in the module. Until the schema is
+    built, class attributes are not replaced with strictus fields. The option is
+    inherited by subclasses.
+
+    To make instances immutable and hashable:
+
+        class Point(strictus):
+            class Meta:
+                frozen = True
+
+    All fields of a frozen strictus are read-only, and no attributes can be set after
+    _post_init_. The hash is computed from the field values and additional attributes on
+    first use and cached, and equality compares cached hashes, if any, before comparing
+    the values field by field. Nested stricti must be frozen too, and list and dict
+    field values must not be modified in place. Subclasses of frozen stricti can't
+    set frozen to False.
+
     """
 
+    __slots__ = ()
+
     NOT_SET = _NOT_SET
 
+    _strictus_meta: ClassVar[Dict[str, Any]]
     _strictus_schema: ClassVar[StrictusSchema]
+    _strictus_initialiser: ClassVar[Callable[["strictus", Dict], None]]
+    _strictus_view_initialiser: ClassVar[Callable[["strictus", Mapping], None]]
+    _strictus_trusted_initialiser: ClassVar[Callable[["strictus", Dict], None]]
+    _strictus_serialiser: ClassVar[Callable[["strictus"], Dict]]
+    _strictus_comparator: ClassVar[Callable[["strictus", "strictus"], bool]]
+    _strictus_storage_cls: ClassVar[Type["strictus"]]
 
     _strictus_additional_attributes: Dict[str, Any]
     _strictus_initialising: bool
 
-    def __init_subclass__(cls, **kwargs):
-        super().__init_subclass__(**kwargs)
+    # Only set if the class tracks changes
+    _strictus_dict_cache: Optional[Dict]
+    _strictus_parents: Optional[List[weakref.ref]]
 
-        parent_schema: StrictusSchema = StrictusSchema()
-        if hasattr(cls, "_strictus_schema"):
-            parent_schema = getattr(cls, "_strictus_schema")
+    # Only set if the class is frozen
+    _strictus_hash: Optional[int]
 
-        cls._strictus_schema = StrictusSchema()
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
 
-        schema = cls._strictus_schema
-        schema.meta.update(parent_schema.meta)
+        if "_strictus_storage_of" in cls.__dict__:
+            # A slotted storage class generated in _strictus_build_schema, shares the schema of its base.
+            return
 
+        # Meta options are collected at class creation even if the schema is deferred,
+        # so that subclasses can inherit them without building the schema of their base.
+        meta = dict(getattr(cls, "_strictus_meta", {}))
         if "Meta" in cls.__dict__ and isinstance(cls.__dict__["Meta"], type):
             for k, v in cls.__dict__["Meta"].__dict__.items():
                 if not k.startswith("__"):
-                    schema.meta[k] = v
+                    meta[k] = v
             delattr(cls, "Meta")
+        if not meta.get("frozen", False) and any(
+            getattr(base, "_strictus_meta", {}).get("frozen", False) for base in cls.__mro__[1:]
+        ):
+            # Fields and __hash__ inherited from the frozen base would assume instances are immutable
+            raise TypeError(f"{cls.__name__} can't unset Meta.frozen of its base class")
+        cls._strictus_meta = meta
+
+        if meta.get("defer_schema", False):
+            _defer_schema(cls)
+        else:
+            cls._strictus_build_schema()
+
+    @classmethod
+    def _strictus_build_schema(cls):
+        """
+        Builds the schema of the class and sets up the class attributes that depend on it.
+        Called at class creation, or on first use if the class has Meta.defer_schema set to True.
+        """
+        parent_schema: StrictusSchema = StrictusSchema()
+        if hasattr(super(cls, cls), "_strictus_schema"):
+            parent_schema = getattr(super(cls, cls), "_strictus_schema")
+
+        cls._strictus_schema = StrictusSchema()
+
+        schema = cls._strictus_schema
+        schema.meta.update(cls._strictus_meta)
 
         names_seen = set()
 
@@ -197,6 +370,103 @@ class strictus:
         for name, value in schema.items():
             setattr(cls, name, value)
 
+        if schema.track_changes:
+            for field in schema.values():
+                field.track_changes = True
+                if field.is_strictus_container:
+                    if field.list_container_cls is list:
+                        field.list_container_cls = TrackedList
+                    if field.dict_container_cls is dict:
+                        field.dict_container_cls = TrackedDict
+                    if not (
+                        issubclass(field.list_container_cls, TrackedList) and
+                        issubclass(field.dict_container_cls, TrackedDict)
+                    ):
+                        raise TypeError(
+                            f"{cls.__name__} tracks changes so its strictus container field {field.name!r} "
+                            f"must use TrackedList and TrackedDict containers"
+                        )
+
+        for field in schema.values():
+            field.invalidates = ()
+        for field in schema.values():
+            if field.cached:
+                _register_dependencies(cls, field)
+
+        if schema.intern:
+            for field in schema.values():
+                if not field.intern:
+                    field.intern = True
+                    field.coerce = _resolve_coercer(field)
+
+        if schema.frozen:
+            for field in schema.values():
+                field.read_only = True
+                nested_type = field.type if field.is_strictus else (
+                    field.item_type if field.is_strictus_container else None
+                )
+                if nested_type is not None and not get_schema(nested_type).frozen:
+                    raise TypeError(
+                        f"{cls.__name__} is frozen so its nested stricti must be too, "
+                        f"but {nested_type.__name__} of field {field.name!r} isn't"
+                    )
+            cls.__hash__ = _hash_frozen_instance
+
+        cls._strictus_storage_cls = cls
+        if schema.slots:
+            if cls.__dictoffset__:
+                raise TypeError(
+                    f"{cls.__name__} has slots enabled so it and all its bases must declare __slots__, "
+                    f"for example, '__slots__ = ()'"
+                )
+            slots = ["_strictus_initialising", "_strictus_base_post_init_reached"]
+            if schema.additional_attributes:
+                slots.append("_strictus_additional_attributes")
+            if schema.lazy:
+                slots.append("_strictus_raw")
+            if schema.track_changes:
+                slots.extend(["_strictus_dict_cache", "_strictus_parents", "__weakref__"])
+            if schema.frozen:
+                slots.append("_strictus_hash")
+            if schema.cached_fields:
+                slots.append("_strictus_cache")
+            slots.extend(_slot_name(field.default_attr_name) for field in schema.values() if not field.getter)
+            cls._strictus_storage_cls = type(cls.__name__, (cls,), {
+                "__slots__": tuple(slots),
+                "__module__": cls.__module__,
+                "__qualname__": cls.__qualname__,
+                "_strictus_storage_of": cls,
+            })
+            for field in schema.values():
+                if not field.getter:
+                    field.slot = cls._strictus_storage_cls.__dict__[_slot_name(field.default_attr_name)]
+
+        # The specialised initialiser and serialiser are generated on first use
+        cls._strictus_initialiser = staticmethod(
+            _compile_on_first_use(cls, "_strictus_initialiser", _compile_initialiser)
+        )
+        cls._strictus_view_initialiser = staticmethod(
+            _compile_on_first_use(cls, "_strictus_view_initialiser", _compile_view_initialiser)
+        )
+        cls._strictus_trusted_initialiser = staticmethod(
+            _compile_on_first_use(cls, "_strictus_trusted_initialiser", _compile_trusted_initialiser)
+        )
+        cls._strictus_serialiser = staticmethod(
+            _compile_on_first_use(cls, "_strictus_serialiser", _compile_serialiser)
+        )
+        cls._strictus_comparator = staticmethod(
+            _compile_on_first_use(cls, "_strictus_comparator", _compile_comparator)
+        )
+        cls._strictus_state_getter = staticmethod(
+            _compile_on_first_use(cls, "_strictus_state_getter", _compile_state_getter)
+        )
+        cls._strictus_state_setter = staticmethod(
+            _compile_on_first_use(cls, "_strictus_state_setter", _compile_state_setter)
+        )
+        cls._strictus_state_loader = staticmethod(
+            _compile_on_first_use(cls, "_strictus_state_loader", _compile_state_loader)
+        )
+
     def __new__(cls, dict_or_strictus: Union[Dict, "strictus"] = None, **kwargs):
 
         if cls is strictus:
@@ -209,129 +479,284 @@ class strictus:
         if dict_or_strictus is not None and not isinstance(dict_or_strictus, dict):
             raise ValueError(f"Expected a dictionary, got a {type(dict_or_strictus)}")
 
-        schema = get_schema(cls)
-        instance = super().__new__(cls)
+        if not kwargs:
+            values = dict_or_strictus or {}
+        elif dict_or_strictus:
+            values = {**dict_or_strictus, **kwargs}
+        else:
+            values = kwargs
 
-        values = {}
-        if dict_or_strictus:
-            values.update(dict_or_strictus)
-        values.update(kwargs)
+        instance = super().__new__(cls._strictus_storage_cls)
+        cls._strictus_initialiser(instance, values)
+        return instance
+
+    @classmethod
+    def view(cls, raw: Mapping) -> "strictus":
+        """
+        Creates an instance of this strictus type which keeps a reference to the raw mapping
+        instead of copying values from it, and parses each field present in the mapping only
+        when the field is first read. The mapping must not be modified afterwards.
 
-        # Keep track of not processed keys
-        keys = set(values.keys())
+        Required, non-init and unexpected fields are checked, and defaults are set, immediately.
 
-        # Mark the instance is being initialised which means read-only fields can be set
-        instance._strictus_initialising = True
+        Stricti with slots enabled can only be created as views if they also have Meta.lazy
+        set to True; otherwise this is the same as instantiating the class.
+        Stricti with Meta.lazy set to True are always created as views.
+        """
+        if cls is strictus:
+            raise RuntimeError(f"Trying to instantiate {cls} which should only be used as a base class")
 
-        for field in schema.values():
-            if field.name in keys:
-                keys.remove(field.name)
-
-            # Ensure required fields are present. None is a valid value.
-            if field.required and field.name not in values:
-                raise ValueError(f"{cls.__name__} field {field.name!r} is required")
-
-            if field.name in values:
-                if not field.init:
-                    raise TypeError(f"{instance.__class__.__name__}.{field.name} is a non-init field")
-                setattr(instance, field.name, values[field.name])
-            elif field.default_factory is not _NOT_SET:
-                setattr(instance, field.name, field.default_factory())
-            elif field.default is not _NOT_SET:
-                setattr(instance, field.name, field.default)
-            elif field.init and schema.init_all:
-                setattr(instance, field.name, None)
-
-        instance._strictus_additional_attributes = {}
-
-        if keys:
-            if schema.additional_attributes:
-                for k in keys:
-                    if k in schema.forbidden_attributes:
-                        raise TypeError(
-                            f"{instance.__class__.__name__} forbids additional field {k!r}"
-                        )
-                    instance._set_additional_attribute(k, values[k])
-            else:
-                raise TypeError(
-                    f"Unexpected keyword arguments supplied to "
-                    f"{instance.__class__.__name__}: {keys}"
-                )
+        if is_strictus(raw) and issubclass(type(raw), cls):
+            return raw
 
-        # Call the post init hook BEFORE sealing the read-only attributes.
-        instance._strictus_base_post_init_reached = False
-        instance._post_init_()
+        if not isinstance(raw, Mapping):
+            raise ValueError(f"Expected a mapping, got a {type(raw)}")
 
-        # Make sure the base _post_init_ was reached.
-        # If it wasn't, user has failed to call super()._post_init_
-        if not instance._strictus_base_post_init_reached:
-            raise RuntimeError(f"Did you forget to call super()._post_init_() in {cls}._post_init_?")
+        instance = super().__new__(cls._strictus_storage_cls)
+        cls._strictus_view_initialiser(instance, raw)
+        return instance
 
-        # Seal the read-only attributes
-        instance._strictus_initialising = False
+    @classmethod
+    def construct(cls, data: Union[Dict, "strictus"], trusted: bool = True) -> "strictus":
+        """
+        Creates an instance of this strictus type from data which is known to be valid,
+        such as the to_dict() output of an instance loaded back from a cache or a database.
+
+        Values are stored as they are, without parsing, except that dictionaries are turned
+        into nested stricti, recursively, and containers are created for strictus container
+        fields and fields whose container class doesn't match. Required, non-init and unexpected
+        fields are still checked, defaults are set, and _post_init_ is called.
+
+        Passing data that isn't valid results in an instance with values of the wrong type.
+        If trusted is False, this is the same as instantiating the class.
+        """
+        if not trusted:
+            return cls(data)
+
+        if cls is strictus:
+            raise RuntimeError(f"Trying to instantiate {cls} which should only be used as a base class")
+
+        if is_strictus(data) and issubclass(type(data), cls):
+            return data
 
+        if not isinstance(data, dict):
+            raise ValueError(f"Expected a dictionary, got a {type(data)}")
+
+        instance = super().__new__(cls._strictus_storage_cls)
+        cls._strictus_trusted_initialiser(instance, data)
         return instance
 
-    def to_dict(self) -> Dict:
-        dct = {}
+    def _strictus_parse_raw(self):
+        """
+        Parses all fields of a strictus view that haven't been read yet,
+        and drops the reference to the raw mapping.
+        """
         for field in self._strictus_schema.values():
-            if not field.dict:
-                continue
-            try:
-                value = getattr(self, field.name)
-            except AttributeError:
-                continue
-            if value is None:
-                dct[field.name] = None
-            elif is_strictus(value):
-                dct[field.name] = value.to_dict()
-            elif field.is_strictus_container:
-                if field.is_list:
-                    dct_value = []
-                    for item in value:
-                        if item is None:
-                            dct_value.append(item)
-                        elif is_strictus(item):
-                            dct_value.append(item.to_dict())
-                        else:
-                            raise TypeError(f"Expected None or strictus, got {type(item)} in {field.name}")
-                    dct[field.name] = dct_value
-                elif field.is_dict:
-                    dct_value = {}
-                    for k, v in value.items():
-                        if v is None:
-                            dct_value[k] = v
-                        elif is_strictus(v):
-                            dct_value[k] = v.to_dict()
-                        else:
-                            raise TypeError(f"Expected None or strictus, got {type(v)} in {field.name}")
-                    dct[field.name] = dct_value
+            if not field.getter:
+                try:
+                    field.__get__(self, self.__class__)
+                except AttributeError:
+                    pass
+        del self._strictus_raw
+
+    @classmethod
+    def parse_many(
+        cls,
+        items: Iterable[Union[Dict, "strictus", None]],
+        container_cls: Type = list,
+        trusted: bool = False,
+        workers: int = None,
+        min_parallel_size: int = None,
+    ) -> List:
+        """
+        Creates instances of this strictus type from an iterable of dictionaries and returns
+        them in a new container_cls (list by default) which is populated by calling its append().
+
+        Each item is treated the way a strictus list field treats its items: None is kept as is
+        and an instance of this type is not copied.
+
+        If trusted is True, dictionaries are turned into instances like construct() does.
+
+        If workers is set, batches of at least min_parallel_size items are parsed in that many
+        worker processes. See strictus.parallel
+        """
+        if cls is strictus:
+            raise RuntimeError(f"Trying to instantiate {cls} which should only be used as a base class")
+
+        if workers is not None:
+            from strictus import parallel
+            instances = parallel.parse_many(
+                cls, items, workers=workers, trusted=trusted, min_parallel_size=min_parallel_size,
+            )
+        else:
+            storage_cls = cls._strictus_storage_cls
+            initialise = cls._strictus_trusted_initialiser if trusted else cls._strictus_initialiser
+            new = super().__new__
+
+            instances = []
+            append = instances.append
+            for item in items:
+                if item is None:
+                    append(None)
+                elif type(item) is dict:
+                    instance = new(storage_cls)
+                    initialise(instance, item)
+                    append(instance)
                 else:
-                    raise NotImplementedError()
-            else:
-                dct[field.name] = value
-        if self._strictus_schema.additional_attributes:
-            dct.update(self._strictus_additional_attributes)
-        return dct
+                    append(cls(item))
+
+        if container_cls is list:
+            return instances
+        container = container_cls()
+        for instance in instances:
+            container.append(instance)
+        return container
+
+    @classmethod
+    async def aparse(cls, data: Union[Dict, "strictus"], chunk_size: int = None, executor=None) -> "strictus":
+        """
+        Creates an instance like cls(data) does, but gives control back to the event loop
+        after parsing every chunk_size nested stricti, or parses them in executor.
+        See strictus.aio
+        """
+        from strictus import aio
+        return await aio.aparse(cls, data, chunk_size=chunk_size, executor=executor)
+
+    @classmethod
+    def aiter_parse(
+        cls,
+        items: Union[AsyncIterable[Union[Dict, "strictus", None]], Iterable[Union[Dict, "strictus", None]]],
+        chunk_size: int = None,
+        executor=None,
+    ) -> AsyncIterator[Optional["strictus"]]:
+        """
+        Yields instances created from items, an asynchronous or a regular iterable, as parse_many
+        does, parsing them in chunks of chunk_size and giving control back to the event loop
+        after each, or parsing them in executor. See strictus.aio
+        """
+        from strictus import aio
+        return aio.aiter_parse(cls, items, chunk_size=chunk_size, executor=executor)
+
+    @classmethod
+    def iter_jsonl(
+        cls,
+        fp,
+        *,
+        compression: Optional[str] = "infer",
+        chunk_size: int = None,
+    ) -> Iterator["strictus"]:
+        """
+        Yields instances of this strictus type read from fp, a path or a file object,
+        in JSON Lines format. See strictus.jsonl.iter_jsonl
+        """
+        from strictus import jsonl
+        return jsonl.iter_jsonl(cls, fp, compression=compression, chunk_size=chunk_size)
+
+    @classmethod
+    def write_jsonl(
+        cls,
+        fp,
+        instances: Iterable["strictus"],
+        *,
+        compression: Optional[str] = "infer",
+        chunk_size: int = None,
+    ) -> int:
+        """
+        Writes instances of this strictus type to fp, a path or a file object, in JSON Lines format.
+        See strictus.jsonl.write_jsonl
+        """
+        from strictus import jsonl
+        return jsonl.write_jsonl(fp, instances, compression=compression, chunk_size=chunk_size, cls=cls)
+
+    def to_dict(
+        self,
+        include: Iterable[str] = None,
+        exclude: Iterable[str] = None,
+        max_depth: int = None,
+    ) -> Dict:
+        """
+        Returns the dictionary representation of this strictus. If include is set, only the fields
+        at its dotted paths, such as "owner.name", are included; the fields at the dotted paths
+        of exclude are left out, and so are nested stricti deeper than max_depth levels.
+        Fields that are left out aren't read. See strictus.projection
+        """
+        if include is None and exclude is None and max_depth is None:
+            return self._strictus_serialiser(self)
+        from strictus import projection
+        return projection.to_dict(self, include=include, exclude=exclude, max_depth=max_depth)
+
+    @staticmethod
+    def to_dicts(
+        instances: Iterable[Optional["strictus"]],
+        workers: int = None,
+        min_parallel_size: int = None,
+    ) -> List[Optional[Dict]]:
+        """
+        Returns the to_dict() representation of each of instances, and None for None.
+        If workers is set, batches of at least min_parallel_size instances are serialised
+        in that many worker processes. See strictus.parallel
+        """
+        if workers is not None:
+            from strictus import parallel
+            return parallel.to_dicts(instances, workers=workers, min_parallel_size=min_parallel_size)
+        return [None if instance is None else instance.to_dict() for instance in instances]
+
+    def iter_json_chunks(self, chunk_size: int = None) -> Iterator[str]:
+        """
+        Yields the JSON text of the to_dict() representation of this strictus in chunks
+        of roughly chunk_size characters without building the to_dict() output first.
+        See strictus.json_stream.iter_json_chunks
+        """
+        from strictus import json_stream
+        return json_stream.iter_json_chunks(self, chunk_size=chunk_size)
+
+    def write_json(self, fp: IO, chunk_size: int = None) -> int:
+        """
+        Writes the JSON text of the to_dict() representation of this strictus to fp, a text
+        or binary file object, in chunks. See strictus.json_stream.write_json
+        """
+        from strictus import json_stream
+        return json_stream.write_json(self, fp, chunk_size=chunk_size)
 
     def __eq__(self, other):
         if other is None:
             return False
         if other is self:
             return True
+        if self._strictus_schema.lazy_default_fields and type(other) is type(self):
+            # Defaults that haven't been created yet are equal to those that have
+            for field in self._strictus_schema.lazy_default_fields:
+                field.__get__(self, type(self))
+                field.__get__(other, type(other))
+        if self._strictus_schema.frozen:
+            return self._strictus_comparator(self, other)
         if self.__class__ != other.__class__:
             return False
+        for instance in (self, other):
+            if _get_raw(instance) is not None:
+                instance._strictus_parse_raw()
+        if self._strictus_schema.slots:
+            return all(
+                getattr(self, slot, _NOT_SET) == getattr(other, slot, _NOT_SET)
+                for slot in self.__class__.__slots__
+                if slot not in _CHANGE_TRACKING_ATTRIBUTES
+            )
+        if self._strictus_schema.track_changes or self._strictus_schema.cached_fields:
+            return (
+                {k: v for k, v in self.__dict__.items() if k not in _CHANGE_TRACKING_ATTRIBUTES} ==
+                {k: v for k, v in other.__dict__.items() if k not in _CHANGE_TRACKING_ATTRIBUTES}
+            )
         return self.__dict__ == other.__dict__
 
     def __setattr__(self, name, value):
         can_set_attribute = (
             name.startswith("_strictus") or
             self._strictus_initialising or
-            name in self.__dict__ or
             (
                 name in self._strictus_schema
                 # read_only is checked in strictus_field.__set__
-            )
+            ) or
+            (name in getattr(self, "__dict__", ()) and not self._strictus_schema.frozen)
         )
         if can_set_attribute:
             super().__setattr__(name, value)
@@ -350,7 +775,40 @@ class strictus:
         )
 
     def _set_additional_attribute(self, name, value):
+        if self._strictus_schema.frozen and not self._strictus_initialising:
+            raise AttributeError(f"can't set attribute {name} of frozen {self.__class__.__name__}")
+        if self._strictus_schema.intern:
+            name = intern_string(name)
+            if type(value) is str:
+                value = intern_string(value)
         self._strictus_additional_attributes[name] = value
+        if self._strictus_schema.track_changes:
+            self._strictus_mark_changed()
+
+    def _strictus_mark_changed(self):
+        """
+        Drops the cached to_dict() output of this strictus and of all stricti it is nested in.
+        """
+        # A strictus without a cache, e.g. one that is left out of the to_dict() output of its parent,
+        # can still be nested in stricti with a cache, so all ancestors are visited.
+        stack = [self]
+        seen = set()
+        while stack:
+            instance = stack.pop()
+            instance._strictus_dict_cache = None
+            for parent_ref in instance._strictus_parents or ():
+                parent = parent_ref()
+                if parent is not None and id(parent) not in seen:
+                    seen.add(id(parent))
+                    stack.append(parent)
+
+    def _strictus_container_changed(self, new_items: Iterable):
+        """
+        Called by a TrackedList or TrackedDict field value of this strictus when it is modified in place.
+        """
+        for item in new_items:
+            _adopt(self, item)
+        self._strictus_mark_changed()
 
     # Extensions
 
@@ -371,6 +829,95 @@ class strictus:
             if k not in exclude:
                 setattr(self, k, v)
 
+    def replace(self, **changes) -> "strictus":
+        """
+        Returns a new instance of the same type with the fields listed in changes set to new values.
+        This is what creating an instance from {**self.to_dict(), **changes} does, but only the new
+        values are parsed. Values of all other fields, including nested stricti and containers, are
+        shared with self, not copied, so modifying them in place modifies both instances.
+
+        As on initialisation, read-only fields can be changed, non-init fields can't,
+        and _post_init_ is called on the new instance.
+        """
+        schema = self._strictus_schema
+        cls = type(self)
+        cls_name = cls.__name__
+
+        unexpected = set()
+        for name in changes:
+            if name in schema:
+                if not schema[name].init:
+                    raise TypeError(f"{cls_name}.{name} is a non-init field")
+            elif not schema.additional_attributes:
+                unexpected.add(name)
+            elif name in schema.forbidden_attributes:
+                raise TypeError(f"{cls_name} forbids additional field {name!r}")
+        if unexpected:
+            raise TypeError(f"Unexpected keyword arguments supplied to {cls_name}: {unexpected}")
+
+        instance = object.__new__(cls)
+        if schema.slots:
+            for slot in cls.__slots__:
+                if slot not in _CHANGE_TRACKING_ATTRIBUTES:
+                    value = getattr(self, slot, _NOT_SET)
+                    if value is not _NOT_SET:
+                        object.__setattr__(instance, slot, value)
+        else:
+            instance.__dict__.update(
+                (k, v) for k, v in self.__dict__.items() if k not in _CHANGE_TRACKING_ATTRIBUTES
+            )
+        if schema.additional_attributes:
+            instance._strictus_additional_attributes = dict(self._strictus_additional_attributes)
+
+        instance._strictus_initialising = True
+        if schema.frozen:
+            instance._strictus_hash = None
+        if schema.cached_fields:
+            instance._strictus_cache = None
+        if schema.track_changes:
+            instance._strictus_dict_cache = None
+            instance._strictus_parents = None
+            # Nested stricti get the new instance as another parent, and tracked containers,
+            # which can only notify one strictus, are replaced with shallow copies.
+            for field in schema.values():
+                if not field.getter and field.name not in changes:
+                    value = getattr(instance, field.name, None)
+                    if value is not None and field.type not in (bool, int, float, str):
+                        setattr(instance, field.name, value)
+
+        for name, value in changes.items():
+            if name in schema:
+                setattr(instance, name, value)
+            else:
+                instance._set_additional_attribute(name, value)
+
+        instance._strictus_base_post_init_reached = False
+        instance._post_init_()
+        if not instance._strictus_base_post_init_reached:
+            raise RuntimeError(f"Did you forget to call super()._post_init_() in {cls}._post_init_?")
+        instance._strictus_initialising = False
+        return instance
+
+    def __reduce_ex__(self, protocol):
+        """
+        Pickles and copies stricti as the class that the user has declared and the state returned
+        by __getstate__, so that they are restored without calling __new__ or parsing values again.
+        """
+        cls = type(self)
+        return _unpickle, (getattr(cls, "_strictus_storage_of", cls), *self._strictus_state_getter(self))
+
+    def __getstate__(self) -> Tuple[Tuple, Optional[Dict], Optional[Dict]]:
+        """
+        Returns the values of fields that aren't getters, in schema order, with NOT_SET for those
+        that aren't set, the additional attributes, or None if there are none, and other instance
+        attributes, such as those set in _post_init_, or None if there are none.
+        Internal flags and cached values are not part of the state.
+        """
+        return self._strictus_state_getter(self)
+
+    def __setstate__(self, state: Tuple[Tuple, Optional[Dict], Optional[Dict]]):
+        self._strictus_state_setter(self, *state)
+
     def _extract(
         self: Union["strictus", Any],
         target: Type["strictus"] = None,
@@ -496,6 +1043,10 @@ class strictus_field:
         init: bool = _NOT_SET,
         read_only: bool = False,
         required: bool = False,
+        intern: bool = False,
+        lazy_default: bool = False,
+        cached: bool = False,
+        depends_on: Iterable[str] = (),
     ):
         self.name = name
 
@@ -509,6 +1060,26 @@ class strictus_field:
         # None is a valid value. All that matters is that it is included in the payload.
         self.required = required
 
+        # Whether string values, and keys of dict values, are interned (see intern_string)
+        self.intern = intern
+
+        # Whether default_factory is called on first access of the field rather than on initialisation.
+        # Until then, to_dict() output includes a copy of the serialised default computed once if
+        # default_factory always returns equal values (see _is_deterministic_factory); otherwise,
+        # to_dict() creates the default value.
+        self.lazy_default = lazy_default
+        self._serialised_default_value = _NOT_SET
+        self._deterministic_default: Optional[bool] = None
+
+        # Whether the value returned by the getter is cached in the instance until one of the fields
+        # it depends on is set. Values of getters of frozen stricti are cached for good.
+        self.cached = cached
+        self.depends_on: Tuple[str, ...] = tuple(depends_on)
+
+        # Names of the cached fields whose values are dropped when this field is set,
+        # set by strictus.__init_subclass__.
+        self.invalidates: Tuple[str, ...] = ()
+
         # type is a property which controls a few attributes, do not modify
         # the other attributes directly, modify just the type
         self._type = None
@@ -516,11 +1087,21 @@ class strictus_field:
         self._is_strictus_container = None
         self._is_dict = None
         self._is_list = None
+        # Function which parses a raw value of the field, same as parse_value(field, raw_value).
+        # Resolved for the current type whenever type is set.
+        self.coerce: Callable[[Any], Any] = _coerce_as_is
         self.type = type
 
         self.list_container_cls = list_container_cls
         self.dict_container_cls = dict_container_cls
 
+        # The slot member descriptor in which the value is stored if the strictus class
+        # has slots enabled, set by strictus.__init_subclass__.
+        self.slot = None
+
+        # Whether the strictus class tracks changes, set by strictus.__init_subclass__.
+        self.track_changes = False
+
         # Whether the field is included in the to_dict() output
         self.dict = dict
 
@@ -538,6 +1119,11 @@ class strictus_field:
         if self.getter and self.required:
             raise ValueError(f"Inconsistent field {self.name!r} definition: it is both required and has a getter")
 
+        if self.lazy_default and (self.default_factory is _NOT_SET or self.getter):
+            raise ValueError(
+                f"Inconsistent field {self.name!r} definition: it has lazy_default set but no default_factory"
+            )
+
     @property
     def type(self) -> Type:
         return self._type
@@ -555,6 +1141,7 @@ class strictus_field:
                 (self._is_list and is_strictus(self.item_type)) or
                 (self._is_dict and is_strictus(self.item_type))
             )
+        self.coerce = _resolve_coercer(self)
 
     @property
     def has_type(self) -> bool:
@@ -606,6 +1193,10 @@ class strictus_field:
             dict_container_cls=self.dict_container_cls,
             dict=self.dict,
             init=self.init,
+            intern=self.intern,
+            lazy_default=self.lazy_default,
+            cached=self.cached,
+            depends_on=self.depends_on,
         )
 
     @property
@@ -667,10 +1258,105 @@ class strictus_field:
             assert owner._strictus_schema[self.name] is self
             return self
         if self._getter:
+            if self.cached:
+                return self._get_cached(instance)
             return self._getter(instance)
-        if hasattr(instance, self.default_attr_name):
-            return getattr(instance, f"_strictus#{self.name}")
-        raise AttributeError(self.name)
+        if self.slot is not None:
+            try:
+                return self.slot.__get__(instance, owner)
+            except AttributeError:
+                value = self._parse_raw_value(instance)
+        else:
+            try:
+                return instance.__dict__[self.default_attr_name]
+            except KeyError:
+                value = self._parse_raw_value(instance)
+        if value is _NOT_SET:
+            if self.lazy_default:
+                return self._materialise_default(instance)
+            raise AttributeError(self.name)
+        return value
+
+    def _get_cached(self, instance: strictus) -> Any:
+        """
+        Returns the value of a cached getter field, calling the getter if it isn't cached.
+        """
+        cache = instance._strictus_cache
+        if cache is None:
+            cache = {}
+            object.__setattr__(instance, "_strictus_cache", cache)
+        elif self.name in cache:
+            return cache[self.name]
+        value = cache[self.name] = self._getter(instance)
+        return value
+
+    def _materialise_default(self, instance: strictus) -> Any:
+        """
+        Creates, stores and returns the default value of a field with lazy_default set
+        on first access of the field.
+        """
+        value = self.coerce(self.default_factory())
+        if self.track_changes:
+            _adopt(instance, value)
+        if self.slot is not None:
+            self.slot.__set__(instance, value)
+        else:
+            instance.__dict__[self.default_attr_name] = value
+        if self.track_changes:
+            instance._strictus_mark_changed()
+        return value
+
+    def _serialised_default(self, instance: strictus) -> Any:
+        """
+        Returns the to_dict() representation of the default value of a field with lazy_default set,
+        which is what to_dict() includes until the default value is created: a copy of the representation
+        computed once if default_factory always returns equal values, or else that of the default value
+        of instance, which is created for it.
+        """
+        if not self._shares_serialised_default():
+            return serialise_value(self, self._materialise_default(instance))
+        if self._serialised_default_value is _NOT_SET:
+            self._serialised_default_value = serialise_value(self, self.coerce(self.default_factory()))
+        return _copy_serialised(self._serialised_default_value)
+
+    def _shares_serialised_default(self) -> bool:
+        """
+        Returns True if instances share the serialised default value of a field with lazy_default set
+        until their default value is created.
+        """
+        if self._deterministic_default is None:
+            self._deterministic_default = _is_deterministic_factory(self.default_factory)
+        return self._deterministic_default
+
+    def _parse_raw_value(self, instance: strictus) -> Any:
+        """
+        If instance is a strictus view (see strictus.view) whose raw mapping includes this field,
+        parses and stores the raw value, and returns the parsed value.
+        Otherwise, returns NOT_SET.
+        """
+        raw = _get_raw(instance)
+        if raw is None or self.name not in raw:
+            return _NOT_SET
+        value = self.coerce(raw[self.name])
+        self._store(instance, value)
+        return value
+
+    def _store(self, instance: strictus, value: Any):
+        """
+        Stores the already parsed value of the field in instance without the checks of __set__,
+        such as for values of non-init fields of instances restored from stored data.
+        """
+        if self.invalidates:
+            cache = instance._strictus_cache
+            if cache:
+                for name in self.invalidates:
+                    cache.pop(name, None)
+        if self.track_changes:
+            _adopt(instance, value)
+        if self.slot is not None:
+            self.slot.__set__(instance, value)
+        else:
+            instance.__dict__[self.default_attr_name] = value
 
     def __set__(self, instance: strictus, value: Any):
         assert self.name
@@ -681,37 +1367,280 @@ class strictus_field:
         if self.read_only and not instance._strictus_initialising:
             raise AttributeError(f"can't set attribute {self.name}")
 
-        return setattr(instance, f"_strictus#{self.name}", parse_value(field=self, raw_value=value))
+        value = self.coerce(value)
+        if self.invalidates:
+            cache = instance._strictus_cache
+            if cache:
+                for name in self.invalidates:
+                    cache.pop(name, None)
+        if self.track_changes:
+            _adopt(instance, value)
+            if self.slot is not None:
+                self.slot.__set__(instance, value)
+            else:
+                setattr(instance, f"_strictus#{self.name}", value)
+            instance._strictus_mark_changed()
+            return
+        if self.slot is not None:
+            return self.slot.__set__(instance, value)
+        return setattr(instance, f"_strictus#{self.name}", value)
 
     def __repr__(self):
         return f"<{self.__class__.__name__} {self.name!r}>"
 
 
+class _DeferredSchemaAttribute:
+    """
+    Placeholder for a class attribute of a strictus class with Meta.defer_schema set to True
+    which builds the schema of the class, thereby replacing itself, when first accessed.
+    """
+
+    def __init__(self, cls: Type[strictus], name: str):
+        self.cls = cls
+        self.name = name
+
+    def __get__(self, instance, owner):
+        cls = self.cls
+        try:
+            cls._strictus_build_schema()
+        except BaseException:
+            _defer_schema(cls)
+            raise
+        # The attribute is looked up in the class that declares the placeholder, because owner may be
+        # a subclass, e.g. when its own schema is being built, whose attribute is another placeholder
+        value = cls.__dict__[self.name]
+        if hasattr(value, "__get__"):
+            return value.__get__(instance, owner)
+        return value
+
+
+# Class attributes which are set up when the schema is built
+_SCHEMA_ATTRIBUTES = (
+    "_strictus_schema",
+    "_strictus_storage_cls",
+    "_strictus_initialiser",
+    "_strictus_view_initialiser",
+    "_strictus_trusted_initialiser",
+    "_strictus_serialiser",
+    "_strictus_comparator",
+    "_strictus_state_getter",
+    "_strictus_state_setter",
+    "_strictus_state_loader",
+)
+
+
+def _defer_schema(cls: Type[strictus]):
+    for name in _SCHEMA_ATTRIBUTES:
+        setattr(cls, name, _DeferredSchemaAttribute(cls, name))
+
+
+def _register_dependencies(cls: Type[strictus], field: strictus_field):
+    """
+    Registers the cached getter field with the fields it depends on, directly or through other
+    cached getter fields, so that setting any of them drops the cached value.
+    """
+    schema = get_schema(cls)
+    if not field.getter:
+        raise ValueError(f"{cls.__name__} field {field.name!r} is cached but has no getter")
+    dependencies = list(field.depends_on)
+    seen = set()
+    while dependencies:
+        name = dependencies.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        if name not in schema:
+            raise ValueError(f"{cls.__name__} field {field.name!r} depends on unknown field {name!r}")
+        dependency = schema[name]
+        if dependency.cached:
+            dependencies.extend(dependency.depends_on)
+        elif not dependency.getter and field.name not in dependency.invalidates:
+            dependency.invalidates += (field.name,)
+
+
+def _is_deterministic_factory(factory: Callable, seen: Tuple[Type, ...] = ()) -> bool:
+    """
+    Returns True if factory is known to return equal values on every call: a builtin type, or a strictus class
+    without its own __new__ or _post_init_ whose fields' default factories are deterministic too.
+    """
+    if not isinstance(factory, type):
+        return False
+    if factory.__module__ == "builtins" or factory in seen:
+        return True
+    if not is_strictus(factory):
+        return False
+    if factory.__new__ is not strictus.__new__ or factory._post_init_ is not strictus._post_init_:
+        return False
+    return all(
+        field.getter or field.default_factory is _NOT_SET
+        or _is_deterministic_factory(field.default_factory, seen + (factory,))
+        for field in get_schema(factory).values()
+    )
+
+
+def _unpickle(
+    cls: Type[strictus],
+    values: Tuple,
+    additional_attributes: Optional[Dict],
+    other_attributes: Optional[Dict],
+) -> strictus:
+    """
+    Creates an instance of cls from the state returned by strictus.__getstate__.
+    """
+    instance = object.__new__(cls._strictus_storage_cls)
+    cls._strictus_state_setter(instance, values, additional_attributes, other_attributes)
+    return instance
+
+
+def _hash_frozen_instance(instance: strictus) -> int:
+    """
+    __hash__ of frozen stricti, computed on first call and cached in the instance.
+    """
+    cached = instance._strictus_hash
+    if cached is None:
+        if _get_raw(instance) is not None:
+            instance._strictus_parse_raw()
+        schema = instance._strictus_schema
+        values = [_freeze(getattr(instance, name, _NOT_SET)) for name, field in schema.items() if not field.getter]
+        if schema.additional_attributes:
+            values.append(_freeze(instance._strictus_additional_attributes))
+        cached = hash(tuple(values))
+        object.__setattr__(instance, "_strictus_hash", cached)
+    return cached
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Returns a hashable equivalent of a field value, turning lists into tuples and dicts into frozensets.
+    """
+    if isinstance(value, (list, tuple, LazyStrictusList)):
+        return tuple(_freeze(item) for item in value)
+    elif isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    elif isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def _adopt(parent: strictus, value: Any):
+    """
+    Registers parent, a strictus which tracks changes, as the parent of the value if it's a strictus,
+    or of the stricti in the value if it's a tracked container, so that changes to them propagate
+    to the parent.
+    """
+    if isinstance(value, (TrackedList, TrackedDict)):
+        value.owner = weakref.ref(parent)
+        for item in (value.values() if isinstance(value, dict) else value):
+            _adopt(parent, item)
+    elif isinstance(value, strictus):
+        if not value._strictus_schema.track_changes:
+            raise TypeError(
+                f"{parent.__class__.__name__} tracks changes so its nested stricti must too, "
+                f"but {value.__class__.__name__} doesn't"
+            )
+        parents = value._strictus_parents
+        if parents is None:
+            value._strictus_parents = [weakref.ref(parent)]
+        elif not any(parent_ref() is parent for parent_ref in parents):
+            parents[:] = [parent_ref for parent_ref in parents if parent_ref() is not None]
+            parents.append(weakref.ref(parent))
+
+
+def _get_raw(instance: strictus) -> Optional[Mapping]:
+    """
+    Returns the raw mapping of a strictus view, or None if the instance isn't a view
+    or all its fields have been parsed.
+    """
+    if instance._strictus_schema.slots:
+        return getattr(instance, "_strictus_raw", None)
+    return instance.__dict__.get("_strictus_raw")
+
+
+def _slot_name(attr_name: str) -> str:
+    """
+    Returns the name of the slot in which the attribute is stored in slotted stricti.
+    """
+    return attr_name.replace("#", "__")
+
+
 def get_schema(cls_or_instance: Union[Type[strictus], strictus]) -> StrictusSchema:
     return cls_or_instance._strictus_schema
 
 
 def is_strictus(anything) -> bool:
-    return hasattr(anything, "_strictus_schema")
+    # Meta options are set at class creation, so this doesn't build deferred schemas
+    return hasattr(anything, "_strictus_meta")
 
 
 def is_strictus_container(anything) -> bool:
     raise NotImplementedError()
 
 
+def serialise_value(field: strictus_field, value) -> Any:
+    """
+    Returns the to_dict() representation of the value of the field.
+    """
+    if value is None:
+        return None
+    elif is_strictus(value):
+        return value.to_dict()
+    elif field.is_strictus_container:
+        if isinstance(value, LazyStrictusList):
+            return value.to_dicts()
+        elif field.is_list:
+            return [_serialise_container_item(field, item) for item in value]
+        elif field.is_dict:
+            return {k: _serialise_container_item(field, v) for k, v in value.items()}
+        else:
+            raise NotImplementedError()
+    return value
+
+
+def _serialise_container_item(field: strictus_field, item) -> Optional[Dict]:
+    if item is None:
+        return None
+    elif is_strictus(item):
+        return item.to_dict()
+    raise TypeError(f"Expected None or strictus, got {type(item)} in {field.name}")
+
+
 def parse_list(field: strictus_field, raw_value) -> List:
     assert raw_value is not None
+    if field.is_strictus_container:
+        if issubclass(field.list_container_cls, LazyStrictusList):
+            return field.list_container_cls(field.item_type, raw_value)
+        return field.item_type.parse_many(raw_value, container_cls=field.list_container_cls)
     value = field.list_container_cls()
+    item_type = field.item_type
+    if field.intern and item_type is str:
+        for raw_item in raw_value:
+            value.append(raw_item if raw_item is None else intern_string(str(raw_item)))
+        return value
     for raw_item in raw_value:
         if raw_item is None:
             value.append(raw_item)
         else:
-            value.append(field.item_type(raw_item))
+            value.append(item_type(raw_item))
     return value
 
 
 def parse_dict(field: strictus_field, raw_value) -> Dict:
     assert raw_value is not None
+    if field.intern:
+        raw_value = {
+            (intern_string(k) if type(k) is str else k): (
+                intern_string(v) if type(v) is str and field.item_type is str else v
+            )
+            for k, v in raw_value.items()
+        }
+    if field.is_strictus_container:
+        items = zip(raw_value.keys(), field.item_type.parse_many(raw_value.values()))
+        if field.dict_container_cls is dict:
+            return dict(items)
+        value = field.dict_container_cls()
+        for item_key, item_value in items:
+            value[item_key] = item_value
+        return value
     value = field.dict_container_cls()
     for item_key, raw_item_value in raw_value.items():
         if raw_item_value is None:
@@ -721,23 +1650,673 @@ def parse_dict(field: strictus_field, raw_value) -> Dict:
     return value
 
 
+def _construct_list(field: strictus_field, raw_value) -> List:
+    """
+    The equivalent of parse_list for a strictus container field that doesn't parse the items
+    (see strictus.construct).
+    """
+    return field.item_type.parse_many(raw_value, container_cls=field.list_container_cls, trusted=True)
+
+
+def _construct_dict(field: strictus_field, raw_value) -> Dict:
+    """
+    The equivalent of parse_dict for a strictus container field that doesn't parse the items
+    (see strictus.construct).
+    """
+    items = zip(raw_value.keys(), field.item_type.parse_many(raw_value.values(), trusted=True))
+    if field.dict_container_cls is dict:
+        return dict(items)
+    value = field.dict_container_cls()
+    for item_key, item_value in items:
+        value[item_key] = item_value
+    return value
+
+
 def parse_value(field: strictus_field, raw_value) -> Any:
-    if raw_value is None or field.type is Any:
-        return raw_value
-    elif field.is_strictus:
-        return field.type(raw_value)
+    return field.coerce(raw_value)
+
+
+# Maximum number of strings in the intern table and maximum length of interned strings.
+# Strings that don't fit are used as they are.
+INTERN_TABLE_SIZE = 100000
+INTERN_MAX_LENGTH = 100
+
+_interned_strings: Dict[str, str] = {}
+
+
+def intern_string(value: str) -> str:
+    """
+    Returns the string from the intern table that is equal to value, adding value to the table
+    if there is none, so that equal strings of fields with intern enabled share one object.
+    Unlike sys.intern, the table is bounded by INTERN_TABLE_SIZE, and strings longer than
+    INTERN_MAX_LENGTH, which are unlikely to repeat, are not interned.
+    """
+    interned = _interned_strings.get(value)
+    if interned is not None:
+        return interned
+    if len(value) <= INTERN_MAX_LENGTH and len(_interned_strings) < INTERN_TABLE_SIZE:
+        _interned_strings[value] = value
+    return value
+
+
+def _coerce_as_is(raw_value):
+    return raw_value
+
+
+def _intern_str(raw_value) -> str:
+    return intern_string(str(raw_value))
+
+
+def _get_parser(field: strictus_field) -> Tuple[Optional[Callable], bool]:
+    """
+    Returns the function which parses raw values of the field other than None, or None if they
+    are used as they are, and whether it takes the field as its first argument.
+    This is the one place that maps field types to parsing, for strictus_field.coerce
+    and for the generated initialisers alike.
+    """
+    field_type = field.type
+    if field_type is Any:
+        return None, False
+    elif field_type is str and field.intern:
+        return _intern_str, False
+    elif field.is_strictus or field_type in (bool, int, float, str):
+        return field_type, False
+    elif field.is_strictus_container or (
+        (field.is_list or field.is_dict) and field.item_type in (bool, int, float, str)
+    ):
+        return (parse_list if field.is_list else parse_dict), True
+    return None, False
+
+
+def _resolve_coercer(field: strictus_field) -> Callable[[Any], Any]:
+    """
+    Returns the function which parses raw values of the field (see strictus_field.coerce).
+    The field type is inspected once, here, rather than on every assignment.
+    """
+    parser, takes_field = _get_parser(field)
+    if parser is None:
+        return _coerce_as_is
+    elif takes_field:
+        def coerce(raw_value):
+            return raw_value if raw_value is None else parser(field, raw_value)
+        return coerce
+
+    def coerce(raw_value):
+        return raw_value if raw_value is None else parser(raw_value)
+    return coerce
+
+
+def _compile_on_first_use(cls: Type[strictus], attr_name: str, compiler: Callable) -> Callable:
+    """
+    Returns a placeholder for a generated class-level function which, when first called,
+    compiles the real function, installs it on the class under attr_name, and delegates to it.
+    """
+    compiled = None
+
+    def compile_and_call(*args, **kwargs):
+        nonlocal compiled
+        if compiled is None:
+            compiled = compiler(cls)
+            setattr(cls, attr_name, staticmethod(compiled))
+        return compiled(*args, **kwargs)
+    return compile_and_call
+
+
+def _compile_function(name: str, lines: List[str], namespace: Dict[str, Any], filename: str) -> Callable:
+    source = "\n".join(lines) + "\n"
+    exec(compile(source, filename, "exec"), namespace)
+    return namespace[name]
+
+
+def _compile_store(cls: Type[strictus], attr_name: str, value: str, namespace: Dict[str, Any]) -> str:
+    """
+    Returns source of a statement which stores value in the attribute of instance
+    bypassing __setattr__.
+    """
+    if get_schema(cls).slots:
+        setter = f"_set{_slot_name(attr_name)}"
+        namespace[setter] = cls._strictus_storage_cls.__dict__[_slot_name(attr_name)].__set__
+        return f"{setter}(instance, {value})"
+    return f"instance_dict[{attr_name!r}] = {value}"
+
+
+def _compile_load(cls: Type[strictus], attr_name: str, namespace: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Returns source of an expression which loads the attribute of instance,
+    and the name of the exception it raises if the attribute is not set.
+    """
+    if get_schema(cls).slots:
+        getter = f"_get{_slot_name(attr_name)}"
+        namespace[getter] = cls._strictus_storage_cls.__dict__[_slot_name(attr_name)].__get__
+        return f"{getter}(instance)", "AttributeError"
+    return f"instance_dict[{attr_name!r}]", "KeyError"
+
+
+def _compile_instance_dict(cls: Type[strictus]) -> List[str]:
+    if get_schema(cls).slots:
+        return []
+    return ["    instance_dict = instance.__dict__"]
+
+
+def _compile_coercion(field: strictus_field, value: str, namespace: Dict[str, Any], prefix: str) -> str:
+    """
+    Returns source of an expression that is equivalent to parse_value(field, value)
+    for the current type of the field, registering in namespace whatever it references.
+    """
+    parser, takes_field = _get_parser(field)
+    if parser is None:
+        return value
+    namespace[f"{prefix}parse"] = parser
+    if takes_field:
+        namespace[f"{prefix}field"] = field
+        return f"{value} if {value} is None else {prefix}parse({prefix}field, {value})"
+    return f"{value} if {value} is None else {prefix}parse({value})"
+
+
+def _compile_trusted_coercion(field: strictus_field, value: str, namespace: Dict[str, Any], prefix: str) -> str:
+    """
+    Returns source of an expression which turns value, a valid value of the field,
+    into what parse_value(field, value) would return, without parsing (see strictus.construct).
+    """
+    if field.is_strictus:
+        namespace[f"{prefix}type"] = field.type
+        return f"{prefix}type.construct({value}) if type({value}) is dict else {value}"
     elif field.is_strictus_container:
-        if field.is_list:
-            return parse_list(field=field, raw_value=raw_value)
-        elif field.is_dict:
-            return parse_dict(field=field, raw_value=raw_value)
+        if field.is_list and issubclass(field.list_container_cls, LazyStrictusList):
+            return _compile_coercion(field, value, namespace, prefix)
+        namespace[f"{prefix}field"] = field
+        constructor = "_construct_list" if field.is_list else "_construct_dict"
+        return f"{value} if {value} is None else {constructor}({prefix}field, {value})"
+    elif field.is_list or field.is_dict:
+        namespace[f"{prefix}field"] = field
+        if field.intern:
+            return f"{value} if {value} is None else {prefix}field.coerce({value})"
+        container_cls = f"{prefix}field.{'list' if field.is_list else 'dict'}_container_cls"
+        return f"{value} if type({value}) is {container_cls} else {prefix}field.coerce({value})"
+    elif field.type is str and field.intern:
+        namespace["intern_string"] = intern_string
+        return f"intern_string({value}) if type({value}) is str else {value}"
+    return value
+
+
+def _compile_initialiser(
+    cls: Type[strictus],
+    view: bool = None,
+    trusted: bool = False,
+) -> Callable[[strictus, Dict], None]:
+    """
+    Generates the function which initialises a newly allocated instance of cls from
+    a dictionary of values. This is what strictus.__new__ delegates to.
+
+    The schema is walked once, when the function is generated, so that the required,
+    non-init, default, default_factory and init_all branches, as well as the parsing
+    of each field's value, end up as straight-line code specific to cls.
+
+    If view is True, or if it's not set and cls has Meta.lazy set to True, the function
+    initialises a view (see strictus.view) -- fields present in values are only checked,
+    and a reference to values is stored in the instance to be parsed on first access.
+
+    If trusted is True, values are not parsed (see strictus.construct).
+    """
+    schema = get_schema(cls)
+    if view is None:
+        view = schema.lazy
+    cls_name = cls.__name__
+
+    namespace = {
+        "parse_list": parse_list,
+        "parse_dict": parse_dict,
+        "_construct_list": _construct_list,
+        "_construct_dict": _construct_dict,
+        "_setattr": setattr,
+        "_field_names": frozenset(schema),
+        "_forbidden_attributes": schema.forbidden_attributes if schema.additional_attributes else (),
+    }
+
+    # A custom __setattr__ or field descriptor must see every assignment,
+    # so values are then set the same way as by a user.
+    default_setattr = cls.__setattr__ is strictus.__setattr__
+
+    def set_flag(name, value):
+        if default_setattr:
+            return _compile_store(cls, name, value, namespace)
+        return f"instance.{name} = {value}"
+
+    lines = [
+        "def initialise(instance, values):",
+        *_compile_instance_dict(cls),
+        "    " + set_flag("_strictus_initialising", "True"),
+        "    matched = 0",
+    ]
+    if schema.track_changes:
+        namespace["_adopt"] = _adopt
+        lines.append("    " + set_flag("_strictus_dict_cache", "None"))
+        lines.append("    " + set_flag("_strictus_parents", "None"))
+    if schema.frozen:
+        lines.append("    " + set_flag("_strictus_hash", "None"))
+    if schema.cached_fields:
+        lines.append("    " + set_flag("_strictus_cache", "None"))
+
+    for i, field in enumerate(schema.values()):
+        prefix = f"_f{i}_"
+        namespace[f"{prefix}field"] = field
+
+        direct = default_setattr and not field.getter and type(field).__set__ is strictus_field.__set__
+
+        def assignment(value, parsed=False, from_values=False, field=field, prefix=prefix, direct=direct):
+            if not direct:
+                return f"_setattr(instance, {field.name!r}, {value})"
+            if trusted and from_values:
+                value = _compile_trusted_coercion(field, value, namespace, prefix)
+            elif not parsed:
+                value = _compile_coercion(field, value, namespace, prefix)
+            store = _compile_store(cls, field.default_attr_name, value, namespace)
+            if field.track_changes and field.type not in (bool, int, float, str):
+                load, _ = _compile_load(cls, field.default_attr_name, namespace)
+                store += f"; _adopt(instance, {load})"
+            return store
+
+        lines.append(f"    if {field.name!r} in values:")
+        if field.init:
+            if not view:
+                lines.append(f"        value = values[{field.name!r}]")
+                lines.append(f"        {assignment('value', from_values=True)}")
+            lines.append("        matched += 1")
         else:
-            raise NotImplementedError()
-    elif field.type in (bool, int, float, str):
-        return field.type(raw_value)
-    elif field.is_list and field.item_type in (bool, int, float, str):
-        return parse_list(field=field, raw_value=raw_value)
-    elif field.is_dict and field.item_type in (bool, int, float, str):
-        return parse_dict(field=field, raw_value=raw_value)
+            message = f"{cls_name}.{field.name} is a non-init field"
+            lines.append(f"        raise TypeError({message!r})")
+
+        if field.required:
+            lines.append("    else:")
+            message = f"{cls_name} field {field.name!r} is required"
+            lines.append(f"        raise ValueError({message!r})")
+        elif field.lazy_default:
+            # The default is created on first access, see strictus_field._materialise_default
+            pass
+        elif field.default_factory is not _NOT_SET:
+            lines.append("    else:")
+            namespace[f"{prefix}default_factory"] = field.default_factory
+            lines.append(f"        value = {prefix}default_factory()")
+            lines.append(f"        {assignment('value')}")
+        elif field.default is not _NOT_SET:
+            lines.append("    else:")
+            namespace[f"{prefix}default"] = field.default
+            # Parsing None or a primitive of the exact field type would return the default as is
+            parsed = field.default is None or (
+                field.type in (bool, int, float, str) and type(field.default) is field.type
+            )
+            lines.append(f"        {assignment(f'{prefix}default', parsed=parsed)}")
+        elif field.init and schema.init_all:
+            lines.append("    else:")
+            lines.append(f"        {assignment('None', parsed=True)}")
+
+    if view:
+        lines.append("    if matched:")
+        lines.append("        " + set_flag("_strictus_raw", "values"))
+
+    if schema.additional_attributes or not schema.slots:
+        lines.append("    " + set_flag("_strictus_additional_attributes", "{}"))
+    lines.append("    if matched != len(values):")
+    lines.append("        keys = set(values).difference(_field_names)")
+    if schema.additional_attributes:
+        lines.append("        for k in keys:")
+        lines.append("            if k in _forbidden_attributes:")
+        lines.append(f"                raise TypeError(f'{cls_name} forbids additional field {{k!r}}')")
+        lines.append("            instance._set_additional_attribute(k, values[k])")
+    else:
+        lines.append(f"        raise TypeError(f'Unexpected keyword arguments supplied to {cls_name}: {{keys}}')")
+
+    # Call the post init hook BEFORE sealing the read-only attributes.
+    # Make sure the base _post_init_ was reached.
+    # If it wasn't, user has failed to call super()._post_init_
+    message = f"Did you forget to call super()._post_init_() in {cls}._post_init_?"
+    lines.extend([
+        "    " + set_flag("_strictus_base_post_init_reached", "False"),
+        "    instance._post_init_()",
+        "    if not instance._strictus_base_post_init_reached:",
+        f"        raise RuntimeError({message!r})",
+        "    " + set_flag("_strictus_initialising", "False"),
+    ])
+
+    filename = f"<strictus {'trusted ' if trusted else ''}initialiser {cls.__qualname__}>"
+    return _compile_function("initialise", lines, namespace, filename)
+
+
+def _compile_view_initialiser(cls: Type[strictus]) -> Callable[[strictus, Mapping], None]:
+    schema = get_schema(cls)
+    # Slotted stricti only have a slot for the raw mapping if they are lazy
+    return _compile_initialiser(cls, view=schema.lazy or not schema.slots)
+
+
+def _compile_trusted_initialiser(cls: Type[strictus]) -> Callable[[strictus, Dict], None]:
+    return _compile_initialiser(cls, view=False, trusted=True)
+
+
+def _known_attribute_names(schema: StrictusSchema) -> frozenset:
+    """
+    Returns the names of the attributes which instances with the schema may have in their __dict__
+    and which aren't other attributes, such as those set in _post_init_.
+    """
+    return frozenset(
+        [field.default_attr_name for field in schema.values() if not field.getter] +
+        list(_FLAG_ATTRIBUTES) + list(_CHANGE_TRACKING_ATTRIBUTES)
+    )
 
-    return raw_value
+
+def _other_attributes(instance_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns the attributes in the __dict__ of a strictus that aren't its fields or internal ones.
+    """
+    return {k: v for k, v in instance_dict.items() if not k.startswith("_strictus")}
+
+
+def _compile_state_getter(cls: Type[strictus]) -> Callable[[strictus], Tuple[Tuple, Optional[Dict], Optional[Dict]]]:
+    """
+    Generates the function which strictus.__getstate__ and __reduce_ex__ delegate to.
+    It returns the values of fields that aren't getters, the additional attributes,
+    and other instance attributes, each as None if there are none.
+    """
+    schema = get_schema(cls)
+    fields = [field for field in schema.values() if not field.getter]
+    namespace = {
+        "NOT_SET": _NOT_SET,
+        "_known_attributes": _known_attribute_names(schema),
+        "_other_attributes": _other_attributes,
+    }
+    lines = ["def get_state(instance):"]
+    if schema.slots:
+        if schema.lazy:
+            lines.extend([
+                "    if getattr(instance, '_strictus_raw', None) is not None:",
+                "        instance._strictus_parse_raw()",
+            ])
+        values = [f"getattr(instance, {_slot_name(field.default_attr_name)!r}, NOT_SET)" for field in fields]
+        other_attributes = "None"
+    else:
+        lines.extend([
+            "    instance_dict = instance.__dict__",
+            "    if instance_dict.get('_strictus_raw') is not None:",
+            "        instance._strictus_parse_raw()",
+            "    get = instance_dict.get",
+            # Other attributes are rare, so they are looked for only if the instance has unknown attributes
+            "    other_attributes = None",
+            "    if not _known_attributes.issuperset(instance_dict):",
+            "        other_attributes = _other_attributes(instance_dict) or None",
+        ])
+        values = [f"get({field.default_attr_name!r}, NOT_SET)" for field in fields]
+        other_attributes = "other_attributes"
+    additional_attributes = "None"
+    if schema.additional_attributes:
+        additional_attributes = "instance._strictus_additional_attributes or None"
+    values = "".join(f"{value}, " for value in values)
+    lines.append(f"    return ({values}), {additional_attributes}, {other_attributes}")
+    return _compile_function("get_state", lines, namespace, f"<strictus state getter {cls.__qualname__}>")
+
+
+def _compile_state_restoration(cls: Type[strictus], namespace: Dict[str, Any]) -> List[str]:
+    """
+    Returns source of the statements which restore an allocated instance of cls from values,
+    additional_attributes and other_attributes, the parts of the state returned by
+    strictus.__getstate__, registering in namespace whatever they reference.
+    """
+    schema = get_schema(cls)
+    fields = [field for field in schema.values() if not field.getter]
+    namespace.update({
+        "NOT_SET": _NOT_SET,
+        "_adopt": _adopt,
+        "_tracked_containers": (TrackedList, TrackedDict),
+    })
+    lines = _compile_instance_dict(cls)
+    if fields:
+        lines.append(f"    {''.join(f'v{i}, ' for i in range(len(fields)))}= values")
+    for i, field in enumerate(fields):
+        lines.append(f"    if v{i} is not NOT_SET:")
+        if schema.track_changes:
+            lines.extend([
+                f"        if isinstance(v{i}, _tracked_containers) and v{i}.owner is not None:",
+                "            # Containers of a shallow copy can only notify one strictus of changes",
+                f"            v{i} = v{i}.__class__(v{i})",
+            ])
+        lines.append("        " + _compile_store(cls, field.default_attr_name, f"v{i}", namespace))
+    if not schema.slots:
+        lines.extend([
+            "    if other_attributes:",
+            "        instance_dict.update(other_attributes)",
+        ])
+    flags = [("_strictus_initialising", "False"), ("_strictus_base_post_init_reached", "True")]
+    if schema.additional_attributes or not schema.slots:
+        flags.append(("_strictus_additional_attributes", "dict(additional_attributes or ())"))
+    if schema.frozen:
+        flags.append(("_strictus_hash", "None"))
+    if schema.cached_fields:
+        flags.append(("_strictus_cache", "None"))
+    if schema.track_changes:
+        flags.extend([("_strictus_dict_cache", "None"), ("_strictus_parents", "None")])
+    for name, value in flags:
+        lines.append("    " + _compile_store(cls, name, value, namespace))
+    if schema.track_changes:
+        for i, field in enumerate(fields):
+            lines.append(f"    _adopt(instance, v{i})")
+    return lines
+
+
+def _compile_state_setter(cls: Type[strictus]) -> Callable[[strictus, Tuple, Optional[Dict], Optional[Dict]], None]:
+    """
+    Generates the function which restores an allocated instance of cls from the state
+    returned by strictus.__getstate__, without parsing values or calling _post_init_.
+    """
+    namespace = {}
+    lines = [
+        "def set_state(instance, values, additional_attributes, other_attributes):",
+        *_compile_state_restoration(cls, namespace),
+    ]
+    return _compile_function("set_state", lines, namespace, f"<strictus state setter {cls.__qualname__}>")
+
+
+def _compile_state_loader(cls: Type[strictus]) -> Callable[[Iterable[Optional[Tuple]]], List[Optional[strictus]]]:
+    """
+    Generates the function which creates instances of cls from a batch of states returned
+    by strictus.__getstate__, or None for None, in one loop rather than one call per instance.
+    """
+    namespace = {"storage_cls": cls._strictus_storage_cls, "new": object.__new__}
+    lines = [
+        "def load_states(states):",
+        "    instances = []",
+        "    append = instances.append",
+        "    for state in states:",
+        "        if state is None:",
+        "            append(None)",
+        "            continue",
+        "        instance = new(storage_cls)",
+        "        values, additional_attributes, other_attributes = state",
+        *("    " + line for line in _compile_state_restoration(cls, namespace)),
+        "        append(instance)",
+        "    return instances",
+    ]
+    return _compile_function("load_states", lines, namespace, f"<strictus state loader {cls.__qualname__}>")
+
+
+def _compile_comparator(cls: Type[strictus]) -> Callable[[strictus, strictus], bool]:
+    """
+    Generates the function which strictus.__eq__ of frozen stricti delegates to. It compares
+    cached hashes, if both instances have them, and then values of fields, additional attributes
+    and other attributes, such as those set in _post_init_, like __eq__ of other stricti does.
+    """
+    schema = get_schema(cls)
+
+    namespace = {
+        "NOT_SET": _NOT_SET,
+        "_get_raw": _get_raw,
+        "_known_attributes": _known_attribute_names(schema),
+        "_other_attributes": _other_attributes,
+    }
+
+    def load(instance, attr_name):
+        if schema.slots:
+            return f"getattr({instance}, {_slot_name(attr_name)!r}, NOT_SET)"
+        return f"{instance}.__dict__.get({attr_name!r}, NOT_SET)"
+
+    lines = [
+        "def equals(instance, other):",
+        "    if type(other) is not type(instance):",
+        "        return False",
+    ]
+    if schema.lazy or not schema.slots:
+        lines.extend([
+            "    for x in (instance, other):",
+            "        if _get_raw(x) is not None:",
+            "            x._strictus_parse_raw()",
+        ])
+    lines.extend([
+        "    instance_hash = instance._strictus_hash",
+        "    other_hash = other._strictus_hash",
+        "    if instance_hash is not None and other_hash is not None and instance_hash != other_hash:",
+        "        return False",
+    ])
+    for field in schema.values():
+        if not field.getter:
+            attr_name = field.default_attr_name
+            lines.append(f"    if {load('instance', attr_name)} != {load('other', attr_name)}:")
+            lines.append("        return False")
+    if not schema.slots:
+        lines.extend([
+            "    instance_dict = instance.__dict__",
+            "    other_dict = other.__dict__",
+            "    if not (_known_attributes.issuperset(instance_dict) and _known_attributes.issuperset(other_dict)):",
+            "        if _other_attributes(instance_dict) != _other_attributes(other_dict):",
+            "            return False",
+        ])
+    if schema.additional_attributes:
+        lines.append("    return instance._strictus_additional_attributes == other._strictus_additional_attributes")
+    else:
+        lines.append("    return True")
+
+    return _compile_function("equals", lines, namespace, f"<strictus comparator {cls.__qualname__}>")
+
+
+def _compile_nested_serialisation(
+    strictus_type: Type[strictus],
+    type_name: str,
+    value: str,
+    fallback: str,
+    namespace: Dict[str, Any],
+) -> str:
+    """
+    Returns source of an expression that serialises a value which is expected to be
+    a strictus of strictus_type, calling the generated serialiser of that type directly
+    unless to_dict has been overridden, and registers the type in namespace as type_name.
+    """
+    if strictus_type.to_dict is not strictus.to_dict:
+        return fallback
+    # Instances of slotted stricti are of the storage class generated for them. A deferred schema
+    # isn't built just for this, and instances of a deferred slotted type take the fallback.
+    storage_cls = strictus_type.__dict__.get("_strictus_storage_cls")
+    namespace[type_name] = strictus_type if isinstance(storage_cls, _DeferredSchemaAttribute) else storage_cls
+    return f"{type_name}._strictus_serialiser({value}) if type({value}) is {type_name} else {fallback}"
+
+
+def _compile_serialiser(cls: Type[strictus]) -> Callable[[strictus], Dict]:
+    """
+    Generates the function which strictus.to_dict delegates to.
+
+    Fields excluded from the dict output are left out of the generated code, and
+    nested stricti of the exact type declared in the schema are serialised by calling
+    their own generated serialiser directly.
+    """
+    schema = get_schema(cls)
+
+    namespace = {
+        "NOT_SET": _NOT_SET,
+        "serialise_value": serialise_value,
+        "_serialise_container_item": _serialise_container_item,
+    }
+
+    lines = [
+        "def serialise(instance):",
+        *_compile_instance_dict(cls),
+    ]
+    if schema.track_changes:
+        load, _ = _compile_load(cls, "_strictus_dict_cache", namespace)
+        lines.extend([
+            f"    dct = {load}",
+            "    if dct is not None:",
+            "        return dct",
+        ])
+    lines.append("    dct = {}")
+
+    for i, field in enumerate(schema.values()):
+        if not field.dict:
+            continue
+
+        prefix = f"_f{i}_"
+        namespace[f"{prefix}field"] = field
+
+        if field.getter or type(field).__get__ is not strictus_field.__get__:
+            # Virtual fields and custom descriptors go through the generic code path
+            if type(field).__get__ is strictus_field.__get__ and field.cached:
+                value = f"{prefix}field._get_cached(instance)"
+            elif type(field).__get__ is strictus_field.__get__:
+                namespace[f"{prefix}getter"] = field.getter
+                value = f"{prefix}getter(instance)"
+            else:
+                value = f"getattr(instance, {field.name!r})"
+            lines.extend([
+                "    try:",
+                f"        value = {value}",
+                "    except AttributeError:",
+                "        pass",
+                "    else:",
+                f"        dct[{field.name!r}] = serialise_value({prefix}field, value)",
+            ])
+            continue
+
+        if field.is_strictus:
+            serialised = _compile_nested_serialisation(
+                field.type, f"{prefix}type", "value", "value.to_dict()", namespace,
+            )
+            expression = f"None if value is None else {serialised}"
+        elif field.is_strictus_container:
+            serialised = _compile_nested_serialisation(
+                field.item_type, f"{prefix}type", "item", f"_serialise_container_item({prefix}field, item)", namespace,
+            )
+            if field.is_list:
+                expression = f"[None if item is None else {serialised} for item in value]"
+                if issubclass(field.list_container_cls, LazyStrictusList):
+                    namespace["LazyStrictusList"] = LazyStrictusList
+                    expression = f"value.to_dicts() if isinstance(value, LazyStrictusList) else {expression}"
+            else:
+                expression = f"{{key: None if item is None else {serialised} for key, item in value.items()}}"
+            expression = f"None if value is None else {expression}"
+        elif field.type in (bool, int, float, str):
+            # Parsing guarantees the value is None or of the exact type
+            expression = "value"
+        else:
+            expression = f"serialise_value({prefix}field, value)"
+
+        # Fields of strictus views that haven't been read yet are parsed from the raw mapping
+        load, exception = _compile_load(cls, field.default_attr_name, namespace)
+        lines.extend([
+            "    try:",
+            f"        value = {load}",
+            f"    except {exception}:",
+            f"        value = {prefix}field._parse_raw_value(instance)",
+            "        if value is not NOT_SET:",
+            f"            dct[{field.name!r}] = {expression}",
+        ])
+        if field.lazy_default:
+            lines.extend([
+                "        else:",
+                f"            dct[{field.name!r}] = {prefix}field._serialised_default(instance)",
+            ])
+        lines.extend([
+            "    else:",
+            f"        dct[{field.name!r}] = {expression}",
+        ])
+
+    if schema.additional_attributes:
+        lines.append("    dct.update(instance._strictus_additional_attributes)")
+    if schema.track_changes:
+        lines.append("    " + _compile_store(cls, "_strictus_dict_cache", "dct", namespace))
+    lines.append("    return dct")
+
+    return _compile_function("serialise", lines, namespace, f"<strictus serialiser {cls.__qualname__}>")
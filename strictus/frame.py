@@ -0,0 +1,340 @@
+"""
+Columnar storage of large numbers of records of the same strictus type.
+
+    from strictus.frame import StrictusFrame
+
+    frame = StrictusFrame[Item](raw_items)
+    frame[0].name                    # a row behaves like an Item for reading
+    frame.column("price")            # array('d', [...])
+    frame.filter(active=True)        # a new frame with the matching rows
+    frame.to_columns()               # {"id": [...], "price": [...], ...}
+"""
+import weakref
+from array import array
+from typing import Any, Callable, ClassVar, Dict, Iterable, Iterator, List, Mapping, Optional, Type, Union
+
+from strictus.core import get_schema, is_strictus, serialise_value, strictus
+
+_NOT_SET = strictus.NOT_SET
+
+# Numeric field types stored in arrays, with the typecode of the array
+_ARRAY_TYPECODES = {
+    int: "q",
+    float: "d",
+}
+
+
+class StrictusFrame:
+    """
+    A sequence of records of one strictus type which stores the value of each field
+    in a column -- an array for int and float fields, a list otherwise -- instead of
+    creating a strictus instance per record.
+
+    Records are parsed the way the strictus type parses them: values are parsed per field,
+    required, non-init and unexpected fields are checked, and defaults are set.
+    _post_init_ is not called because no instance is created.
+
+    Indexing a frame returns a StrictusRow, a lightweight view of the record which behaves
+    like an instance of the strictus type for reading attributes, to_dict() and equality.
+    """
+
+    item_type: ClassVar[Optional[Type[strictus]]] = None
+
+    # Frame classes by item type. Both are referenced weakly, because a frame class references its
+    # item type, so that neither is kept alive by the cache, e.g. for strictus classes defined in functions.
+    _frame_classes: ClassVar["weakref.WeakKeyDictionary[Type[strictus], weakref.ref]"] = weakref.WeakKeyDictionary()
+
+    def __class_getitem__(cls, item_type: Type[strictus]) -> Type["StrictusFrame"]:
+        if not (isinstance(item_type, type) and is_strictus(item_type)):
+            raise TypeError(f"Expected a strictus class, got {item_type!r}")
+        frame_cls_ref = cls._frame_classes.get(item_type)
+        frame_cls = None if frame_cls_ref is None else frame_cls_ref()
+        if frame_cls is None:
+            frame_cls = type(f"{cls.__name__}[{item_type.__name__}]", (cls,), {
+                "item_type": item_type,
+                "__module__": cls.__module__,
+            })
+            cls._frame_classes[item_type] = weakref.ref(frame_cls)
+        return frame_cls
+
+    def __init__(self, records: Iterable[Union[Dict, strictus]] = ()):
+        if self.item_type is None:
+            raise TypeError(f"{self.__class__.__name__} has no item type, use {self.__class__.__name__}[Model]")
+
+        schema = get_schema(self.item_type)
+        self._fields = [field for field in schema.values() if not field.getter]
+        self.columns: Dict[str, Union[List, array]] = {field.name: [] for field in self._fields}
+        # Additional attributes of each record, or None if it has none
+        self.additional_attributes: List[Optional[Dict[str, Any]]] = []
+
+        self.extend(records)
+        for name, column in self.columns.items():
+            self.columns[name] = _compact(schema[name].type, column)
+
+    def _parse_record(self, record: Union[Mapping, strictus]) -> Iterator[Any]:
+        """
+        Yields the value of each field of the record, in the order of self._fields, and
+        lastly the additional attributes of the record or None.
+        """
+        if isinstance(record, self.item_type):
+            for field in self._fields:
+                yield getattr(record, field.name, _NOT_SET)
+            additional_attributes = getattr(record, "_strictus_additional_attributes", None)
+            yield dict(additional_attributes) if additional_attributes else None
+            return
+
+        if not isinstance(record, Mapping):
+            raise ValueError(f"Expected a dictionary or a {self.item_type.__name__}, got a {type(record)}")
+
+        schema = get_schema(self.item_type)
+        cls_name = self.item_type.__name__
+        matched = 0
+        for field in self._fields:
+            if field.name in record:
+                if not field.init:
+                    raise TypeError(f"{cls_name}.{field.name} is a non-init field")
+                matched += 1
+                yield field.coerce(record[field.name])
+            elif field.required:
+                raise ValueError(f"{cls_name} field {field.name!r} is required")
+            elif field.default_factory is not _NOT_SET:
+                yield field.coerce(field.default_factory())
+            elif field.default is not _NOT_SET:
+                yield field.coerce(field.default)
+            elif field.init and schema.init_all:
+                yield None
+            else:
+                yield _NOT_SET
+
+        unexpected = {}
+        if matched != len(record):
+            for k in record:
+                if k in schema:
+                    if schema[k].getter:
+                        raise TypeError(f"{cls_name}.{k} is a non-init field")
+                else:
+                    unexpected[k] = record[k]
+        if unexpected and not schema.additional_attributes:
+            raise TypeError(f"Unexpected keyword arguments supplied to {cls_name}: {set(unexpected)}")
+        for k in unexpected:
+            if k in schema.forbidden_attributes:
+                raise TypeError(f"{cls_name} forbids additional field {k!r}")
+        yield unexpected or None
+
+    def append(self, record: Union[Dict, strictus]):
+        """
+        Appends a record, a dictionary or an instance of the strictus type, to the frame.
+        """
+        *values, additional_attributes = self._parse_record(record)
+        for field, value in zip(self._fields, values):
+            column = self.columns[field.name]
+            try:
+                column.append(value)
+            except (TypeError, OverflowError):
+                # An array column that can't hold the value, e.g. None, is turned into a list
+                column = self.columns[field.name] = column.tolist()
+                column.append(value)
+        self.additional_attributes.append(additional_attributes)
+
+    def extend(self, records: Iterable[Union[Dict, strictus]]):
+        for record in records:
+            self.append(record)
+
+    def __len__(self) -> int:
+        return len(self.additional_attributes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(range(*index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("frame index out of range")
+        return StrictusRow(self, index)
+
+    def __iter__(self) -> Iterator["StrictusRow"]:
+        for index in range(len(self)):
+            yield StrictusRow(self, index)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} of {len(self)} rows>"
+
+    def column(self, name: str) -> Union[List, array]:
+        """
+        Returns the column of values of the field, with NOT_SET for records in which
+        the field is not set. It must not be modified.
+        """
+        return self.columns[name]
+
+    def take(self, indexes: Iterable[int]) -> "StrictusFrame":
+        """
+        Returns a new frame of the rows at the indexes, in the order of the indexes.
+        """
+        indexes = list(indexes)
+        frame = self.__class__.__new__(self.__class__)
+        frame._fields = self._fields
+        frame.columns = {}
+        for name, column in self.columns.items():
+            values = [column[i] for i in indexes]
+            frame.columns[name] = array(column.typecode, values) if isinstance(column, array) else values
+        frame.additional_attributes = [self.additional_attributes[i] for i in indexes]
+        return frame
+
+    def filter(self, **conditions: Union[Any, Callable[[Any], bool]]) -> "StrictusFrame":
+        """
+        Returns a new frame of the rows whose field values match all conditions, each of which
+        is either a value that the field value must be equal to, or a function which is passed
+        the field value and returns True if the row matches.
+
+            frame.filter(active=True, price=lambda price: price > 10)
+
+        The conditions are evaluated column by column, without creating rows.
+        """
+        indexes = range(len(self))
+        for name, condition in conditions.items():
+            column = self.columns[name]
+            if callable(condition):
+                indexes = [i for i in indexes if column[i] is not _NOT_SET and condition(column[i])]
+            else:
+                indexes = [i for i in indexes if column[i] == condition]
+        return self.take(indexes)
+
+    def to_columns(self) -> Dict[str, List]:
+        """
+        Returns the to_dict() representation of the frame by column: a dictionary
+        of lists of serialised values of each field included in to_dict() output.
+        Values of fields that are not set in a record are None.
+        """
+        columns = {}
+        for field in self._fields:
+            if field.dict:
+                columns[field.name] = [
+                    None if value is _NOT_SET else serialise_value(field, value)
+                    for value in self.columns[field.name]
+                ]
+        return columns
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """
+        Returns the to_dict() representation of each row.
+        """
+        return [row.to_dict() for row in self]
+
+    def to_instances(self) -> List[strictus]:
+        """
+        Returns an instance of the strictus type for each row.
+        """
+        return [row.to_instance() for row in self]
+
+
+class StrictusRow:
+    """
+    A view of a row of a StrictusFrame which behaves like an instance of the strictus type
+    of the frame for reading attributes, to_dict() and equality. Getters are called with
+    the row in place of an instance.
+    """
+
+    __slots__ = ("_frame", "_index")
+
+    def __init__(self, frame: StrictusFrame, index: int):
+        self._frame = frame
+        self._index = index
+
+    def __getattr__(self, name):
+        frame = self._frame
+        if name in frame.columns:
+            value = frame.columns[name][self._index]
+            if value is not _NOT_SET:
+                return value
+        else:
+            schema = get_schema(frame.item_type)
+            if name in schema and schema[name].getter:
+                return schema[name].getter(self)
+            additional_attributes = frame.additional_attributes[self._index]
+            if additional_attributes and name in additional_attributes:
+                return additional_attributes[name]
+        raise AttributeError(f"{frame.item_type.__name__} does not have attribute {name}")
+
+    def __setattr__(self, name, value):
+        if name in self.__slots__:
+            return super().__setattr__(name, value)
+        raise AttributeError(f"can't set attribute {name} of a {self.__class__.__name__}")
+
+    def _values(self) -> Iterator[Any]:
+        index = self._index
+        for column in self._frame.columns.values():
+            yield column[index]
+
+    def to_dict(self) -> Dict[str, Any]:
+        dct = {}
+        for field in get_schema(self._frame.item_type).values():
+            if not field.dict:
+                continue
+            try:
+                value = getattr(self, field.name)
+            except AttributeError:
+                continue
+            dct[field.name] = serialise_value(field, value)
+        additional_attributes = self._frame.additional_attributes[self._index]
+        if additional_attributes:
+            dct.update(additional_attributes)
+        return dct
+
+    def to_instance(self) -> strictus:
+        """
+        Returns an instance of the strictus type of the frame with the values of this row.
+        """
+        schema = get_schema(self._frame.item_type)
+        values = {}
+        non_init_values = []
+        for name, value in zip(self._frame.columns, self._values()):
+            if value is _NOT_SET:
+                continue
+            if schema[name].init:
+                values[name] = value
+            else:
+                non_init_values.append((schema[name], value))
+        additional_attributes = self._frame.additional_attributes[self._index]
+        if additional_attributes:
+            values.update(additional_attributes)
+        instance = self._frame.item_type.construct(values)
+        # Values of non-init fields can't be passed to construct() and are stored as they are
+        for field, value in non_init_values:
+            field._store(instance, value)
+        return instance
+
+    def __eq__(self, other):
+        item_type = self._frame.item_type
+        if isinstance(other, StrictusRow):
+            if other._frame.item_type is not item_type:
+                return False
+            other_values = other._values()
+            other_additional_attributes = other._frame.additional_attributes[other._index]
+        elif isinstance(other, item_type) and type(other)._strictus_schema is get_schema(item_type):
+            other_values = (getattr(other, name, _NOT_SET) for name in self._frame.columns)
+            other_additional_attributes = getattr(other, "_strictus_additional_attributes", None)
+        else:
+            return NotImplemented
+        return (
+            all(a == b for a, b in zip(self._values(), other_values)) and
+            (self._frame.additional_attributes[self._index] or {}) == (other_additional_attributes or {})
+        )
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self._index} of {self._frame!r}>"
+
+
+def _compact(field_type: Type, column: List) -> Union[List, array]:
+    """
+    Returns the column as an array if the field is numeric and all values fit in one,
+    and as is otherwise.
+    """
+    typecode = _ARRAY_TYPECODES.get(field_type)
+    if typecode is None:
+        return column
+    try:
+        return array(typecode, column)
+    except (TypeError, OverflowError):
+        return column
@@ -0,0 +1,200 @@
+"""
+Streaming JSON encoding of stricti which walks the schema and emits JSON text in chunks
+of bounded size instead of building the to_dict() output and then the whole string.
+
+    for chunk in json_stream.iter_json_chunks(instance):
+        response.write(chunk)
+
+The output is the same as json.dumps(instance.to_dict(), separators=(",", ":")).
+"""
+import io
+import json
+import math
+import weakref
+from typing import IO, Any, Iterator, List, Tuple, Type
+
+from strictus.containers import LazyStrictusList
+from strictus.core import is_strictus, strictus, strictus_field
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_encode_str = json.encoder.encode_basestring_ascii
+
+# Encodes values whose size is bounded by their type in one go, with the C accelerated encoder
+_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+_PRIMITIVE_TYPES = (bool, int, float, str)
+
+# Number of list items encoded in one go
+_BATCH_SIZE = 100
+
+# For each strictus class, the fields included in to_dict() output with their pre-encoded keys
+# and whether their values are encoded in one go, and whether the whole instance is.
+_json_fields_by_class = weakref.WeakKeyDictionary()
+
+
+def _get_json_fields(cls: Type[strictus]) -> Tuple[List[Tuple[strictus_field, str, bool]], bool]:
+    try:
+        return _json_fields_by_class[cls]
+    except KeyError:
+        pass
+    schema = cls._strictus_schema
+    json_fields = []
+    for field in schema.values():
+        if field.dict:
+            encode_at_once = field.type in _PRIMITIVE_TYPES or (
+                (field.is_list or field.is_dict) and field.item_type in _PRIMITIVE_TYPES and
+                not issubclass(field.list_container_cls, LazyStrictusList)
+            )
+            json_fields.append((field, _encode_str(field.name) + ":", encode_at_once))
+    # Stricti with nothing but primitive fields are small enough to serialise in one go
+    flat = not schema.additional_attributes and all(encode_at_once for _, _, encode_at_once in json_fields)
+    _json_fields_by_class[cls] = json_fields, flat
+    return json_fields, flat
+
+
+def _encode_key(key: Any) -> str:
+    if isinstance(key, str):
+        return _encode_str(key)
+    elif key is True:
+        return '"true"'
+    elif key is False:
+        return '"false"'
+    elif key is None:
+        return '"null"'
+    elif isinstance(key, int):
+        return '"' + int.__repr__(key) + '"'
+    elif isinstance(key, float):
+        return '"' + _encode_float(key) + '"'
+    raise TypeError(f"keys must be str, int, float, bool or None, not {key.__class__.__name__}")
+
+
+def _encode_float(value: float) -> str:
+    if math.isfinite(value):
+        return float.__repr__(value)
+    elif math.isnan(value):
+        return "NaN"
+    return "Infinity" if value > 0 else "-Infinity"
+
+
+def iter_json_fragments(value: Any) -> Iterator[str]:
+    """
+    Yields pieces of the JSON text of value, which may be or contain stricti,
+    in the order they appear in the text.
+    """
+    if value is None:
+        yield "null"
+    elif value is True:
+        yield "true"
+    elif value is False:
+        yield "false"
+    elif isinstance(value, str):
+        yield _encode_str(value)
+    elif isinstance(value, int):
+        yield int.__repr__(value)
+    elif isinstance(value, float):
+        yield _encode_float(value)
+    elif is_strictus(value):
+        if type(value).to_dict is not strictus.to_dict:
+            yield from iter_json_fragments(value.to_dict())
+            return
+        json_fields, flat = _get_json_fields(type(value))
+        if flat:
+            yield _encode(value.to_dict())
+            return
+        yield "{"
+        separator = ""
+        for field, key, encode_at_once in json_fields:
+            try:
+                field_value = getattr(value, field.name)
+            except AttributeError:
+                continue
+            yield separator
+            yield key
+            if encode_at_once:
+                yield _encode(field_value)
+            else:
+                yield from iter_json_fragments(field_value)
+            separator = ","
+        if value._strictus_schema.additional_attributes:
+            for k, v in value._strictus_additional_attributes.items():
+                yield separator
+                yield _encode_key(k) + ":"
+                yield from iter_json_fragments(v)
+                separator = ","
+        yield "}"
+    elif isinstance(value, dict):
+        yield "{"
+        separator = ""
+        for k, v in value.items():
+            yield separator
+            yield _encode_key(k) + ":"
+            yield from iter_json_fragments(v)
+            separator = ","
+        yield "}"
+    elif isinstance(value, (list, tuple, LazyStrictusList)):
+        if isinstance(value, LazyStrictusList):
+            value = value.to_dicts()
+        yield "["
+        separator = ""
+        # Consecutive primitives and flat stricti are encoded in batches, in one go each
+        batch = []
+        for item in value:
+            if item is None or isinstance(item, _PRIMITIVE_TYPES):
+                batch.append(item)
+            elif is_strictus(item) and type(item).to_dict is strictus.to_dict and _get_json_fields(type(item))[1]:
+                batch.append(item.to_dict())
+            else:
+                if batch:
+                    yield separator + _encode(batch)[1:-1]
+                    separator = ","
+                    batch = []
+                yield separator
+                yield from iter_json_fragments(item)
+                separator = ","
+                continue
+            if len(batch) >= _BATCH_SIZE:
+                yield separator + _encode(batch)[1:-1]
+                separator = ","
+                batch = []
+        if batch:
+            yield separator + _encode(batch)[1:-1]
+        yield "]"
+    else:
+        raise TypeError(f"Object of type {value.__class__.__name__} is not JSON serializable")
+
+
+def iter_json_chunks(instance: strictus, chunk_size: int = None) -> Iterator[str]:
+    """
+    Yields the JSON text of the to_dict() representation of instance in chunks of
+    roughly chunk_size characters, encoding the text as it walks the instance.
+    Consecutive list items that are primitives or stricti with primitive fields only
+    are encoded in batches, so a chunk may exceed chunk_size by one such batch.
+    """
+    if chunk_size is None:
+        chunk_size = DEFAULT_CHUNK_SIZE
+    fragments = []
+    size = 0
+    for fragment in iter_json_fragments(instance):
+        fragments.append(fragment)
+        size += len(fragment)
+        if size >= chunk_size:
+            yield "".join(fragments)
+            fragments = []
+            size = 0
+    if fragments:
+        yield "".join(fragments)
+
+
+def write_json(instance: strictus, fp: IO, chunk_size: int = None) -> int:
+    """
+    Writes the JSON text of the to_dict() representation of instance to fp, a text or binary
+    file object (UTF-8 encoded) or anything else with a write() method that accepts bytes,
+    such as a socket file, in chunks. Returns the number of characters written.
+    """
+    binary = not isinstance(fp, io.TextIOBase)
+    count = 0
+    for chunk in iter_json_chunks(instance, chunk_size=chunk_size):
+        fp.write(chunk.encode("utf-8") if binary else chunk)
+        count += len(chunk)
+    return count
@@ -0,0 +1,120 @@
+"""
+Reading and writing stricti as JSON Lines -- one JSON object per line -- in chunks of bounded size,
+optionally compressed with gzip, bz2 or lzma.
+"""
+import contextlib
+import io
+import json
+import os
+from typing import IO, Any, Callable, Iterable, Iterator, Optional, Type
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Compression is inferred from the suffix of the file name if compression="infer"
+COMPRESSION_BY_SUFFIX = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "lzma",
+    ".lzma": "lzma",
+}
+
+
+def _get_opener(compression: str) -> Callable:
+    if compression == "gzip":
+        import gzip
+        return gzip.open
+    elif compression == "bz2":
+        import bz2
+        return bz2.open
+    elif compression == "lzma":
+        import lzma
+        return lzma.open
+    raise ValueError(f"Unsupported compression {compression!r}, expected one of 'gzip', 'bz2', 'lzma'")
+
+
+@contextlib.contextmanager
+def open_jsonl(fp, mode: str, compression: Optional[str] = "infer") -> Iterator[IO]:
+    """
+    Opens fp, a path or a file object, for reading (mode "r") or writing (mode "w").
+
+    A path is opened in binary mode and closed on exit.
+    A file object is used as is, or wrapped in a decompressing / compressing file object
+    if compression is set; the file object itself is never closed.
+    """
+    assert mode in ("r", "w")
+    if isinstance(fp, (str, bytes, os.PathLike)):
+        if compression == "infer":
+            path = os.fsdecode(fp)
+            compression = COMPRESSION_BY_SUFFIX.get(os.path.splitext(path)[1].lower())
+        opener = _get_opener(compression) if compression else open
+        with opener(fp, mode + "b") as f:
+            yield f
+    elif compression and compression != "infer":
+        with _get_opener(compression)(fp, mode + "b") as f:
+            yield f
+    else:
+        yield fp
+
+
+def iter_jsonl(
+    cls,
+    fp,
+    *,
+    compression: Optional[str] = "infer",
+    chunk_size: int = None,
+) -> Iterator[Any]:
+    """
+    Yields instances of the strictus type cls created from JSON Lines read from fp.
+
+    Lines are read and parsed roughly chunk_size bytes at a time so memory use does not
+    depend on the size of the file. Blank lines are skipped.
+    """
+    chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+    loads = json.loads
+    with open_jsonl(fp, "r", compression=compression) as f:
+        while True:
+            lines = f.readlines(chunk_size)
+            if not lines:
+                break
+            yield from cls.parse_many([loads(line) for line in lines if not line.isspace()])
+
+
+def write_jsonl(
+    fp,
+    instances: Iterable[Any],
+    *,
+    compression: Optional[str] = "infer",
+    chunk_size: int = None,
+    cls: Type = None,
+) -> int:
+    """
+    Writes the to_dict() representation of each strictus in instances to fp as a line of JSON,
+    roughly chunk_size characters at a time. Returns the number of lines written.
+    If cls is set, raises TypeError for instances that aren't of the strictus type cls.
+    """
+    chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+    encode = json.JSONEncoder(separators=(",", ":")).encode
+    count = 0
+    with open_jsonl(fp, "w", compression=compression) as f:
+        binary = not isinstance(f, io.TextIOBase)
+
+        def write(lines):
+            chunk = "".join(lines)
+            f.write(chunk.encode("utf-8") if binary else chunk)
+
+        lines = []
+        size = 0
+        for instance in instances:
+            if cls is not None and not isinstance(instance, cls):
+                raise TypeError(f"Expected an instance of {cls.__name__}, got a {type(instance).__name__}")
+            line = encode(instance.to_dict()) + "\n"
+            lines.append(line)
+            size += len(line)
+            count += 1
+            if size >= chunk_size:
+                write(lines)
+                lines = []
+                size = 0
+        if lines:
+            write(lines)
+    return count
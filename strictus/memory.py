@@ -0,0 +1,156 @@
+"""
+Memory footprint of stricti.
+
+    from strictus.memory import memory_report
+
+    report = memory_report(item)  # or memory_report(Item) for an instance with defaults
+    print(report.total, report.fields)
+"""
+import sys
+import types
+import weakref
+from collections.abc import Collection
+from typing import Any, Dict, Iterator, Set, Tuple, Type, Union
+
+from strictus.core import _slot_name, get_schema, is_strictus, strictus, strictus_field
+
+# Objects shared by the whole process which are not attributed to any instance
+_SHARED_OBJECTS = (None, True, False, strictus.NOT_SET)
+
+# Objects which are not followed when measuring deep size
+_OPAQUE_TYPES = (
+    type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType, weakref.ref,
+)
+
+
+class MemoryReport(strictus):
+    """
+    Deep size in bytes of a strictus instance, broken down by where the memory is held.
+    Objects referenced from more than one place are only counted once, in the first
+    place they are encountered in the order of the attributes below.
+    """
+
+    type_name: str
+
+    # The instance itself and its __dict__ (if it has one) which hold references to all
+    # its attributes, or, if the instance is slotted, the slots.
+    storage: int = 0
+
+    # Values of fields other than containers, including nested stricti, by field name
+    fields: Dict[str, int] = strictus_field(default_factory=dict)
+
+    # Values of list, dict and other container fields, including their items, by field name
+    containers: Dict[str, int] = strictus_field(default_factory=dict)
+
+    # The dictionary of additional attributes, including its values
+    additional_attributes: int = 0
+
+    # Internal flags and bookkeeping attributes such as the raw mapping of a view
+    # or the cached to_dict() output of a strictus which tracks changes
+    flags: int = 0
+
+    # Attributes that are neither fields nor internal, e.g. set in _post_init_
+    other: int = 0
+
+    @strictus_field
+    def total(self) -> int:
+        return (
+            self.storage + sum(self.fields.values()) + sum(self.containers.values()) +
+            self.additional_attributes + self.flags + self.other
+        )
+
+
+def memory_report(obj_or_cls: Union[strictus, Type[strictus]]) -> MemoryReport:
+    """
+    Returns the memory report of a strictus instance, or, if passed a strictus class, of
+    an instance of it created with default values (and None for required fields).
+    """
+    if isinstance(obj_or_cls, type):
+        schema = get_schema(obj_or_cls)
+        instance = obj_or_cls({name: None for name, field in schema.items() if field.required})
+    elif is_strictus(obj_or_cls):
+        instance = obj_or_cls
+    else:
+        raise TypeError(f"Expected a strictus or a strictus class, got {type(obj_or_cls)}")
+
+    schema = get_schema(instance)
+    field_names = {}
+    for name, field in schema.items():
+        if not field.getter:
+            field_names[field.default_attr_name] = name
+            field_names[_slot_name(field.default_attr_name)] = name
+
+    seen = {id(instance)}
+    report = MemoryReport(type_name=type(instance).__name__, storage=sys.getsizeof(instance))
+    instance_dict = getattr(instance, "__dict__", None)
+    if instance_dict is not None:
+        seen.add(id(instance_dict))
+        report.storage += sys.getsizeof(instance_dict)
+
+    for attr_name, value in _iter_attributes(instance):
+        size = deep_size(value, seen)
+        if attr_name in field_names:
+            if isinstance(value, Collection) and not isinstance(value, (str, bytes, bytearray)):
+                report.containers[field_names[attr_name]] = size
+            else:
+                report.fields[field_names[attr_name]] = size
+        elif attr_name == "_strictus_additional_attributes":
+            report.additional_attributes = size
+        elif attr_name.startswith("_strictus"):
+            report.flags += size
+        else:
+            report.other += size
+
+    return report
+
+
+def deep_size(obj: Any, seen: Set[int] = None) -> int:
+    """
+    Returns the size in bytes of obj and of all objects reachable from it through containers,
+    attributes in instance __dict__ and slots, skipping the objects whose ids are in seen and adding the ids
+    of the objects counted to seen. Classes, modules, functions and weak references are counted
+    but not followed.
+    """
+    if seen is None:
+        seen = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or any(obj is shared for shared in _SHARED_OBJECTS):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+
+        if isinstance(obj, (str, bytes, bytearray, int, float, complex) + _OPAQUE_TYPES):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        obj_dict = getattr(obj, "__dict__", None)
+        if isinstance(obj_dict, dict) and id(obj_dict) not in seen:
+            # Attribute names are shared by all instances so only the values are followed
+            seen.add(id(obj_dict))
+            size += sys.getsizeof(obj_dict)
+            stack.extend(obj_dict.values())
+        stack.extend(value for _, value in _iter_slots(obj))
+    return size
+
+
+def _iter_attributes(instance: strictus) -> Iterator[Tuple[str, Any]]:
+    instance_dict = getattr(instance, "__dict__", None)
+    if instance_dict is not None:
+        yield from instance_dict.items()
+    yield from _iter_slots(instance)
+
+
+def _iter_slots(obj: Any) -> Iterator[Tuple[str, Any]]:
+    for cls in type(obj).__mro__:
+        for name, member in cls.__dict__.items():
+            if isinstance(member, types.MemberDescriptorType) and name != "__weakref__":
+                try:
+                    yield name, member.__get__(obj, cls)
+                except AttributeError:
+                    pass
@@ -0,0 +1,138 @@
+"""
+Parsing and serialising of large batches of stricti in worker processes.
+
+    orders = Order.parse_many(raw_orders, workers=8)
+    dicts = strictus.to_dicts(orders, workers=8)
+
+Batches are split into chunks which are parsed or serialised in a ProcessPoolExecutor and sent back,
+instances in their compact pickled form (see strictus.__getstate__). When the pool is created for
+the call and processes can be forked, workers inherit the batch and only the bounds of chunks are sent.
+Results are returned in the order of the items, and the first exception raised for any item is raised
+as in the serial case. Batches smaller than min_parallel_size are processed serially because
+starting workers and transferring data costs more than is saved.
+
+The calling process still creates every returned object, so the speedup is bounded by how much
+cheaper unpickling is than parsing: little for flat records of primitives, and more for nested
+stricti, or costly coercion and _post_init_ hooks. See benchmarks/bench_parse_many.py
+
+Strictus classes must be importable by name in worker processes, so classes defined
+in functions can't be used, and _post_init_ hooks run in the worker processes.
+"""
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type, Union
+
+from strictus.core import is_strictus, strictus
+
+DEFAULT_MIN_PARALLEL_SIZE = 10000
+
+# Number of chunks per worker, so that workers which finish early pick up more work
+_CHUNKS_PER_WORKER = 4
+
+# Items of the batch processed by a pool of forked workers created for it, which the workers inherit
+_inherited_items: Optional[Sequence] = None
+
+
+def _parse_chunk(items: List[Optional[Dict]], cls: Type[strictus], trusted: bool) -> List[Optional[Tuple]]:
+    """
+    Returns the states of the instances which cls.parse_many(items, trusted=trusted) returns,
+    and None for None and for instances of subclasses of cls, which were items and are returned as they are.
+    """
+    storage_cls = cls._strictus_storage_cls
+    get_state = cls._strictus_state_getter
+    return [
+        get_state(instance) if type(instance) is storage_cls else None
+        for instance in cls.parse_many(items, trusted=trusted)
+    ]
+
+
+def _serialise_chunk(instances: List[Optional[strictus]]) -> List[Optional[Dict[str, Any]]]:
+    return [None if instance is None else instance.to_dict() for instance in instances]
+
+
+def _process_inherited_chunk(bounds: Tuple[int, int], func: Callable[..., List], *args) -> List:
+    start, stop = bounds
+    return func(_inherited_items[start:stop], *args)
+
+
+def _map_chunks(
+    func: Callable[..., List],
+    items: Sequence,
+    workers: int,
+    executor: Optional[Executor],
+    *args,
+) -> List:
+    """
+    Calls func with chunks of items, and args, in worker processes and returns the concatenated results.
+    """
+    global _inherited_items
+
+    chunk_size = -(-len(items) // (workers * _CHUNKS_PER_WORKER))
+    bounds = [(i, min(i + chunk_size, len(items))) for i in range(0, len(items), chunk_size)]
+    extra_args = [[arg] * len(bounds) for arg in args]
+    if executor is not None:
+        chunks = [items[start:stop] for start, stop in bounds]
+        chunk_results = list(executor.map(func, chunks, *extra_args))
+    elif "fork" in multiprocessing.get_all_start_methods():
+        # Workers are forked when the first chunk is submitted, so they inherit the items
+        # without them being pickled
+        _inherited_items = items
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as executor:
+                chunk_results = list(executor.map(_process_inherited_chunk, bounds, [func] * len(bounds), *extra_args))
+        finally:
+            _inherited_items = None
+    else:
+        chunks = [items[start:stop] for start, stop in bounds]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunk_results = list(executor.map(func, chunks, *extra_args))
+    results = []
+    for chunk_result in chunk_results:
+        results.extend(chunk_result)
+    return results
+
+
+def _is_parallel(size: int, workers: Optional[int], min_parallel_size: Optional[int]) -> bool:
+    if min_parallel_size is None:
+        min_parallel_size = DEFAULT_MIN_PARALLEL_SIZE
+    return workers is not None and workers > 1 and size >= max(min_parallel_size, 2)
+
+
+def parse_many(
+    cls: Type[strictus],
+    items: Iterable[Union[Dict, strictus, None]],
+    workers: int = None,
+    trusted: bool = False,
+    min_parallel_size: int = None,
+    executor: Executor = None,
+) -> List[Optional[strictus]]:
+    """
+    Returns a list of what cls.parse_many(items, trusted=trusted) returns, parsing items
+    in up to workers processes of executor or of a ProcessPoolExecutor created for the call.
+    Instances of cls among items are returned as they are, not copied.
+    """
+    items = items if isinstance(items, list) else list(items)
+    if not _is_parallel(len(items), workers, min_parallel_size):
+        return cls.parse_many(items, trusted=trusted)
+
+    instances = cls._strictus_state_loader(_map_chunks(_parse_chunk, items, workers, executor, cls, trusted))
+    for i, item in enumerate(items):
+        if is_strictus(item) and issubclass(type(item), cls):
+            instances[i] = item
+    return instances
+
+
+def to_dicts(
+    instances: Iterable[Optional[strictus]],
+    workers: int = None,
+    min_parallel_size: int = None,
+    executor: Executor = None,
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Returns the to_dict() representation of each instance, None for None, serialising
+    them in up to workers processes of executor or of a ProcessPoolExecutor created for the call.
+    """
+    instances = instances if isinstance(instances, list) else list(instances)
+    if not _is_parallel(len(instances), workers, min_parallel_size):
+        return _serialise_chunk(instances)
+    return _map_chunks(_serialise_chunk, instances, workers, executor)
@@ -0,0 +1,294 @@
+"""
+to_dict() output limited to some fields of a strictus and of its nested stricti.
+
+    order.to_dict(include=["id", "owner.name", "items.sku"])
+    order.to_dict(exclude=["owner.email"], max_depth=1)
+
+Paths are field names, or additional attribute names, joined with dots. A path into a strictus
+container field applies to each strictus in it. Fields that are left out are not read, so their
+getters aren't called and, for strictus views, their raw values aren't parsed.
+
+The plan of which fields to serialise, and how, is computed once per strictus class and projection.
+"""
+import weakref
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Type
+
+from strictus.core import _NOT_SET, is_strictus, serialise_value, strictus, strictus_field
+
+# A tree of paths as nested tuples of (name, subtree) pairs, with None for a whole subtree
+_PathTree = Optional[Tuple[Tuple[str, Any], ...]]
+
+# Maximum number of distinct include/exclude/max_depth combinations that are remembered
+_MAX_CACHED_PROJECTIONS = 1024
+
+
+class Projection(NamedTuple):
+    # Fields to include, or None for all fields
+    include: _PathTree
+    # Fields to exclude, or None for none
+    exclude: _PathTree
+    # Number of levels of nested stricti to include, or None for all
+    max_depth: Optional[int]
+
+
+WHOLE = Projection(None, None, None)
+
+
+class _Plan(NamedTuple):
+    # Fields to serialise, with the node of the projection of their values, or None for whole values,
+    # and whether their values are included as they are
+    fields: List[Tuple[strictus_field, Optional["_Node"], bool]]
+    # Whether to include additional attributes
+    additional_attributes: bool
+    # Additional attributes to include, or None for all
+    additional_attributes_include: Optional[frozenset]
+    additional_attributes_exclude: frozenset
+
+
+class _Node:
+    """
+    A projection with the plans for it of the strictus classes it has been applied to.
+    """
+
+    __slots__ = ("projection", "plans")
+
+    def __init__(self, projection: Projection):
+        self.projection = projection
+        self.plans = weakref.WeakKeyDictionary()
+
+
+# Nodes of projections, by the arguments they were created from, and by projection
+_nodes_by_args: Dict[Tuple, _Node] = {}
+_nodes: Dict[Projection, _Node] = {}
+
+
+def _path_tree(paths: Iterable[str]) -> _PathTree:
+    tree = {}
+    for path in paths:
+        *parents, leaf = path.split(".")
+        node = tree
+        for name in parents:
+            if name in node and node[name] is None:
+                break
+            node = node.setdefault(name, {})
+        else:
+            node[leaf] = None
+    return _freeze_tree(tree)
+
+
+def _freeze_tree(tree: Dict[str, Any]) -> _PathTree:
+    return tuple(sorted((name, None if subtree is None else _freeze_tree(subtree)) for name, subtree in tree.items()))
+
+
+def get_projection(
+    include: Iterable[str] = None,
+    exclude: Iterable[str] = None,
+    max_depth: int = None,
+) -> Projection:
+    """
+    Returns the projection of dotted paths of fields to include and exclude,
+    and of the maximum depth of nested stricti.
+    """
+    return _get_node_for_args(include, exclude, max_depth).projection
+
+
+def _get_node_for_args(include: Optional[Iterable[str]], exclude: Optional[Iterable[str]], max_depth: Optional[int]):
+    for name, paths in (("include", include), ("exclude", exclude)):
+        if isinstance(paths, (str, bytes)):
+            raise TypeError(f"{name} must be an iterable of paths, not a string, e.g. {name}={paths!r}.split(',')")
+    key = (
+        None if include is None else tuple(include),
+        None if exclude is None else tuple(exclude),
+        max_depth,
+    )
+    try:
+        return _nodes_by_args[key]
+    except KeyError:
+        pass
+    if max_depth is not None and max_depth < 0:
+        raise ValueError(f"max_depth must not be negative, got {max_depth}")
+    node = _get_node(Projection(
+        None if key[0] is None else _path_tree(key[0]),
+        None if key[1] is None else _path_tree(key[1]) or None,
+        max_depth,
+    ))
+    if len(_nodes_by_args) >= _MAX_CACHED_PROJECTIONS:
+        _nodes_by_args.clear()
+    _nodes_by_args[key] = node
+    return node
+
+
+def _get_node(projection: Projection) -> _Node:
+    try:
+        return _nodes[projection]
+    except KeyError:
+        pass
+    if len(_nodes) >= _MAX_CACHED_PROJECTIONS:
+        _nodes.clear()
+    node = _nodes[projection] = _Node(projection)
+    return node
+
+
+def _child_projection(projection: Projection, name: str) -> Tuple[bool, Optional[Projection]]:
+    """
+    Returns whether the field or additional attribute is included in the projection,
+    and the projection of its value.
+    """
+    child_include = None
+    if projection.include is not None:
+        include = dict(projection.include)
+        if name not in include:
+            return False, None
+        child_include = include[name]
+    child_exclude = None
+    if projection.exclude is not None:
+        exclude = dict(projection.exclude)
+        if name in exclude:
+            if exclude[name] is None:
+                return False, None
+            child_exclude = exclude[name]
+    child_max_depth = None if projection.max_depth is None else projection.max_depth - 1
+    return True, Projection(child_include, child_exclude, child_max_depth)
+
+
+def _get_plan(cls: Type[strictus], node: _Node) -> Optional[_Plan]:
+    """
+    Returns the plan of serialising instances of cls with the projection of node,
+    or None if cls has its own to_dict() which is used instead.
+    """
+    try:
+        return node.plans[cls]
+    except KeyError:
+        pass
+    if cls.to_dict is not strictus.to_dict:
+        node.plans[cls] = None
+        return None
+
+    projection = node.projection
+    schema = cls._strictus_schema
+    fields = []
+    for name, field in schema.items():
+        if not field.dict:
+            continue
+        included, child = _child_projection(projection, name)
+        if not included:
+            continue
+        if (field.is_strictus or field.is_strictus_container) and projection.max_depth == 0:
+            continue
+        # Like to_dict(), values of fields of these types are included as they are, as parsing
+        # guarantees they are None or of the exact type
+        primitive = (
+            field.type in (bool, int, float, str)
+            and not field.getter
+            and type(field).__get__ is strictus_field.__get__
+        )
+        fields.append((field, None if child == WHOLE else _get_node(child), primitive))
+
+    additional_attributes = schema.additional_attributes
+    additional_attributes_include = None
+    if additional_attributes and projection.include is not None:
+        additional_attributes_include = frozenset(name for name, _ in projection.include if name not in schema)
+        additional_attributes = bool(additional_attributes_include)
+    additional_attributes_exclude = frozenset(
+        name for name, subtree in projection.exclude or () if subtree is None
+    )
+
+    plan = node.plans[cls] = _Plan(
+        fields, additional_attributes, additional_attributes_include, additional_attributes_exclude,
+    )
+    return plan
+
+
+def _project_value(field: strictus_field, value: Any, node: _Node) -> Any:
+    """
+    Returns what serialise_value(field, value) returns, limited to the projection of node.
+    """
+    if value is None:
+        return None
+    elif is_strictus(value):
+        return _project(value, node)
+    elif field.is_strictus_container:
+        if field.is_dict:
+            return {k: None if item is None else _project(item, node) for k, item in value.items()}
+        return [None if item is None else _project(item, node) for item in value]
+    return value
+
+
+def _get_stored(instance: strictus, field: strictus_field) -> Any:
+    """
+    Returns the stored, or the parsed raw, value of the field, or NOT_SET if it has no value.
+    """
+    if field.slot is not None:
+        try:
+            return field.slot.__get__(instance, type(instance))
+        except AttributeError:
+            pass
+    elif field.default_attr_name in instance.__dict__:
+        return instance.__dict__[field.default_attr_name]
+    return field._parse_raw_value(instance)
+
+
+def _project(instance: strictus, node: _Node) -> Dict[str, Any]:
+    plan = _get_plan(type(instance), node)
+    if plan is None:
+        return instance.to_dict()
+
+    dct = {}
+    for field, child, primitive in plan.fields:
+        if field.lazy_default and _get_stored(instance, field) is _NOT_SET:
+            # Like to_dict(), the default value isn't created just to be serialised, unless
+            # default_factory may return different values
+            if child is None:
+                dct[field.name] = field._serialised_default(instance)
+            elif field._shares_serialised_default():
+                dct[field.name] = _project_value(field, field.coerce(field.default_factory()), child)
+            else:
+                dct[field.name] = _project_value(field, field._materialise_default(instance), child)
+            continue
+        try:
+            value = getattr(instance, field.name)
+        except AttributeError:
+            continue
+        if primitive:
+            dct[field.name] = value
+        elif child is None:
+            dct[field.name] = serialise_value(field, value)
+        elif child.projection.max_depth == -1 and is_strictus(value):
+            # A strictus returned by a getter or in a field of another type is beyond max_depth too
+            continue
+        else:
+            dct[field.name] = _project_value(field, value, child)
+
+    if plan.additional_attributes:
+        for k, v in instance._strictus_additional_attributes.items():
+            if plan.additional_attributes_include is not None and k not in plan.additional_attributes_include:
+                continue
+            if k not in plan.additional_attributes_exclude:
+                dct[k] = v
+    return dct
+
+
+def project(instance: strictus, projection: Projection) -> Dict[str, Any]:
+    """
+    Returns the to_dict() representation of instance limited to the projection.
+    """
+    if projection == WHOLE:
+        return instance.to_dict()
+    return _project(instance, _get_node(projection))
+
+
+def to_dict(
+    instance: strictus,
+    include: Iterable[str] = None,
+    exclude: Iterable[str] = None,
+    max_depth: int = None,
+) -> Dict[str, Any]:
+    """
+    Returns the to_dict() representation of instance with only the fields at the dotted paths
+    of include, if it's set, without the fields at the paths of exclude, and with no more than
+    max_depth levels of nested stricti, if it's set.
+    """
+    node = _get_node_for_args(include, exclude, max_depth)
+    if node.projection == WHOLE:
+        return instance.to_dict()
+    return _project(instance, node)
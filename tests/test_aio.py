@@ -0,0 +1,123 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import pytest
+
+from strictus.core import strictus, strictus_field
+
+
+class Line(strictus):
+    sku: str = strictus_field(required=True)
+    quantity: int = 1
+
+
+class Customer(strictus):
+    name: str
+    addresses: List[str] = None
+
+
+class Order(strictus):
+    id: int
+    customer: Customer = None
+    lines: List[Line] = strictus_field(default_factory=list)
+    lines_by_sku: Dict[str, Line] = strictus_field(default_factory=dict)
+
+
+def run_with_ticks(coroutine):
+    """
+    Runs the coroutine and returns its result and the number of times other tasks ran meanwhile.
+    """
+    async def main():
+        ticks = 0
+        done = False
+
+        async def tick():
+            nonlocal ticks
+            while not done:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker = asyncio.ensure_future(tick())
+        await asyncio.sleep(0)
+        ticks = 0
+        try:
+            return await coroutine, ticks
+        finally:
+            done = True
+            await ticker
+
+    return asyncio.run(main())
+
+
+def test_aparse_gives_control_back_to_the_event_loop():
+    raw = {
+        "id": "1",
+        "customer": {"name": "first", "addresses": ["here"]},
+        "lines": [{"sku": f"SKU-{i}", "quantity": str(i)} for i in range(100)] + [None],
+        "lines_by_sku": {f"SKU-{i}": {"sku": f"SKU-{i}"} for i in range(50)},
+    }
+    expected = Order(raw)
+
+    order, ticks = run_with_ticks(Order.aparse(raw, chunk_size=10))
+    assert order == expected
+    assert order.lines[5].quantity == 5
+    assert ticks >= 10
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        order, _ = run_with_ticks(Order.aparse(raw, chunk_size=10, executor=executor))
+    assert order == expected
+
+    with pytest.raises(ValueError):
+        asyncio.run(Order.aparse({"lines": [{"quantity": 1}]}))
+
+
+class Shipment(strictus):
+    class Meta:
+        additional_attributes = True
+        forbidden_attributes = ["secret"]
+
+    id: int = strictus_field(required=True)
+    lines: List[Line] = strictus_field(default_factory=list)
+
+    @strictus_field
+    def size(self) -> int:
+        return len(self.lines)
+
+
+def test_aparse_checks_outer_keys_before_parsing_nested_stricti():
+    lines = [{"sku": f"SKU-{i}"} for i in range(20)]
+    for cls, raw in (
+        (Shipment, {"lines": lines}),
+        (Shipment, {"id": 1, "size": 20, "lines": lines}),
+        (Shipment, {"id": 1, "secret": "x", "lines": lines}),
+        (Order, {"id": 1, "unknown": 1, "lines": lines}),
+    ):
+        with pytest.raises((TypeError, ValueError)) as sync_error:
+            cls(raw)
+        with pytest.raises(type(sync_error.value)) as async_error:
+            asyncio.run(cls.aparse(raw, chunk_size=5))
+        assert str(async_error.value) == str(sync_error.value)
+
+        # Invalid nested stricti are not reached
+        with pytest.raises(type(sync_error.value)) as async_error:
+            asyncio.run(cls.aparse({**raw, "lines": [{"quantity": 1}]}, chunk_size=5))
+        assert str(async_error.value) == str(sync_error.value)
+
+
+def test_aiter_parse_of_iterables_and_async_iterables():
+    raw = [{"id": i, "lines": [{"sku": "x"}]} for i in range(25)] + [None]
+
+    async def stream():
+        for item in raw:
+            await asyncio.sleep(0)
+            yield item
+
+    async def collect(items, **kwargs):
+        return [instance async for instance in Order.aiter_parse(items, **kwargs)]
+
+    expected = Order.parse_many(raw)
+    assert run_with_ticks(collect(raw, chunk_size=10))[0] == expected
+    assert run_with_ticks(collect(stream(), chunk_size=10))[0] == expected
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert run_with_ticks(collect(raw, chunk_size=10, executor=executor))[0] == expected
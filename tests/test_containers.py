@@ -0,0 +1,69 @@
+from typing import List
+
+from strictus.containers import LazyStrictusList
+from strictus.core import strictus, strictus_field
+
+
+class Item(strictus):
+    id: int
+    name: str = None
+
+
+class Order(strictus):
+    items: List[Item] = strictus_field(default_factory=list, list_container_cls=LazyStrictusList)
+
+
+def test_lazy_list_parses_items_on_first_access():
+    order = Order(items=[{"id": "1"}, None, {"id": "2"}, Item(id=3)])
+    assert isinstance(order.items, LazyStrictusList)
+    assert len(order.items) == 4
+    assert order.items.num_parsed == 1
+
+    first = order.items[0]
+    assert first.to_dict() == {"id": 1, "name": None}
+    assert order.items[0] is first
+    assert order.items[1] is None
+    assert order.items.num_parsed == 2
+
+    assert [item.id for item in order.items if item] == [1, 2, 3]
+    assert order.items.num_parsed == 3
+
+
+def test_lazy_list_passes_untouched_raw_items_to_dict():
+    raw_item = {"id": "2"}
+    order = Order(items=[{"id": "1"}, raw_item])
+    order.items[0].name = "first"
+
+    dct = order.to_dict()
+    assert dct == {"items": [{"id": 1, "name": "first"}, {"id": "2"}]}
+    assert dct["items"][1] is not raw_item
+    assert order.items.num_parsed == 1
+
+    # The output doesn't share the raw items
+    dct["items"][1]["id"] = "999"
+    assert order.items[1].id == 2
+    assert raw_item == {"id": "2"}
+
+
+def test_lazy_list_is_mutable_sequence():
+    order = Order()
+    assert order.items == []
+    assert isinstance(order.items, LazyStrictusList)
+
+    order.items.append({"id": 1})
+    order.items.extend([Item(id=2), {"id": 3}])
+    order.items.insert(0, {"id": 0})
+    del order.items[2]
+    assert [item.id for item in order.items] == [0, 1, 3]
+    assert order.items == [Item(id=0), Item(id=1), Item(id=3)]
+
+    tail = order.items[1:]
+    assert isinstance(tail, LazyStrictusList)
+    assert tail == [Item(id=1), Item(id=3)]
+
+    order.items[0] = {"id": 10}
+    assert order.items[0].id == 10
+
+    other = Order(items=order.items)
+    assert other.items == order.items
+    assert other.items is not order.items
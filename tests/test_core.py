@@ -557,6 +557,34 @@ def test_setattr_parses_values():
     assert b.collection["second"] is a
 
 
+def test_field_coerce_is_resolved_when_type_is_set():
+    class A(strictus):
+        x: int
+        items: List[int]
+        anything: Any
+        untyped: list
+
+    class B(strictus):
+        a: A
+
+    x = get_schema(A)["x"]
+    assert x.coerce("23") == 23
+    assert x.coerce(None) is None
+
+    assert get_schema(A)["items"].coerce(["1", 2]) == [1, 2]
+
+    obj = object()
+    assert get_schema(A)["anything"].coerce(obj) is obj
+    assert get_schema(A)["untyped"].coerce(["1"]) == ["1"]
+
+    a = get_schema(B)["a"].coerce({"x": "5"})
+    assert isinstance(a, A)
+    assert a.x == 5
+
+    x.type = str
+    assert x.coerce(23) == "23"
+
+
 def test_equals():
     class Point(strictus):
         x: int = 0
@@ -613,3 +641,126 @@ def test_field_with_any_type_is_not_parsed():
     obj = object()
     a.x = obj
     assert a.x is obj
+
+
+def test_initialiser_is_generated_on_first_instantiation_for_each_class():
+    class A(strictus):
+        x: int = 0
+
+    class B(A):
+        y: int = 0
+
+    placeholder = A.__dict__["_strictus_initialiser"]
+    assert A(x="1").x == 1
+    assert A.__dict__["_strictus_initialiser"] is not placeholder
+
+    compiled = A.__dict__["_strictus_initialiser"]
+    assert A().x == 0
+    assert A.__dict__["_strictus_initialiser"] is compiled
+
+    assert B(x="2", y="3").to_dict() == {"x": 2, "y": 3}
+    assert B.__dict__["_strictus_initialiser"] is not compiled
+
+
+def test_init_error_messages():
+    class A(strictus):
+        x: int = strictus_field(required=True)
+        y: int = strictus_field(init=False)
+
+    with pytest.raises(ValueError) as exc_info:
+        A()
+    assert str(exc_info.value) == "A field 'x' is required"
+
+    with pytest.raises(TypeError) as exc_info:
+        A(x=1, y=2)
+    assert str(exc_info.value) == "A.y is a non-init field"
+
+    with pytest.raises(TypeError) as exc_info:
+        A(x=1, z=3)
+    assert str(exc_info.value) == "Unexpected keyword arguments supplied to A: {'z'}"
+
+
+def test_init_does_not_modify_input_dict():
+    class A(strictus):
+        x: int = 0
+        y: int = 0
+
+    values = {"x": "1"}
+    assert A(values, y="2").to_dict() == {"x": 1, "y": 2}
+    assert A(values).to_dict() == {"x": 1, "y": 0}
+    assert values == {"x": "1"}
+
+
+def test_init_goes_through_custom_setattr():
+    assigned = []
+
+    class A(strictus):
+        x: int = 0
+        y: int
+
+        def __setattr__(self, name, value):
+            assigned.append(name)
+            super().__setattr__(name, value)
+
+    a = A(y="2")
+    assert a.x == 0
+    assert a.y == 2
+    assert "x" in assigned
+    assert "y" in assigned
+
+
+def test_to_dict_of_nested_strictus_of_derived_type():
+    class Point(strictus):
+        x: int = 0
+
+    class Point3D(Point):
+        z: int = 0
+
+    class Line(strictus):
+        start: Point = None
+        points: List[Point] = None
+
+    line = Line(start=Point3D(z=1), points=[Point(), Point3D(x=1, z=2), None])
+    assert line.to_dict() == {
+        "start": {"x": 0, "z": 1},
+        "points": [{"x": 0}, {"x": 1, "z": 2}, None],
+    }
+
+
+def test_to_dict_respects_overridden_to_dict_of_nested_strictus():
+    class Point(strictus):
+        x: int = 0
+
+        def to_dict(self):
+            return [self.x]
+
+    class Line(strictus):
+        start: Point = strictus_field(default_factory=Point)
+        by_name: Dict[str, Point] = strictus_field(default_factory=dict)
+
+    line = Line(start={"x": 1}, by_name={"end": {"x": 2}})
+    assert line.to_dict() == {"start": [1], "by_name": {"end": [2]}}
+
+
+def test_to_dict_rejects_non_strictus_items_in_strictus_containers():
+    class Item(strictus):
+        pass
+
+    class A(strictus):
+        items: List[Item] = strictus_field(default_factory=list)
+
+    a = A()
+    a.items.append("not-an-item")
+    with pytest.raises(TypeError):
+        a.to_dict()
+
+
+def test_to_dict_skips_getters_raising_attribute_error():
+    class A(strictus):
+        x: int = 0
+
+        @strictus_field
+        def y(self):
+            raise AttributeError("y")
+
+    assert A().to_dict() == {"x": 0}
@@ -1,9 +1,12 @@
 import abc
-from typing import List
+import copy
+import itertools
+import pickle
+from typing import Dict, List
 
 import pytest
 
-from strictus.core import get_schema, strictus, strictus_field
+from strictus.core import StrictusSchema, get_schema, is_strictus, strictus, strictus_field
 
 
 def test_update_attributes():
@@ -273,3 +276,1058 @@ def test_init_all_initialises_attributes_without_default():
     assert C().q is None
     assert C().r == 5
     assert C().s == []
+
+
+def test_slots_store_fields_without_instance_dict():
+    class Point(strictus):
+        __slots__ = ()
+
+        class Meta:
+            slots = True
+
+        x: int = 0
+        y: int = strictus_field(read_only=True, default=0)
+
+        @strictus_field
+        def xy(self):
+            return self.x + self.y
+
+    class Line(strictus):
+        __slots__ = ()
+
+        class Meta:
+            slots = True
+
+        start: Point = strictus_field(default_factory=Point)
+        points: List[Point] = strictus_field(default_factory=list)
+        label: str
+
+    assert get_schema(Point).slots is True
+
+    p = Point(x="1", y="2")
+    assert isinstance(p, Point)
+    assert not hasattr(p, "__dict__")
+    assert p.x == 1
+    assert p.xy == 3
+    assert p.to_dict() == {"x": 1, "y": 2, "xy": 3}
+    assert Point(p) is p
+    assert p == Point(x=1, y=2)
+    assert p != Point(x=1)
+
+    p.x = "5"
+    assert p.x == 5
+
+    with pytest.raises(AttributeError):
+        p.y = 3
+
+    with pytest.raises(AttributeError):
+        p.z = 3
+
+    line = Line(points=[{"x": 1}, p])
+    assert not hasattr(line, "label")
+    assert line.points[1] is p
+    assert line.to_dict() == {
+        "start": {"x": 0, "y": 0, "xy": 0},
+        "points": [{"x": 1, "y": 0, "xy": 1}, {"x": 5, "y": 2, "xy": 7}],
+    }
+
+    assert copy.deepcopy(line) == line
+
+
+def test_to_dict_serialises_nested_slotted_stricti_with_their_generated_serialiser(monkeypatch):
+    class Point(strictus):
+        __slots__ = ()
+
+        class Meta:
+            slots = True
+
+        x: int = 0
+
+    class Line(strictus):
+        start: Point = None
+        points: List[Point] = strictus_field(default_factory=list)
+
+    line = Line(start={"x": 1}, points=[{"x": 2}])
+    assert line.to_dict() == {"start": {"x": 1}, "points": [{"x": 2}]}
+
+    def fail(self):
+        raise AssertionError("Nested slotted stricti must not go through to_dict()")
+
+    monkeypatch.setattr(Point, "to_dict", fail)
+    assert line.to_dict() == {"start": {"x": 1}, "points": [{"x": 2}]}
+
+
+def test_slots_with_additional_attributes():
+    class A(strictus):
+        __slots__ = ()
+
+        class Meta:
+            slots = True
+            additional_attributes = True
+
+        x: int = 0
+
+    a = A(y=2)
+    a.z = 3
+    assert a.y == 2
+    assert a.to_dict() == {"x": 0, "y": 2, "z": 3}
+
+
+def test_slots_require_slotted_class():
+    class A(strictus):
+        __slots__ = ()
+
+        class Meta:
+            slots = True
+
+        x: int = 0
+
+    class B(A):
+        __slots__ = ()
+
+        y: int = 0
+
+    assert B(x=1, y=2).to_dict() == {"x": 1, "y": 2}
+    assert not hasattr(B(), "__dict__")
+
+    with pytest.raises(TypeError):
+        class C(A):
+            y: int = 0
+
+    class D(A):
+        class Meta:
+            slots = False
+
+        y: int = 0
+
+    assert D(x=1, y=2).to_dict() == {"x": 1, "y": 2}
+
+
+def test_parse_many():
+    class Item(strictus):
+        id: int
+        name: str = None
+
+    class ItemList(list):
+        pass
+
+    existing = Item(id=3)
+    items = Item.parse_many([{"id": "1"}, None, existing, {"id": 2, "name": "two"}])
+    assert type(items) is list
+    assert items[0] == Item(id=1)
+    assert items[1] is None
+    assert items[2] is existing
+    assert items[3].to_dict() == {"id": 2, "name": "two"}
+
+    items = Item.parse_many(iter([{"id": "1"}]), container_cls=ItemList)
+    assert type(items) is ItemList
+    assert items == [Item(id=1)]
+
+    assert Item.parse_many([]) == []
+
+    with pytest.raises(TypeError):
+        Item.parse_many([{"id": 1, "unknown": 2}])
+
+    with pytest.raises(ValueError):
+        Item.parse_many(["not-a-dict"])
+
+
+def test_parse_many_is_used_for_strictus_containers():
+    parsed = []
+
+    class Item(strictus):
+        id: int
+
+        @classmethod
+        def parse_many(cls, items, container_cls=list):
+            items = list(items)
+            parsed.append(len(items))
+            return super().parse_many(items, container_cls=container_cls)
+
+    class Collection(strictus):
+        items: List[Item] = strictus_field(default_factory=list)
+        by_id: Dict[str, Item] = strictus_field(default_factory=dict)
+
+    c = Collection(items=[{"id": 1}, None, {"id": 2}], by_id={"3": {"id": 3}, "4": None})
+    assert parsed == [3, 2]
+    assert c.to_dict() == {
+        "items": [{"id": 1}, None, {"id": 2}],
+        "by_id": {"3": {"id": 3}, "4": None},
+    }
+
+
+def test_view_parses_fields_on_first_access():
+    class Item(strictus):
+        id: int
+
+    class Order(strictus):
+        id: int = strictus_field(required=True)
+        status: str = "new"
+        item: Item = None
+        items: List[Item] = strictus_field(default_factory=list)
+        total: float = strictus_field(init=False, default=0.0)
+
+    raw = {"id": "1", "item": {"id": "2"}, "items": [{"id": "3"}]}
+    order = Order.view(raw)
+    assert order.__dict__["_strictus_raw"] is raw
+    assert "_strictus#id" not in order.__dict__
+    assert "_strictus#items" not in order.__dict__
+    assert order.__dict__["_strictus#status"] == "new"
+
+    assert order.id == 1
+    assert order.__dict__["_strictus#id"] == 1
+    assert "_strictus#items" not in order.__dict__
+
+    order.item = {"id": "22"}
+    assert order.item.id == 22
+
+    assert order.to_dict() == {"id": 1, "status": "new", "item": {"id": 22}, "items": [{"id": 3}], "total": 0.0}
+    assert order == Order(id=1, item={"id": 22}, items=[{"id": 3}])
+    assert "_strictus_raw" not in order.__dict__
+
+    assert Order.view(order) is order
+
+    with pytest.raises(ValueError):
+        Order.view({"status": "new"})
+
+    with pytest.raises(TypeError):
+        Order.view({"id": 1, "total": 5})
+
+    with pytest.raises(TypeError):
+        Order.view({"id": 1, "unexpected": 5})
+
+
+def test_lazy_meta_creates_views():
+    class Item(strictus):
+        class Meta:
+            lazy = True
+
+        id: int
+        name: str = None
+
+    class ExtendedItem(Item):
+        class Meta:
+            additional_attributes = True
+
+    class SlottedItem(strictus):
+        __slots__ = ()
+
+        class Meta:
+            lazy = True
+            slots = True
+
+        id: int
+        name: str = None
+
+    raw = {"id": "1"}
+    assert get_schema(Item).lazy is True
+    assert Item(raw).__dict__["_strictus_raw"] is raw
+    assert Item(raw).id == 1
+    assert Item(raw) == Item(id=1)
+    assert Item.parse_many([raw])[0].__dict__["_strictus_raw"] is raw
+
+    extended = ExtendedItem(id="1", color="red")
+    assert extended.color == "red"
+    assert extended.to_dict() == {"id": 1, "name": None, "color": "red"}
+
+    slotted = SlottedItem(raw)
+    assert slotted._strictus_raw is raw
+    assert slotted.id == 1
+    assert slotted.to_dict() == {"id": 1, "name": None}
+    assert slotted == SlottedItem(id=1)
+
+
+def test_track_changes_caches_to_dict_until_changed():
+    serialised = []
+
+    class Base(strictus):
+        class Meta:
+            track_changes = True
+
+    class Item(Base):
+        id: int
+        tags: List[str] = strictus_field(default_factory=list)
+
+        @strictus_field
+        def label(self):
+            serialised.append(self.id)
+            return f"item-{self.id}"
+
+    class Group(Base):
+        name: str = None
+        items: List[Item] = strictus_field(default_factory=list)
+        by_id: Dict[str, Item] = strictus_field(default_factory=dict)
+
+    class Root(Base):
+        class Meta:
+            additional_attributes = True
+
+        group: Group = strictus_field(default_factory=Group)
+
+    root = Root(group={"items": [{"id": 1}, {"id": 2}], "by_id": {"3": {"id": 3}}})
+    first = root.to_dict()
+    assert first == {
+        "group": {
+            "name": None,
+            "items": [{"id": 1, "tags": [], "label": "item-1"}, {"id": 2, "tags": [], "label": "item-2"}],
+            "by_id": {"3": {"id": 3, "tags": [], "label": "item-3"}},
+        },
+    }
+    assert sorted(serialised) == [1, 2, 3]
+    assert root.to_dict() is first
+
+    del serialised[:]
+    root.group.items[1].id = 22
+    second = root.to_dict()
+    assert second is not first
+    assert second["group"]["items"][1]["label"] == "item-22"
+    assert second["group"]["items"][0] is first["group"]["items"][0]
+    assert second["group"]["by_id"] is not first["group"]["by_id"]
+    assert second["group"]["by_id"]["3"] is first["group"]["by_id"]["3"]
+    assert serialised == [22]
+
+    root.group.items.append(Item(id=4))
+    assert root.to_dict()["group"]["items"][2]["label"] == "item-4"
+
+    new_item = Item(id=5)
+    root.group.by_id["5"] = new_item
+    assert root.to_dict()["group"]["by_id"]["5"]["id"] == 5
+    new_item.id = 55
+    assert root.to_dict()["group"]["by_id"]["5"]["id"] == 55
+
+    root.group.update_attributes(name="group")
+    assert root.to_dict()["group"]["name"] == "group"
+
+    root.extra = 1
+    assert root.to_dict()["extra"] == 1
+
+    serialised_item = Item(id=9)
+    serialised_item.to_dict()
+    assert serialised_item == Item(id=9)
+
+
+def test_track_changes_drops_caches_of_ancestors_of_stricti_without_cache():
+    class Base(strictus):
+        class Meta:
+            track_changes = True
+
+    class Child(Base):
+        v: int = 0
+
+    class Middle(Base):
+        child: Child = strictus_field(default_factory=Child, dict=False)
+
+    class Parent(Base):
+        middle: Middle = strictus_field(default_factory=Middle)
+
+        @strictus_field
+        def total(self) -> int:
+            return self.middle.child.v
+
+    p = Parent()
+    assert p.to_dict() == {"middle": {}, "total": 0}
+    assert p.middle._strictus_dict_cache is not None
+    p.middle.child.v = 5
+    assert p.to_dict() == {"middle": {}, "total": 5}
+
+    p.middle._strictus_dict_cache = None
+    p.middle.child.v = 6
+    assert p.to_dict() == {"middle": {}, "total": 6}
+
+
+def test_track_changes_requires_nested_stricti_to_track_changes():
+    class Item(strictus):
+        id: int = 0
+
+    class Group(strictus):
+        class Meta:
+            track_changes = True
+
+        item: Item = None
+
+    with pytest.raises(TypeError):
+        Group(item={})
+
+    with pytest.raises(TypeError):
+        class Collection(strictus):
+            class Meta:
+                track_changes = True
+
+            items: List[Item] = strictus_field(list_container_cls=tuple)
+
+
+def test_defer_schema_builds_schema_on_first_use():
+    class Base(strictus):
+        class Meta:
+            defer_schema = True
+
+        x: int = 0
+
+    class Point(Base):
+        y: int = 0
+
+    assert not isinstance(Point.__dict__["_strictus_schema"], StrictusSchema)
+    assert Point.y == 0  # not replaced with a strictus field yet
+
+    point = Point(x="1", y="2")
+    assert isinstance(Point.__dict__["_strictus_schema"], StrictusSchema)
+    assert list(get_schema(Point)) == ["x", "y"]
+    assert get_schema(Point).defer_schema
+    assert isinstance(Point.y, strictus_field)
+    assert (point.x, point.y) == (1, 2)
+    assert point.to_dict() == {"x": 1, "y": 2}
+
+    assert list(get_schema(Base)) == ["x"]
+    assert Base().to_dict() == {"x": 0}
+
+
+def test_deferred_schemas_are_built_once_and_not_by_is_strictus():
+    builds = []
+
+    class Base(strictus):
+        class Meta:
+            defer_schema = True
+
+        x: int = 0
+
+        @classmethod
+        def _strictus_build_schema(cls):
+            builds.append(cls.__name__)
+            super(Base, cls)._strictus_build_schema.__func__(cls)
+
+    class Point(Base):
+        y: int = 0
+
+    class Unresolved(Base):
+        parent: "MissingBase" = None  # noqa: F821
+
+    assert is_strictus(Point) and is_strictus(Unresolved)
+    assert builds == []
+
+    assert Point(x=1).to_dict() == {"x": 1, "y": 0}
+    assert builds == ["Point", "Base"]
+    assert get_schema(Base) is not get_schema(Point)
+
+    with pytest.raises(NameError):
+        Unresolved()
+
+
+class DeferredOrder(strictus):
+    class Meta:
+        defer_schema = True
+
+    # Declared below
+    items: List["DeferredItem"] = strictus_field(default_factory=list)
+    parent: "MissingOrder" = None  # noqa: F821
+
+
+def test_defer_schema_resolves_forward_references_on_first_use():
+    with pytest.raises(NameError):
+        DeferredOrder()
+
+    # The schema is built again on next use
+    globals()["MissingOrder"] = DeferredOrder
+    try:
+        order = DeferredOrder(items=[{"id": "1"}], parent={})
+    finally:
+        del globals()["MissingOrder"]
+
+    assert isinstance(order.items[0], DeferredItem)
+    assert order.items[0].id == 1
+    assert isinstance(order.parent, DeferredOrder)
+    assert order.to_dict() == {"items": [{"id": 1}], "parent": {"items": [], "parent": None}}
+
+
+class DeferredItem(strictus):
+    class Meta:
+        defer_schema = True
+
+    id: int
+
+
+def test_replace_parses_only_changed_fields_and_shares_the_rest():
+    class Item(strictus):
+        id: int
+
+    class State(strictus):
+        class Meta:
+            additional_attributes = True
+            forbidden_attributes = ["secret"]
+
+        version: int = 0
+        owner: Item = None
+        items: List[Item] = strictus_field(default_factory=list)
+        label: str = strictus_field(default=None, read_only=True)
+        post_init_calls: int = 0
+
+        @strictus_field
+        def size(self) -> int:
+            return len(self.items)
+
+        def _post_init_(self):
+            super()._post_init_()
+            self.post_init_calls += 1
+
+    state = State(owner={"id": 1}, items=[{"id": 2}], note="first")
+
+    new_state = state.replace(version="2", label="two", note="second")
+    assert isinstance(new_state, State)
+    assert new_state is not state
+    assert new_state.version == 2
+    assert new_state.label == "two"
+    assert new_state.owner is state.owner
+    assert new_state.items is state.items
+    assert new_state.note == "second"
+    assert new_state.post_init_calls == 2
+    assert state.to_dict() == {
+        "version": 0, "owner": {"id": 1}, "items": [{"id": 2}], "label": None, "post_init_calls": 1, "size": 1,
+        "note": "first",
+    }
+
+    with pytest.raises(AttributeError):
+        new_state.label = "read-only after initialisation"
+
+    with pytest.raises(TypeError) as exc_info:
+        state.replace(size=3)
+    assert str(exc_info.value) == "State.size is a non-init field"
+
+    with pytest.raises(TypeError):
+        state.replace(secret="x")
+
+
+def test_replace_of_slotted_and_change_tracking_stricti():
+    class Item(strictus):
+        class Meta:
+            track_changes = True
+
+        id: int
+
+    class State(strictus):
+        __slots__ = ()
+
+        class Meta:
+            slots = True
+            track_changes = True
+
+        version: int = 0
+        items: List[Item] = strictus_field(default_factory=list)
+
+    state = State(items=[{"id": 1}])
+    assert state.to_dict() == {"version": 0, "items": [{"id": 1}]}
+
+    with pytest.raises(TypeError):
+        state.replace(unknown=1)
+
+    new_state = state.replace(version=1)
+    assert new_state.to_dict() == {"version": 1, "items": [{"id": 1}]}
+    assert new_state.items[0] is state.items[0]
+
+    # Both instances see changes of the shared nested strictus
+    state.items[0].id = 2
+    assert state.to_dict()["items"] == [{"id": 2}]
+    assert new_state.to_dict()["items"] == [{"id": 2}]
+
+    # but tracked containers are not shared
+    new_state.items.append(Item(id=3))
+    assert len(state.items) == 1
+    assert new_state.to_dict()["items"] == [{"id": 2}, {"id": 3}]
+
+
+def test_construct_stores_trusted_values_without_parsing():
+    class Item(strictus):
+        id: int
+        tags: List[str] = None
+
+    class Order(strictus):
+        number: str = strictus_field(required=True)
+        status: str = "new"
+        owner: Item = None
+        items: List[Item] = strictus_field(default_factory=list)
+        items_by_id: Dict[str, Item] = strictus_field(default_factory=dict)
+        post_init_called: bool = False
+
+        @strictus_field
+        def size(self) -> int:
+            return len(self.items)
+
+        def _post_init_(self):
+            super()._post_init_()
+            self.post_init_called = True
+
+    tags = ["a", "b"]
+    item = Item(id=3)
+    order = Order.construct({
+        "number": 42,  # not coerced to str because the data is trusted
+        "owner": {"id": 1, "tags": tags},
+        "items": [{"id": 2}, None, item],
+        "items_by_id": {"3": item},
+    })
+    assert order.number == 42
+    assert order.status == "new"
+    assert order.post_init_called
+    assert isinstance(order.owner, Item)
+    assert order.owner.tags is tags
+    assert isinstance(order.items[0], Item)
+    assert order.items[1] is None
+    assert order.items[2] is item
+    assert order.items_by_id == {"3": item}
+
+    valid = Order(number="1", owner={"id": 1}, items=[{"id": 2, "tags": ["a"]}], items_by_id={"3": {"id": 3}})
+    assert Order.construct({k: v for k, v in valid.to_dict().items() if k != "size"}) == valid
+
+    assert Order.construct(order) is order
+    assert Order.construct({"number": "1"}, trusted=False) == Order(number="1")
+
+    with pytest.raises(ValueError):
+        Order.construct({})
+    with pytest.raises(TypeError):
+        Order.construct({"number": "1", "size": 1})
+    with pytest.raises(TypeError):
+        Order.construct({"number": "1", "unknown": 1})
+
+    assert Item.parse_many([{"id": "1"}, None], trusted=True) == [Item.construct({"id": "1"}), None]
+
+
+def test_frozen_stricti_are_immutable_and_hashable():
+    class Point(strictus):
+        class Meta:
+            frozen = True
+
+        x: int = 0
+        y: int = 0
+
+    class Shape(strictus):
+        __slots__ = ()
+
+        class Meta:
+            frozen = True
+            slots = True
+
+        name: str = None
+        points: List[Point] = strictus_field(default_factory=list)
+
+    point = Point(x="1", y=2)
+    with pytest.raises(AttributeError):
+        point.x = 3
+    with pytest.raises(AttributeError):
+        point.update_attributes(y=3)
+    assert point.to_dict() == {"x": 1, "y": 2}
+
+    assert point == Point(x=1, y=2)
+    assert point != Point(x=2, y=1)
+    assert hash(point) == hash(Point(x=1, y=2))
+    assert len({point, Point(x=1, y=2), Point()}) == 2
+
+    shape = Shape(name="line", points=[{"x": 1}, {"y": 1}])
+    assert {shape: 1}[Shape(name="line", points=[{"x": 1}, {"y": 1}])] == 1
+    assert shape != Shape(name="line", points=[{"x": 1}])
+    with pytest.raises(AttributeError):
+        shape.name = "other"
+
+    # The cached hash is not copied
+    copied = copy.deepcopy(shape)
+    assert copied._strictus_hash is None
+    assert copied == shape
+    assert hash(copied) == hash(shape)
+
+    changed = shape.replace(name="other")
+    assert changed.name == "other"
+    assert changed != shape
+    assert hash(changed) != hash(shape)
+
+
+def test_frozen_stricti_additional_attributes():
+    class Event(strictus):
+        class Meta:
+            frozen = True
+            additional_attributes = True
+
+        id: int = 0
+
+    event = Event(id=1, kind="click")
+    with pytest.raises(AttributeError):
+        event.kind = "other"
+    with pytest.raises(AttributeError):
+        event.target = "button"
+    assert event == Event(id=1, kind="click")
+    assert event != Event(id=1, kind="other")
+    assert hash(event) == hash(Event(id=1, kind="click"))
+
+
+def test_subclasses_of_frozen_stricti_are_frozen():
+    class Point(strictus):
+        class Meta:
+            frozen = True
+
+        x: int = 0
+
+    class Point3D(Point):
+        z: int = 0
+
+    point = Point3D(x=1, z=2)
+    with pytest.raises(AttributeError):
+        point.x = 3
+    assert hash(point) == hash(Point3D(x=1, z=2))
+
+    with pytest.raises(TypeError, match="can't unset Meta.frozen"):
+        class MutablePoint(Point):
+            class Meta:
+                frozen = False
+
+    class Named(strictus):
+        name: str = None
+
+    with pytest.raises(TypeError, match="can't unset Meta.frozen"):
+        class NamedPoint(Named, Point):
+            pass
+
+    # Fields of a mutable base class stay writable when a frozen subclass is created
+    class FrozenNamed(Named):
+        class Meta:
+            frozen = True
+
+    named = Named(name="first")
+    named.name = "second"
+    with pytest.raises(AttributeError):
+        FrozenNamed(name="first").name = "second"
+
+
+def test_frozen_stricti_compare_attributes_set_in_post_init_like_other_stricti():
+    counter = itertools.count()
+
+    class Counted(strictus):
+        x: int = 0
+
+        def _post_init_(self):
+            super()._post_init_()
+            self.serial = next(counter)
+
+    class FrozenCounted(Counted):
+        class Meta:
+            frozen = True
+
+    class Plain(strictus):
+        class Meta:
+            frozen = True
+
+        x: int = 0
+
+    assert Counted(x=1) != Counted(x=1)
+    assert FrozenCounted(x=1) != FrozenCounted(x=1)
+    first = FrozenCounted(x=1)
+    assert first == copy.copy(first)
+    assert hash(first) == hash(copy.copy(first))
+    assert Plain(x=1) == Plain(x=1)
+
+
+def test_frozen_stricti_require_nested_stricti_to_be_frozen():
+    class Point(strictus):
+        x: int = 0
+
+    with pytest.raises(TypeError):
+        class Shape(strictus):
+            class Meta:
+                frozen = True
+
+            points: List[Point]
+
+
+class PickledItem(strictus):
+    class Meta:
+        additional_attributes = True
+
+    id: int
+    name: str
+
+
+class PickledTag(strictus):
+    name: str
+
+
+class PickledLine(strictus):
+    __slots__ = ()
+
+    class Meta:
+        slots = True
+        track_changes = True
+
+    quantity: int = 1
+
+
+class PickledOrder(strictus):
+    __slots__ = ()
+
+    class Meta:
+        slots = True
+        track_changes = True
+
+    number: str
+    items: List[PickledLine] = strictus_field(default_factory=list)
+
+
+class PickledDoubled(strictus):
+    x: int
+
+    def _post_init_(self):
+        super()._post_init_()
+        self.doubled = self.x * 2
+
+
+class PickledPoint(strictus):
+    class Meta:
+        frozen = True
+
+    x: int = 0
+    y: int = 0
+
+
+def test_pickle_stores_field_values_in_schema_order(monkeypatch):
+    item = PickledItem(id="1", colour="red")
+    data = pickle.dumps(item)
+    assert b"_strictus" not in data
+
+    def fail(*args):
+        raise AssertionError("Unpickling must not initialise the instance again")
+
+    monkeypatch.setattr(PickledItem, "_strictus_initialiser", staticmethod(fail))
+    loaded = pickle.loads(data)
+    assert loaded == item
+    assert loaded.__dict__ == item.__dict__
+    assert not hasattr(loaded, "name")
+    assert loaded.colour == "red"
+    assert item.__getstate__() == ((1, strictus.NOT_SET), {"colour": "red"}, None)
+
+    tag = PickledTag(name="new")
+    assert pickle.loads(pickle.dumps(tag)).__dict__ == tag.__dict__
+
+
+def test_pickle_and_copy_keep_attributes_set_in_post_init():
+    doubled = PickledDoubled(x=2)
+    assert doubled.__getstate__() == ((2,), None, {"doubled": 4})
+    for loaded in (copy.copy(doubled), copy.deepcopy(doubled), pickle.loads(pickle.dumps(doubled))):
+        assert loaded == doubled
+        assert loaded.doubled == 4
+        assert loaded.__dict__ == doubled.__dict__
+
+
+def test_pickle_slotted_tracked_and_frozen_stricti():
+    order = PickledOrder(number="1", items=[{"quantity": 2}])
+    assert order.to_dict() == {"number": "1", "items": [{"quantity": 2}]}
+
+    loaded = pickle.loads(pickle.dumps(order))
+    assert type(loaded) is type(order)
+    assert loaded == order
+    loaded.items[0].quantity = 3
+    loaded.items.append(PickledLine())
+    assert loaded.to_dict() == {"number": "1", "items": [{"quantity": 3}, {"quantity": 1}]}
+
+    # Shallow copies get their own tracked containers
+    copied = copy.copy(order)
+    assert copied.items is not order.items
+    copied.items.append(PickledLine())
+    assert copied.to_dict()["items"] == [{"quantity": 2}, {"quantity": 1}]
+    assert order.to_dict()["items"] == [{"quantity": 2}]
+
+    point = PickledPoint(x=1)
+    hash(point)
+    loaded = pickle.loads(pickle.dumps(point))
+    assert loaded._strictus_hash is None
+    assert loaded == point
+    assert hash(loaded) == hash(point)
+
+
+def test_intern_strings_of_fields_and_classes():
+    def new_str(value):
+        # A new string object, as if decoded from JSON
+        return "".join(list(value))
+
+    class Product(strictus):
+        sku: str
+        status: str = strictus_field(default=None, intern=True)
+        tags: List[str] = strictus_field(default_factory=list, intern=True)
+
+    class Listing(strictus):
+        class Meta:
+            intern = True
+            additional_attributes = True
+
+        currency: str
+        prices: Dict[str, float] = None
+        products: Dict[str, Product] = None
+
+    first = Product(sku=new_str("SKU-1"), status=new_str("ACTIVE"), tags=[new_str("new"), None])
+    second = Product.construct({"sku": new_str("SKU-1"), "status": new_str("ACTIVE"), "tags": [new_str("new")]})
+    assert first.status is second.status
+    assert first.tags[0] is second.tags[0]
+    assert first.tags[1] is None
+    assert first.sku == second.sku and first.sku is not second.sku
+
+    second.status = new_str("ACTIVE")
+    assert first.status is second.status
+
+    first = Listing(currency=new_str("EUR"), prices={new_str("EE"): 1}, products={new_str("p"): {"sku": "x"}})
+    second = Listing(currency=new_str("EUR"), prices={new_str("EE"): 2}, **{new_str("region"): new_str("north")})
+    first.region = new_str("north")
+    assert first.currency is second.currency
+    assert list(first.prices)[0] is list(second.prices)[0]
+    assert first.prices == {"EE": 1.0}
+    assert isinstance(first.products["p"], Product)
+    assert first.region is second.region
+    assert list(first.to_dict())[-1] is list(second.to_dict())[-1]
+
+
+def test_lazy_default_is_created_on_first_access():
+    created = []
+
+    class Point(strictus):
+        class Meta:
+            track_changes = True
+
+        x: int = 0
+        y: int = 0
+
+        def _post_init_(self):
+            super()._post_init_()
+            created.append(self)
+
+    class Line(strictus):
+        __slots__ = ()
+
+        class Meta:
+            slots = True
+            track_changes = True
+
+        start: Point = strictus_field(default_factory=Point, lazy_default=True)
+        points: List[Point] = strictus_field(default_factory=list, lazy_default=True)
+
+    line = Line()
+    assert created == []
+    assert line.to_dict() == {"start": {"x": 0, "y": 0}, "points": []}
+    assert line.to_dict() is line.to_dict()
+    assert len(created) == 1
+
+    # The serialised default is copied
+    other = Line()
+    other.to_dict()["start"]["x"] = 5
+    assert Line().to_dict() == {"start": {"x": 0, "y": 0}, "points": []}
+
+    assert line == Line(start={"x": 0})
+    assert line.start is line.start
+    line.start.x = 3
+    line.points.append(Point(y=1))
+    assert line.to_dict() == {"start": {"x": 3, "y": 0}, "points": [{"x": 0, "y": 1}]}
+    assert line != Line()
+
+    assert Line(start={"x": 1}).start.x == 1
+    loaded = copy.deepcopy(Line())
+    assert loaded.__getstate__() == ((strictus.NOT_SET, strictus.NOT_SET), None, None)
+    assert loaded.start == Point()
+
+    with pytest.raises(ValueError):
+        strictus_field(default=Point(), lazy_default=True)
+
+
+def test_lazy_default_invalidates_cached_to_dict_when_created():
+    class Point(strictus):
+        class Meta:
+            track_changes = True
+
+        x: int = 0
+
+    class Shape(strictus):
+        class Meta:
+            track_changes = True
+
+        p: Point = strictus_field(default_factory=Point, lazy_default=True)
+
+    shape = Shape()
+    assert shape.to_dict() == {"p": {"x": 0}}
+    shape.p.x = 5
+    assert shape.to_dict() == {"p": {"x": 5}}
+
+
+def test_lazy_default_of_factory_returning_different_values():
+    counter = iter(range(100))
+
+    class Event(strictus):
+        seq: int = strictus_field(default_factory=lambda: next(counter), lazy_default=True)
+        tags: List[str] = strictus_field(default_factory=list, lazy_default=True)
+
+    first, second = Event(), Event()
+    assert first.to_dict() == {"seq": 0, "tags": []}
+    assert second.to_dict() == {"seq": 1, "tags": []}
+    assert first.seq == 0
+    assert second.seq == 1
+    # Defaults of builtin types are serialised once and not created for to_dict()
+    assert first.__getstate__()[0] == (0, strictus.NOT_SET)
+
+
+def test_cached_getters_are_recomputed_when_dependencies_are_set():
+    calls = []
+
+    class Item(strictus):
+        price: float = 0.0
+
+    class Order(strictus):
+        items: List[Item] = strictus_field(default_factory=list)
+        discount: float = 0.0
+        note: str = None
+
+        @strictus_field(cached=True, depends_on=["items"])
+        def subtotal(self) -> float:
+            calls.append("subtotal")
+            return sum(item.price for item in self.items)
+
+        @strictus_field(cached=True, depends_on=["subtotal", "discount"])
+        def total(self) -> float:
+            calls.append("total")
+            return self.subtotal - self.discount
+
+    order = Order(items=[{"price": 1}, {"price": 2}])
+    assert order.total == 3
+    assert order.total == 3
+    assert order.to_dict() == {
+        "items": [{"price": 1.0}, {"price": 2.0}], "discount": 0.0, "note": None, "subtotal": 3.0, "total": 3.0,
+    }
+    assert calls == ["total", "subtotal"]
+
+    order.note = "unrelated"
+    assert order.total == 3
+    assert calls == ["total", "subtotal"]
+
+    order.discount = 1
+    assert order.total == 2
+    assert calls == ["total", "subtotal", "total"]
+
+    order.update_attributes(items=[{"price": 10}])
+    assert order.total == 9
+    assert order.subtotal == 10
+    assert calls[3:] == ["total", "subtotal"]
+
+    # Cached values are not part of the state
+    assert order == Order(items=[{"price": 10}], discount=1, note="unrelated")
+    assert order.replace(discount=2).total == 8
+
+    class FrozenOrder(strictus):
+        __slots__ = ()
+
+        class Meta:
+            frozen = True
+            slots = True
+
+        prices: List[float] = None
+
+        @strictus_field(cached=True)
+        def total(self) -> float:
+            calls.append("frozen total")
+            return sum(self.prices)
+
+    frozen = FrozenOrder(prices=[1, 2])
+    assert frozen.total == frozen.total == 3
+    assert calls.count("frozen total") == 1
+
+    with pytest.raises(ValueError):
+        class Invalid(strictus):
+            @strictus_field(cached=True, depends_on=["unknown"])
+            def total(self) -> float:
+                return 0
@@ -0,0 +1,128 @@
+import gc
+import weakref
+from array import array
+from typing import Dict, List
+
+import pytest
+
+from strictus.core import strictus, strictus_field
+from strictus.frame import StrictusFrame, StrictusRow
+
+
+class Tag(strictus):
+    name: str
+
+
+class Item(strictus):
+    class Meta:
+        additional_attributes = True
+
+    id: int = strictus_field(required=True)
+    price: float = 0.0
+    active: bool = True
+    label: str
+    tags: List[Tag] = strictus_field(default_factory=list)
+    counts: Dict[str, int] = None
+
+    @strictus_field
+    def double_price(self) -> float:
+        return self.price * 2
+
+
+def test_frame_stores_records_in_columns():
+    frame = StrictusFrame[Item]([
+        {"id": "1", "price": "1.5", "label": "first", "tags": [{"name": "a"}]},
+        Item(id=2, price=2),
+        {"id": 3, "counts": {"x": "1"}, "note": "third"},
+    ])
+    assert StrictusFrame[Item] is type(frame)
+    assert len(frame) == 3
+
+    assert frame.column("id") == array("q", [1, 2, 3])
+    assert frame.column("price") == array("d", [1.5, 2.0, 0.0])
+    assert frame.column("active") == [True, True, True]
+    assert frame.column("label") == ["first", Item.NOT_SET, Item.NOT_SET]
+
+    first, second, third = frame
+    assert isinstance(first, StrictusRow)
+    assert first.id == 1
+    assert first.double_price == 3.0
+    assert isinstance(first.tags[0], Tag)
+    assert first.to_dict() == Item(id=1, price=1.5, label="first", tags=[{"name": "a"}]).to_dict()
+    assert third.counts == {"x": 1}
+    assert third.note == "third"
+    with pytest.raises(AttributeError):
+        second.label
+    with pytest.raises(AttributeError):
+        second.id = 3
+
+    assert first == Item(id=1, price=1.5, label="first", tags=[{"name": "a"}])
+    assert second == Item(id=2, price=2)
+    assert third == Item(id=3, counts={"x": 1}, note="third")
+    assert third != Item(id=3, counts={"x": 1})
+    assert first != second
+    assert frame[-1] == third
+
+    assert third.to_instance() == Item(id=3, counts={"x": 1}, note="third")
+    assert frame.to_dicts() == [row.to_instance().to_dict() for row in frame]
+    assert frame.to_columns()["label"] == ["first", None, None]
+    assert frame.to_columns()["tags"] == [[{"name": "a"}], [], []]
+
+
+def test_frame_filter_and_slice():
+    frame = StrictusFrame[Item]({"id": i, "price": i / 2, "active": i % 2 == 0} for i in range(10))
+
+    active = frame.filter(active=True)
+    assert [row.id for row in active] == [0, 2, 4, 6, 8]
+    assert isinstance(active.column("id"), array)
+
+    assert [row.id for row in frame.filter(active=True, price=lambda price: price > 2)] == [6, 8]
+    assert [row.id for row in frame[7:]] == [7, 8, 9]
+
+
+def test_frame_turns_array_columns_into_lists_when_needed():
+    frame = StrictusFrame[Item]([{"id": 1, "price": 1}])
+    frame.append({"id": 2 ** 70, "price": None})
+    assert frame.column("id") == [1, 2 ** 70]
+    assert frame.column("price") == [1.0, None]
+
+
+def test_frame_validates_records():
+    frame = StrictusFrame[Item]()
+    with pytest.raises(ValueError):
+        frame.append({"price": 1})
+    with pytest.raises(TypeError):
+        frame.append({"id": 1, "double_price": 1})
+    with pytest.raises(TypeError):
+        StrictusFrame[Tag]([{"name": "a", "unknown": 1}])
+    with pytest.raises(TypeError):
+        StrictusFrame([])
+
+
+def test_frame_rows_to_instances_with_non_init_fields():
+    class Invoice(strictus):
+        number: str
+        total: float = strictus_field(init=False, default=0.0)
+
+    invoice = Invoice(number="1")
+    invoice.total = 9.5
+    frame = StrictusFrame[Invoice]([invoice, {"number": "2"}])
+
+    instances = frame.to_instances()
+    assert instances == [invoice, Invoice(number="2")]
+    assert instances[0].total == 9.5
+    assert instances[1].total == 0.0
+
+
+def test_frame_classes_do_not_keep_item_types_alive():
+    class Point(strictus):
+        x: int = 0
+
+    frame_cls = StrictusFrame[Point]
+    assert StrictusFrame[Point] is frame_cls
+    assert frame_cls([{"x": 1}])[0].x == 1
+
+    point_ref = weakref.ref(Point)
+    del Point, frame_cls
+    gc.collect()
+    assert point_ref() is None
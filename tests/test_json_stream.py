@@ -0,0 +1,88 @@
+import io
+import json
+from typing import Any, Dict, List
+
+import pytest
+
+from strictus.containers import LazyStrictusList
+from strictus.core import strictus, strictus_field
+from strictus.json_stream import iter_json_chunks
+
+
+class Item(strictus):
+    id: int
+    name: str = None
+    price: float = 0.0
+
+
+class Custom(strictus):
+    value: int = 0
+
+    def to_dict(self):
+        return {"custom": self.value}
+
+
+class Order(strictus):
+    class Meta:
+        additional_attributes = True
+
+    number: str
+    items: List[Item] = strictus_field(default_factory=list)
+    lazy_items: List[Item] = strictus_field(default_factory=list, list_container_cls=LazyStrictusList)
+    items_by_id: Dict[str, Item] = strictus_field(default_factory=dict)
+    custom: Custom = None
+    anything: Any = None
+    hidden: str = strictus_field(default="hidden", dict=False)
+
+    @strictus_field
+    def count(self) -> int:
+        return len(self.items)
+
+
+def create_order():
+    return Order(
+        number="ä-1\n",
+        items=[{"id": i, "name": f"item {i}", "price": i / 3} for i in range(50)],
+        lazy_items=[{"id": 1}, None],
+        items_by_id={"1": {"id": 1}},
+        custom={"value": 5},
+        anything={1: [True, None, 1.5], "x": (1, 2)},
+        extra={"nested": Item(id=7)},
+    )
+
+
+def test_json_chunks_are_the_json_of_to_dict():
+    order = create_order()
+    expected = json.dumps(order.to_dict(), separators=(",", ":"), default=lambda x: x.to_dict())
+    assert "".join(order.iter_json_chunks()) == expected
+
+    chunks = list(order.iter_json_chunks(chunk_size=64))
+    assert len(chunks) > 3
+    assert "".join(chunks) == expected
+
+    assert "".join(iter_json_chunks(Order(number="1"))) == json.dumps(
+        Order(number="1").to_dict(), separators=(",", ":"),
+    )
+
+
+def test_write_json_to_text_and_binary_files():
+    order = create_order()
+    text = io.StringIO()
+    count = order.write_json(text, chunk_size=100)
+    assert count == len(text.getvalue())
+    assert json.loads(text.getvalue())["items"][49] == {"id": 49, "name": "item 49", "price": 49 / 3}
+
+    binary = io.BytesIO()
+    order.write_json(binary)
+    assert binary.getvalue().decode("utf-8") == text.getvalue()
+
+
+def test_json_encodes_special_values_like_json_module():
+    class Values(strictus):
+        value: Any
+
+    for value in [float("nan"), float("inf"), -float("inf"), {None: 1, True: 2, 1.5: 3}, "☃"]:
+        assert "".join(Values(value=value).iter_json_chunks()) == json.dumps({"value": value}, separators=(",", ":"))
+
+    with pytest.raises(TypeError):
+        "".join(Values(value=object()).iter_json_chunks())
@@ -0,0 +1,82 @@
+import gzip
+import io
+from typing import List
+
+import pytest
+
+from strictus import jsonl
+from strictus.core import strictus, strictus_field
+
+
+class Item(strictus):
+    id: int
+    name: str = None
+
+
+class Order(strictus):
+    id: int
+    items: List[Item] = strictus_field(default_factory=list)
+
+
+def test_write_and_iter_jsonl_with_file_objects():
+    orders = [Order(id=i, items=[{"id": j} for j in range(i)]) for i in range(5)]
+
+    text_fp = io.StringIO()
+    assert Order.write_jsonl(text_fp, orders) == 5
+    assert text_fp.getvalue().count("\n") == 5
+    assert text_fp.getvalue().splitlines()[1] == '{"id":1,"items":[{"id":0,"name":null}]}'
+
+    text_fp.seek(0)
+    assert list(Order.iter_jsonl(text_fp)) == orders
+
+    binary_fp = io.BytesIO()
+    assert Order.write_jsonl(binary_fp, iter(orders), chunk_size=10) == 5
+    assert binary_fp.getvalue().decode("utf-8") == text_fp.getvalue()
+
+    binary_fp.seek(0)
+    assert list(Order.iter_jsonl(binary_fp, chunk_size=10)) == orders
+
+
+def test_iter_jsonl_skips_blank_lines_and_validates_records():
+    fp = io.StringIO('{"id": "1"}\n\n  \n{"id": 2, "name": "two"}\n')
+    assert [item.to_dict() for item in Item.iter_jsonl(fp)] == [
+        {"id": 1, "name": None},
+        {"id": 2, "name": "two"},
+    ]
+
+    fp = io.StringIO('{"id": 1}\n{"id": 2, "unexpected": true}\n')
+    with pytest.raises(TypeError):
+        list(Item.iter_jsonl(fp))
+
+
+@pytest.mark.parametrize("suffix", [".jsonl", ".jsonl.gz", ".jsonl.bz2", ".jsonl.xz"])
+def test_write_and_iter_jsonl_with_paths(tmp_path, suffix):
+    path = tmp_path / f"items{suffix}"
+    items = [Item(id=i, name=f"item-{i}") for i in range(100)]
+
+    assert Item.write_jsonl(path, items, chunk_size=100) == 100
+    assert list(Item.iter_jsonl(str(path), chunk_size=100)) == items
+
+    if suffix != ".jsonl":
+        assert b"item-1" not in path.read_bytes()
+
+
+def test_compressed_file_objects():
+    items = [Item(id=i) for i in range(3)]
+
+    fp = io.BytesIO()
+    Item.write_jsonl(fp, items, compression="gzip")
+    assert not fp.closed
+    assert gzip.decompress(fp.getvalue()).count(b"\n") == 3
+
+    fp.seek(0)
+    assert list(Item.iter_jsonl(fp, compression="gzip")) == items
+
+    with pytest.raises(ValueError):
+        Item.write_jsonl(io.BytesIO(), items, compression="zip")
+
+
+def test_write_jsonl_rejects_instances_of_other_types():
+    with pytest.raises(TypeError):
+        Item.write_jsonl(io.StringIO(), [Item(id=1), Order(id=2)])
+    assert jsonl.write_jsonl(io.StringIO(), [Item(id=1), Order(id=2)]) == 2
@@ -0,0 +1,80 @@
+import sys
+from typing import List
+
+import pytest
+
+from strictus.core import strictus, strictus_field
+from strictus.memory import deep_size, memory_report
+
+
+class Item(strictus):
+    id: int
+    name: str = None
+
+
+class Order(strictus):
+    class Meta:
+        additional_attributes = True
+
+    number: str = strictus_field(required=True)
+    first: Item = None
+    items: List[Item] = strictus_field(default_factory=list)
+
+    @strictus_field
+    def count(self) -> int:
+        return len(self.items)
+
+
+class SlottedItem(strictus):
+    __slots__ = ()
+
+    class Meta:
+        slots = True
+
+    id: int
+    name: str = None
+
+
+def test_memory_report_breaks_down_deep_size():
+    order = Order(number="A-1", first={"id": 1000}, items=[{"id": 2000, "name": "second"}], note="x" * 100)
+    report = memory_report(order)
+
+    assert report.type_name == "Order"
+    assert report.storage == sys.getsizeof(order) + sys.getsizeof(order.__dict__)
+    assert set(report.fields) == {"number", "first"}
+    assert report.fields["number"] == sys.getsizeof("A-1")
+    assert report.fields["first"] == memory_report(order.first).total
+    assert set(report.containers) == {"items"}
+    assert report.containers["items"] == deep_size(order.items)
+    assert report.additional_attributes > sys.getsizeof("x" * 100)
+    assert report.flags == 0
+    assert report.other == 0
+    assert report.total == deep_size(order)
+    assert report.to_dict()["total"] == report.total
+
+
+def test_memory_report_of_class_reports_default_instance():
+    report = memory_report(Order)
+    assert report.fields == {"number": 0, "first": 0}
+    assert report.containers == {"items": sys.getsizeof([])}
+
+
+def test_memory_report_of_slotted_strictus():
+    item = SlottedItem(id=1000, name="first")
+    report = memory_report(item)
+    assert report.storage == sys.getsizeof(item)
+    assert report.fields == {"id": sys.getsizeof(1000), "name": sys.getsizeof("first")}
+    assert report.additional_attributes == 0
+    assert report.total == deep_size(item)
+
+
+def test_memory_report_counts_raw_mapping_of_views_as_flags():
+    view = Item.view({"id": 1000})
+    assert memory_report(view).flags > 0
+    assert view == Item(id=1000)  # parses all fields and drops the raw mapping
+    assert memory_report(view).flags == 0
+
+
+def test_memory_report_rejects_non_stricti():
+    with pytest.raises(TypeError):
+        memory_report({})
@@ -0,0 +1,87 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+import pytest
+
+from strictus import parallel
+from strictus.core import strictus, strictus_field
+
+
+class Line(strictus):
+    sku: str = strictus_field(required=True)
+    quantity: int = 1
+
+
+class Order(strictus):
+    class Meta:
+        additional_attributes = True
+
+    id: int = strictus_field(required=True)
+    lines: List[Line] = strictus_field(default_factory=list)
+
+    @strictus_field
+    def total_quantity(self) -> int:
+        return sum(line.quantity for line in self.lines)
+
+
+class Doubled(strictus):
+    x: int
+
+    def _post_init_(self):
+        super()._post_init_()
+        self.doubled = self.x * 2
+
+
+def test_parse_many_and_to_dicts_in_worker_processes():
+    raw = [{"id": str(i), "lines": [{"sku": f"SKU-{i}", "quantity": i}], "note": i} for i in range(50)]
+    existing = Order(id=100)
+    raw[10] = None
+    raw[20] = existing
+
+    expected = Order.parse_many(raw)
+    orders = Order.parse_many(raw, workers=2, min_parallel_size=10)
+    assert orders == expected
+    assert orders[10] is None
+    assert orders[20] is existing
+    assert orders[5].lines[0] == Line(sku="SKU-5", quantity=5)
+    assert orders[5].note == 5
+
+    assert Order.parse_many(raw, trusted=True, workers=2, min_parallel_size=10) == \
+        Order.parse_many(raw, trusted=True)
+
+    dicts = strictus.to_dicts(orders, workers=2, min_parallel_size=10)
+    assert dicts == strictus.to_dicts(orders)
+    assert dicts[10] is None
+    assert dicts[5] == {"id": 5, "lines": [{"sku": "SKU-5", "quantity": 5}], "total_quantity": 5, "note": 5}
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert parallel.parse_many(Order, raw, workers=2, min_parallel_size=10, executor=executor) == expected
+        assert parallel.to_dicts(orders, workers=2, min_parallel_size=10, executor=executor) == dicts
+
+
+def test_parse_many_in_worker_processes_raises_like_serial_parsing():
+    raw = [{"id": i} for i in range(20)]
+    raw[3] = {"lines": []}
+    raw[15] = {"id": 15, "lines": [{"quantity": 1}]}
+
+    with pytest.raises(ValueError) as serial_error:
+        Order.parse_many(raw)
+    with pytest.raises(ValueError) as parallel_error:
+        Order.parse_many(raw, workers=2, min_parallel_size=10)
+    assert str(parallel_error.value) == str(serial_error.value)
+
+
+def test_small_batches_are_processed_serially(monkeypatch):
+    def fail(*args):
+        raise AssertionError("Small batches must not be sent to worker processes")
+
+    monkeypatch.setattr(parallel, "_map_chunks", fail)
+    assert Order.parse_many([{"id": 1}], workers=4) == [Order(id=1)]
+    assert strictus.to_dicts([Order(id=1), None], workers=4) == [{"id": 1, "lines": [], "total_quantity": 0}, None]
+
+
+def test_parse_many_in_worker_processes_keeps_attributes_set_in_post_init():
+    raw = [{"x": i} for i in range(10)]
+    instances = Doubled.parse_many(raw, workers=2, min_parallel_size=2)
+    assert instances == Doubled.parse_many(raw)
+    assert [instance.doubled for instance in instances] == [i * 2 for i in range(10)]
@@ -0,0 +1,176 @@
+from typing import Dict, List
+
+import pytest
+
+from strictus import projection
+from strictus.containers import LazyStrictusList
+from strictus.core import strictus, strictus_field
+
+
+class Owner(strictus):
+    name: str
+    email: str = None
+
+
+class Line(strictus):
+    sku: str
+    quantity: int = 1
+    owner: Owner = None
+
+
+class Order(strictus):
+    class Meta:
+        additional_attributes = True
+
+    id: int
+    owner: Owner = None
+    lines: List[Line] = strictus_field(default_factory=list)
+    lines_by_sku: Dict[str, Line] = strictus_field(default_factory=dict)
+    tags: List[str] = None
+
+    @strictus_field
+    def total_quantity(self) -> int:
+        return sum(line.quantity for line in self.lines if line is not None)
+
+
+def make_order(**kwargs) -> Order:
+    owner = {"name": "first", "email": "first@example.com"}
+    return Order(
+        id=1,
+        owner=owner,
+        lines=[{"sku": "a", "quantity": 2, "owner": owner}, None, {"sku": "b"}],
+        lines_by_sku={"a": {"sku": "a", "quantity": 2}},
+        tags=["x"],
+        **kwargs,
+    )
+
+
+def test_to_dict_with_include_paths():
+    order = make_order(note="hello")
+
+    assert order.to_dict(include=["id", "owner.name", "lines.sku", "note"]) == {
+        "id": 1,
+        "owner": {"name": "first"},
+        "lines": [{"sku": "a"}, None, {"sku": "b"}],
+        "note": "hello",
+    }
+    assert order.to_dict(include=["lines_by_sku.quantity", "lines.owner.email", "lines"]) == {
+        "lines_by_sku": {"a": {"quantity": 2}},
+        "lines": order.to_dict()["lines"],
+    }
+    assert order.to_dict(include=["owner", "owner.name"]) == {"owner": order.owner.to_dict()}
+    assert order.to_dict(include=[]) == {}
+
+
+def test_to_dict_with_exclude_paths():
+    order = make_order(note="hello")
+    expected = order.to_dict()
+    del expected["owner"]["email"]
+    del expected["lines_by_sku"]
+    del expected["note"]
+    for line in expected["lines"]:
+        if line is not None:
+            line.pop("owner", None)
+
+    assert order.to_dict(exclude=["owner.email", "lines.owner", "lines_by_sku", "note"]) == expected
+    assert order.to_dict(include=["owner"], exclude=["owner.email"]) == {"owner": {"name": "first"}}
+    assert order.to_dict(exclude=[]) == order.to_dict()
+
+
+def test_to_dict_with_max_depth():
+    order = make_order(note="hello")
+
+    assert order.to_dict(max_depth=0) == {"id": 1, "tags": ["x"], "total_quantity": 3, "note": "hello"}
+    expected = order.to_dict()
+    for line in expected["lines"]:
+        if line is not None:
+            line.pop("owner", None)
+    del expected["lines_by_sku"]["a"]["owner"]
+    assert order.to_dict(max_depth=1) == expected
+    assert order.to_dict(max_depth=2) == order.to_dict()
+    assert order.to_dict(include=["owner.name", "lines.owner.name"], max_depth=1) == {
+        "owner": {"name": "first"},
+        "lines": [{}, None, {}],
+    }
+
+    with pytest.raises(ValueError):
+        order.to_dict(max_depth=-1)
+
+
+def test_paths_must_not_be_a_string():
+    order = make_order()
+    with pytest.raises(TypeError):
+        order.to_dict(include="id")
+    with pytest.raises(TypeError):
+        order.to_dict(exclude=b"id,owner.name")
+    assert order.to_dict(include="id,owner.name".split(",")) == {"id": 1, "owner": {"name": "first"}}
+
+
+def test_excluded_fields_are_not_read():
+    calls = []
+
+    class Report(strictus):
+        class Meta:
+            additional_attributes = True
+
+        id: int
+        lines: List[Line] = strictus_field(default_factory=list, list_container_cls=LazyStrictusList)
+
+        @strictus_field
+        def expensive(self) -> int:
+            calls.append(self.id)
+            return 42
+
+    report = Report.view({"id": 1, "lines": [{"sku": "a"}], "extra": 1})
+    assert report.to_dict(include=["id"]) == {"id": 1}
+    assert report.to_dict(exclude=["expensive", "lines"]) == {"id": 1, "extra": 1}
+    assert calls == []
+    assert "lines" not in report.__dict__
+
+    assert report.to_dict(include=["expensive"]) == {"expensive": 42}
+    assert calls == [1]
+    assert report.to_dict(include=["lines.sku"]) == {"lines": [{"sku": "a"}]}
+
+
+def test_unset_lazy_defaults_are_projected_without_being_created():
+    class Basket(strictus):
+        owner: Owner = strictus_field(default_factory=Owner, lazy_default=True)
+        lines: List[Line] = strictus_field(default_factory=lambda: [Line(sku="a", quantity=2)], lazy_default=True)
+
+    basket = Basket()
+    assert basket.to_dict(include=["owner.email"]) == {"owner": {"email": None}}
+    assert basket.to_dict(include=["owner"]) == {"owner": {"email": None}}
+    assert basket.to_dict(exclude=["owner", "lines"]) == {}
+    assert basket.__getstate__()[0] == (strictus.NOT_SET, strictus.NOT_SET)
+
+    # Defaults of factories which may return different values are created to be serialised
+    assert basket.to_dict(include=["lines.sku"]) == {"lines": [{"sku": "a"}]}
+    assert basket.__getstate__()[0][1] == [Line(sku="a", quantity=2)]
+    assert Basket().to_dict(include=["lines"]) == {"lines": [{"sku": "a", "quantity": 2, "owner": None}]}
+
+
+def test_custom_to_dict_of_nested_stricti_is_used():
+    class Masked(Owner):
+        def to_dict(self, *args, **kwargs):
+            return {"name": "***"}
+
+    class Account(strictus):
+        id: int
+        owner: Masked = None
+
+    account = Account(id=1, owner={"name": "first", "email": "first@example.com"})
+    assert account.to_dict(include=["owner.email"]) == {"owner": {"name": "***"}}
+
+
+def test_projections_and_plans_are_cached():
+    order = make_order()
+    order.to_dict(include=["id", "owner.name"])
+    plans = len(projection._get_node(projection.get_projection(["id", "owner.name"])).plans)
+    order.to_dict(include=("id", "owner.name"))
+    order.to_dict(include=["owner.name", "id"])
+
+    assert projection.get_projection(["id", "owner.name"]) is projection.get_projection(("id", "owner.name"))
+    assert projection.get_projection(["owner.name", "id"]) == projection.get_projection(["id", "owner.name"])
+    assert len(projection._get_node(projection.get_projection(["id", "owner.name"])).plans) == plans
+    assert projection.get_projection() is not projection.WHOLE
+    assert projection.get_projection() == projection.WHOLE